@@ -5,389 +5,458 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://opimwue.github.io',
                 'git_url': 'https://github.com/opimwue/ddopai',
                 'lib_path': 'ddopai'},
-  'syms': { 'ddopai.RL_approximators': { 'ddopai.RL_approximators.BaseApproximator': ( '60_approximators/critic_networks.html#baseapproximator',
+  'syms': { 'ddopai.RL_approximators': { 'ddopai.RL_approximators.BaseApproximator': ( '30_agents/60_approximators/critic_networks.html#baseapproximator',
                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.__init__': ( '60_approximators/critic_networks.html#baseapproximator.__init__',
+                                         'ddopai.RL_approximators.BaseApproximator.__init__': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.__init__',
                                                                                                 'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.forward': ( '60_approximators/critic_networks.html#baseapproximator.forward',
+                                         'ddopai.RL_approximators.BaseApproximator.forward': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.forward',
                                                                                                'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.init_rnn_weights': ( '60_approximators/critic_networks.html#baseapproximator.init_rnn_weights',
+                                         'ddopai.RL_approximators.BaseApproximator.init_rnn_weights': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.init_rnn_weights',
                                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.init_weights': ( '60_approximators/critic_networks.html#baseapproximator.init_weights',
+                                         'ddopai.RL_approximators.BaseApproximator.init_weights': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.init_weights',
                                                                                                     'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.select_activation': ( '60_approximators/critic_networks.html#baseapproximator.select_activation',
+                                         'ddopai.RL_approximators.BaseApproximator.select_activation': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.select_activation',
                                                                                                          'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.select_init_method': ( '60_approximators/critic_networks.html#baseapproximator.select_init_method',
+                                         'ddopai.RL_approximators.BaseApproximator.select_init_method': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.select_init_method',
                                                                                                           'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximator.select_rnn_cell': ( '60_approximators/critic_networks.html#baseapproximator.select_rnn_cell',
+                                         'ddopai.RL_approximators.BaseApproximator.select_rnn_cell': ( '30_agents/60_approximators/critic_networks.html#baseapproximator.select_rnn_cell',
                                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorMLP': ( '60_approximators/critic_networks.html#baseapproximatormlp',
+                                         'ddopai.RL_approximators.BaseApproximatorMLP': ( '30_agents/60_approximators/critic_networks.html#baseapproximatormlp',
                                                                                           'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorMLP.__init__': ( '60_approximators/critic_networks.html#baseapproximatormlp.__init__',
+                                         'ddopai.RL_approximators.BaseApproximatorMLP.__init__': ( '30_agents/60_approximators/critic_networks.html#baseapproximatormlp.__init__',
                                                                                                    'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorMLP.build_MLP': ( '60_approximators/critic_networks.html#baseapproximatormlp.build_mlp',
+                                         'ddopai.RL_approximators.BaseApproximatorMLP.build_MLP': ( '30_agents/60_approximators/critic_networks.html#baseapproximatormlp.build_mlp',
                                                                                                     'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorRNN': ( '60_approximators/critic_networks.html#baseapproximatorrnn',
+                                         'ddopai.RL_approximators.BaseApproximatorRNN': ( '30_agents/60_approximators/critic_networks.html#baseapproximatorrnn',
                                                                                           'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorRNN.__init__': ( '60_approximators/critic_networks.html#baseapproximatorrnn.__init__',
+                                         'ddopai.RL_approximators.BaseApproximatorRNN.__init__': ( '30_agents/60_approximators/critic_networks.html#baseapproximatorrnn.__init__',
                                                                                                    'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.BaseApproximatorRNN.build_RNN': ( '60_approximators/critic_networks.html#baseapproximatorrnn.build_rnn',
+                                         'ddopai.RL_approximators.BaseApproximatorRNN.build_RNN': ( '30_agents/60_approximators/critic_networks.html#baseapproximatorrnn.build_rnn',
                                                                                                     'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPActor': ( '60_approximators/critic_networks.html#mlpactor',
+                                         'ddopai.RL_approximators.MLPActor': ( '30_agents/60_approximators/critic_networks.html#mlpactor',
                                                                                'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPActor.__init__': ( '60_approximators/critic_networks.html#mlpactor.__init__',
+                                         'ddopai.RL_approximators.MLPActor.__init__': ( '30_agents/60_approximators/critic_networks.html#mlpactor.__init__',
                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPActor.forward': ( '60_approximators/critic_networks.html#mlpactor.forward',
+                                         'ddopai.RL_approximators.MLPActor.forward': ( '30_agents/60_approximators/critic_networks.html#mlpactor.forward',
                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPState': ( '60_approximators/critic_networks.html#mlpstate',
+                                         'ddopai.RL_approximators.MLPState': ( '30_agents/60_approximators/critic_networks.html#mlpstate',
                                                                                'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPState.__init__': ( '60_approximators/critic_networks.html#mlpstate.__init__',
+                                         'ddopai.RL_approximators.MLPState.__init__': ( '30_agents/60_approximators/critic_networks.html#mlpstate.__init__',
                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPState.forward': ( '60_approximators/critic_networks.html#mlpstate.forward',
+                                         'ddopai.RL_approximators.MLPState.forward': ( '30_agents/60_approximators/critic_networks.html#mlpstate.forward',
                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPStateAction': ( '60_approximators/critic_networks.html#mlpstateaction',
+                                         'ddopai.RL_approximators.MLPStateAction': ( '30_agents/60_approximators/critic_networks.html#mlpstateaction',
                                                                                      'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPStateAction.__init__': ( '60_approximators/critic_networks.html#mlpstateaction.__init__',
+                                         'ddopai.RL_approximators.MLPStateAction.__init__': ( '30_agents/60_approximators/critic_networks.html#mlpstateaction.__init__',
                                                                                               'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.MLPStateAction.forward': ( '60_approximators/critic_networks.html#mlpstateaction.forward',
+                                         'ddopai.RL_approximators.MLPStateAction.forward': ( '30_agents/60_approximators/critic_networks.html#mlpstateaction.forward',
                                                                                              'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor': ( '60_approximators/critic_networks.html#rnnactor',
+                                         'ddopai.RL_approximators.RNNActor': ( '30_agents/60_approximators/critic_networks.html#rnnactor',
                                                                                'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.__init__': ( '60_approximators/critic_networks.html#rnnactor.__init__',
+                                         'ddopai.RL_approximators.RNNActor.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnactor.__init__',
                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.forward': ( '60_approximators/critic_networks.html#rnnactor.forward',
+                                         'ddopai.RL_approximators.RNNActor.forward': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward',
                                                                                        'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.forward_with_batch': ( '60_approximators/critic_networks.html#rnnactor.forward_with_batch',
+                                         'ddopai.RL_approximators.RNNActor.forward_with_batch': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward_with_batch',
                                                                                                   'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNActor.forward_without_batch': ( '60_approximators/critic_networks.html#rnnactor.forward_without_batch',
+                                         'ddopai.RL_approximators.RNNActor.forward_without_batch': ( '30_agents/60_approximators/critic_networks.html#rnnactor.forward_without_batch',
                                                                                                      'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNMLPHybrid': ( '60_approximators/critic_networks.html#rnnmlphybrid',
+                                         'ddopai.RL_approximators.RNNMLPHybrid': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid',
                                                                                    'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNMLPHybrid.__init__': ( '60_approximators/critic_networks.html#rnnmlphybrid.__init__',
+                                         'ddopai.RL_approximators.RNNMLPHybrid.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.__init__',
                                                                                             'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNMLPHybrid.forward': ( '60_approximators/critic_networks.html#rnnmlphybrid.forward',
+                                         'ddopai.RL_approximators.RNNMLPHybrid.forward': ( '30_agents/60_approximators/critic_networks.html#rnnmlphybrid.forward',
                                                                                            'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction': ( '60_approximators/critic_networks.html#rnnstateaction',
+                                         'ddopai.RL_approximators.RNNStateAction': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction',
                                                                                      'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.__init__': ( '60_approximators/critic_networks.html#rnnstateaction.__init__',
+                                         'ddopai.RL_approximators.RNNStateAction.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.__init__',
                                                                                               'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.forward': ( '60_approximators/critic_networks.html#rnnstateaction.forward',
+                                         'ddopai.RL_approximators.RNNStateAction.forward': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward',
                                                                                              'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.forward_with_batch': ( '60_approximators/critic_networks.html#rnnstateaction.forward_with_batch',
+                                         'ddopai.RL_approximators.RNNStateAction.forward_with_batch': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward_with_batch',
                                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNStateAction.forward_without_batch': ( '60_approximators/critic_networks.html#rnnstateaction.forward_without_batch',
+                                         'ddopai.RL_approximators.RNNStateAction.forward_without_batch': ( '30_agents/60_approximators/critic_networks.html#rnnstateaction.forward_without_batch',
                                                                                                            'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNWrapper': ( '60_approximators/critic_networks.html#rnnwrapper',
+                                         'ddopai.RL_approximators.RNNWrapper': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper',
                                                                                  'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNWrapper.__init__': ( '60_approximators/critic_networks.html#rnnwrapper.__init__',
+                                         'ddopai.RL_approximators.RNNWrapper.__init__': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.__init__',
                                                                                           'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNWrapper.create': ( '60_approximators/critic_networks.html#rnnwrapper.create',
+                                         'ddopai.RL_approximators.RNNWrapper.create': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.create',
                                                                                         'ddopai/RL_approximators.py'),
-                                         'ddopai.RL_approximators.RNNWrapper.forward': ( '60_approximators/critic_networks.html#rnnwrapper.forward',
+                                         'ddopai.RL_approximators.RNNWrapper.forward': ( '30_agents/60_approximators/critic_networks.html#rnnwrapper.forward',
                                                                                          'ddopai/RL_approximators.py')},
-            'ddopai.agents.base': { 'ddopai.agents.base.BaseAgent': ('40_base_agents/base_agents.html#baseagent', 'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.__init__': ( '40_base_agents/base_agents.html#baseagent.__init__',
+            'ddopai.agents.base': { 'ddopai.agents.base.BaseAgent': ( '30_agents/40_base_agents/base_agents.html#baseagent',
+                                                                      'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.__init__': ( '30_agents/40_base_agents/base_agents.html#baseagent.__init__',
                                                                                'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.add_batch_dim': ( '40_base_agents/base_agents.html#baseagent.add_batch_dim',
+                                    'ddopai.agents.base.BaseAgent.add_batch_dim': ( '30_agents/40_base_agents/base_agents.html#baseagent.add_batch_dim',
                                                                                     'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.add_obsprocessor': ( '40_base_agents/base_agents.html#baseagent.add_obsprocessor',
+                                    'ddopai.agents.base.BaseAgent.add_obsprocessor': ( '30_agents/40_base_agents/base_agents.html#baseagent.add_obsprocessor',
                                                                                        'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.convert_recursively_to_int': ( '40_base_agents/base_agents.html#baseagent.convert_recursively_to_int',
+                                    'ddopai.agents.base.BaseAgent.convert_recursively_to_int': ( '30_agents/40_base_agents/base_agents.html#baseagent.convert_recursively_to_int',
                                                                                                  'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.convert_to_numpy_array': ( '40_base_agents/base_agents.html#baseagent.convert_to_numpy_array',
+                                    'ddopai.agents.base.BaseAgent.convert_to_numpy_array': ( '30_agents/40_base_agents/base_agents.html#baseagent.convert_to_numpy_array',
                                                                                              'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.draw_action': ( '40_base_agents/base_agents.html#baseagent.draw_action',
+                                    'ddopai.agents.base.BaseAgent.draw_action': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_action',
                                                                                   'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.draw_action_': ( '40_base_agents/base_agents.html#baseagent.draw_action_',
+                                    'ddopai.agents.base.BaseAgent.draw_action_': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_action_',
                                                                                    'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.eval': ( '40_base_agents/base_agents.html#baseagent.eval',
+                                    'ddopai.agents.base.BaseAgent.draw_actions': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_actions',
+                                                                                   'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.draw_actions_': ( '30_agents/40_base_agents/base_agents.html#baseagent.draw_actions_',
+                                                                                    'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.eval': ( '30_agents/40_base_agents/base_agents.html#baseagent.eval',
                                                                            'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.load': ( '40_base_agents/base_agents.html#baseagent.load',
+                                    'ddopai.agents.base.BaseAgent.get_batch_shape': ( '30_agents/40_base_agents/base_agents.html#baseagent.get_batch_shape',
+                                                                                      'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.get_batch_size': ( '30_agents/40_base_agents/base_agents.html#baseagent.get_batch_size',
+                                                                                     'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.load': ( '30_agents/40_base_agents/base_agents.html#baseagent.load',
                                                                            'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.save': ( '40_base_agents/base_agents.html#baseagent.save',
+                                    'ddopai.agents.base.BaseAgent.map_observation': ( '30_agents/40_base_agents/base_agents.html#baseagent.map_observation',
+                                                                                      'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.process_observation': ( '30_agents/40_base_agents/base_agents.html#baseagent.process_observation',
+                                                                                          'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.process_observations': ( '30_agents/40_base_agents/base_agents.html#baseagent.process_observations',
+                                                                                           'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.processes_batches': ( '30_agents/40_base_agents/base_agents.html#baseagent.processes_batches',
+                                                                                        'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.save': ( '30_agents/40_base_agents/base_agents.html#baseagent.save',
                                                                            'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.train': ( '40_base_agents/base_agents.html#baseagent.train',
+                                    'ddopai.agents.base.BaseAgent.stack_observations': ( '30_agents/40_base_agents/base_agents.html#baseagent.stack_observations',
+                                                                                         'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.train': ( '30_agents/40_base_agents/base_agents.html#baseagent.train',
                                                                             'ddopai/agents/base.py'),
-                                    'ddopai.agents.base.BaseAgent.update_model_params': ( '40_base_agents/base_agents.html#baseagent.update_model_params',
+                                    'ddopai.agents.base.BaseAgent.unstack_observations': ( '30_agents/40_base_agents/base_agents.html#baseagent.unstack_observations',
+                                                                                           'ddopai/agents/base.py'),
+                                    'ddopai.agents.base.BaseAgent.update_model_params': ( '30_agents/40_base_agents/base_agents.html#baseagent.update_model_params',
                                                                                           'ddopai/agents/base.py')},
-            'ddopai.agents.basic': { 'ddopai.agents.basic.RandomAgent': ( '40_base_agents/basic_agents.html#randomagent',
+            'ddopai.agents.basic': { 'ddopai.agents.basic.RandomAgent': ( '30_agents/40_base_agents/basic_agents.html#randomagent',
                                                                           'ddopai/agents/basic.py'),
-                                     'ddopai.agents.basic.RandomAgent.__init__': ( '40_base_agents/basic_agents.html#randomagent.__init__',
+                                     'ddopai.agents.basic.RandomAgent.__init__': ( '30_agents/40_base_agents/basic_agents.html#randomagent.__init__',
                                                                                    'ddopai/agents/basic.py'),
-                                     'ddopai.agents.basic.RandomAgent.draw_action_': ( '40_base_agents/basic_agents.html#randomagent.draw_action_',
+                                     'ddopai.agents.basic.RandomAgent.draw_action_': ( '30_agents/40_base_agents/basic_agents.html#randomagent.draw_action_',
                                                                                        'ddopai/agents/basic.py'),
-                                     'ddopai.agents.basic.RandomAgent.fit': ( '40_base_agents/basic_agents.html#randomagent.fit',
+                                     'ddopai.agents.basic.RandomAgent.fit': ( '30_agents/40_base_agents/basic_agents.html#randomagent.fit',
                                                                               'ddopai/agents/basic.py'),
-                                     'ddopai.agents.basic.RandomAgent.load': ( '40_base_agents/basic_agents.html#randomagent.load',
+                                     'ddopai.agents.basic.RandomAgent.load': ( '30_agents/40_base_agents/basic_agents.html#randomagent.load',
                                                                                'ddopai/agents/basic.py'),
-                                     'ddopai.agents.basic.RandomAgent.save': ( '40_base_agents/basic_agents.html#randomagent.save',
+                                     'ddopai.agents.basic.RandomAgent.save': ( '30_agents/40_base_agents/basic_agents.html#randomagent.save',
                                                                                'ddopai/agents/basic.py')},
             'ddopai.agents.class_names': {},
-            'ddopai.agents.newsvendor.erm': { 'ddopai.agents.newsvendor.erm.BaseMetaAgent': ( '41_NV_agents/nv_erm_agents.html#basemetaagent',
+            'ddopai.agents.inventory.policies': { 'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent',
+                                                                                                                 'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.__init__': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.__init__',
+                                                                                                                          'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.bootstrap_demand': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.bootstrap_demand',
+                                                                                                                                  'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.draw_action_': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.draw_action_',
+                                                                                                                              'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.fit': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.fit',
+                                                                                                                     'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.from_env': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.from_env',
+                                                                                                                          'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.golden_section_search': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.golden_section_search',
+                                                                                                                                       'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.grid_search': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.grid_search',
+                                                                                                                             'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.load': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.load',
+                                                                                                                      'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.order_quantity': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.order_quantity',
+                                                                                                                                'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.save': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.save',
+                                                                                                                      'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.search_levels': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.search_levels',
+                                                                                                                               'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.simulate_costs': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.simulate_costs',
+                                                                                                                                'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.to_SKU_array': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.to_sku_array',
+                                                                                                                              'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseInventoryPolicyAgent.upper_level_bound': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#baseinventorypolicyagent.upper_level_bound',
+                                                                                                                                   'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseStockAgent': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#basestockagent',
+                                                                                                       'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseStockAgent.__init__': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#basestockagent.__init__',
+                                                                                                                'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.BaseStockAgent.search_levels': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#basestockagent.search_levels',
+                                                                                                                     'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.sSPolicyAgent': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#sspolicyagent',
+                                                                                                      'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.sSPolicyAgent.__init__': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#sspolicyagent.__init__',
+                                                                                                               'ddopai/agents/inventory/policies.py'),
+                                                  'ddopai.agents.inventory.policies.sSPolicyAgent.search_levels': ( '30_agents/42_inventory_agents/inventory_policy_agents.html#sspolicyagent.search_levels',
+                                                                                                                    'ddopai/agents/inventory/policies.py')},
+            'ddopai.agents.newsvendor.erm': { 'ddopai.agents.newsvendor.erm.BaseMetaAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#basemetaagent',
                                                                                               'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.BaseMetaAgent.set_meta_dataloader': ( '41_NV_agents/nv_erm_agents.html#basemetaagent.set_meta_dataloader',
+                                              'ddopai.agents.newsvendor.erm.BaseMetaAgent.set_meta_dataloader': ( '30_agents/41_NV_agents/nv_erm_agents.html#basemetaagent.set_meta_dataloader',
                                                                                                                   'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NVBaseAgent': ( '41_NV_agents/nv_erm_agents.html#nvbaseagent',
+                                              'ddopai.agents.newsvendor.erm.NVBaseAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#nvbaseagent',
                                                                                             'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NVBaseAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#nvbaseagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NVBaseAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#nvbaseagent.__init__',
                                                                                                      'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NVBaseAgent.set_loss_function': ( '41_NV_agents/nv_erm_agents.html#nvbaseagent.set_loss_function',
+                                              'ddopai.agents.newsvendor.erm.NVBaseAgent.set_loss_function': ( '30_agents/41_NV_agents/nv_erm_agents.html#nvbaseagent.set_loss_function',
                                                                                                               'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendordlagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordlagent',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendordlagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordlagent.__init__',
                                                                                                            'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent.set_model': ( '41_NV_agents/nv_erm_agents.html#newsvendordlagent.set_model',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLAgent.set_model': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordlagent.set_model',
                                                                                                             'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLMetaAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendordlmetaagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLMetaAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordlmetaagent',
                                                                                                       'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLMetaAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendordlmetaagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLMetaAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordlmetaagent.__init__',
                                                                                                                'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent',
                                                                                                              'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent.__init__',
                                                                                                                       'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent.set_model': ( '41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent.set_model',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerAgent.set_model': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordltransformeragent.set_model',
                                                                                                                        'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerMetaAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendordltransformermetaagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerMetaAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordltransformermetaagent',
                                                                                                                  'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerMetaAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendordltransformermetaagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorDLTransformerMetaAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendordltransformermetaagent.__init__',
                                                                                                                           'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent',
                                                                                                    'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.__init__',
                                                                                                             'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.draw_action_': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.draw_action_',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.draw_action_': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.draw_action_',
                                                                                                                 'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.fit': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.fit',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.fit': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.fit',
                                                                                                        'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.load': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.load',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.load': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.load',
                                                                                                         'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.save': ( '41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.save',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorXGBAgent.save': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorxgbagent.save',
                                                                                                         'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendorlermagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorlermagent',
                                                                                                     'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendorlermagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorlermagent.__init__',
                                                                                                              'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent.set_model': ( '41_NV_agents/nv_erm_agents.html#newsvendorlermagent.set_model',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMAgent.set_model': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorlermagent.set_model',
                                                                                                               'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMMetaAgent': ( '41_NV_agents/nv_erm_agents.html#newsvendorlermmetaagent',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMMetaAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorlermmetaagent',
                                                                                                         'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMMetaAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#newsvendorlermmetaagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.NewsvendorlERMMetaAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#newsvendorlermmetaagent.__init__',
                                                                                                                  'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent',
                                                                                              'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.__init__': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.__init__',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.__init__': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.__init__',
                                                                                                       'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.draw_action_': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.draw_action_',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.draw_action_': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.draw_action_',
                                                                                                           'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.eval': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.eval',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.eval': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.eval',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.fit_epoch': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.fit_epoch',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.fit_epoch': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.fit_epoch',
                                                                                                        'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.load': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.load',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.load': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.load',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.predict': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.predict',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.predict': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.predict',
                                                                                                      'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.save': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.save',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.save': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.save',
                                                                                                   'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_dataloader': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_dataloader',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_dataloader': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_dataloader',
                                                                                                             'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_device': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_device',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_device': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_device',
                                                                                                         'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_learning_rate_scheduler': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_learning_rate_scheduler',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_learning_rate_scheduler': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_learning_rate_scheduler',
                                                                                                                          'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_loss_function': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_loss_function',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_loss_function': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_loss_function',
                                                                                                                'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_model': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_model',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_model': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_model',
                                                                                                        'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_optimizer': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_optimizer',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.set_optimizer': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.set_optimizer',
                                                                                                            'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.split_into_batches': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.split_into_batches',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.split_into_batches': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.split_into_batches',
                                                                                                                 'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.to': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.to',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.to': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.to',
                                                                                                 'ddopai/agents/newsvendor/erm.py'),
-                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.train': ( '41_NV_agents/nv_erm_agents.html#sgdbaseagent.train',
+                                              'ddopai.agents.newsvendor.erm.SGDBaseAgent.train': ( '30_agents/41_NV_agents/nv_erm_agents.html#sgdbaseagent.train',
                                                                                                    'ddopai/agents/newsvendor/erm.py')},
-            'ddopai.agents.newsvendor.saa': { 'ddopai.agents.newsvendor.saa.BaseSAAagent': ( '41_NV_agents/nv_saa_agents.html#basesaaagent',
+            'ddopai.agents.newsvendor.saa': { 'ddopai.agents.newsvendor.saa.BaseSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent',
                                                                                              'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BaseSAAagent.__init__': ( '41_NV_agents/nv_saa_agents.html#basesaaagent.__init__',
+                                              'ddopai.agents.newsvendor.saa.BaseSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent.__init__',
                                                                                                       'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BaseSAAagent._validate_X_predict': ( '41_NV_agents/nv_saa_agents.html#basesaaagent._validate_x_predict',
+                                              'ddopai.agents.newsvendor.saa.BaseSAAagent._validate_X_predict': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent._validate_x_predict',
                                                                                                                  'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BaseSAAagent.find_weighted_quantiles': ( '41_NV_agents/nv_saa_agents.html#basesaaagent.find_weighted_quantiles',
+                                              'ddopai.agents.newsvendor.saa.BaseSAAagent.find_weighted_quantiles': ( '30_agents/41_NV_agents/nv_saa_agents.html#basesaaagent.find_weighted_quantiles',
                                                                                                                      'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent',
                                                                                               'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.__init__': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.__init__',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.__init__',
                                                                                                        'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent._calc_weights': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent._calc_weights',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent._calc_weights': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent._calc_weights',
                                                                                                             'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent._get_fitted_model': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent._get_fitted_model',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent._get_fitted_model': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent._get_fitted_model',
                                                                                                                 'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.draw_action_': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.draw_action_',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.draw_action_': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.draw_action_',
                                                                                                            'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.fit': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.fit',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.fit': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.fit',
                                                                                                   'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.load': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.load',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.load': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.load',
                                                                                                    'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.predict': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.predict',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.predict': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.predict',
                                                                                                       'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.save': ( '41_NV_agents/nv_saa_agents.html#basewsaaagent.save',
+                                              'ddopai.agents.newsvendor.saa.BasewSAAagent.save': ( '30_agents/41_NV_agents/nv_saa_agents.html#basewsaaagent.save',
                                                                                                    'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent': ( '41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent',
                                                                                                       'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent.__init__': ( '41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent.__init__',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent.__init__',
                                                                                                                'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent._calc_weights': ( '41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent._calc_weights',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent._calc_weights': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent._calc_weights',
                                                                                                                     'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent._get_fitted_model': ( '41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent._get_fitted_model',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorRFwSAAagent._get_fitted_model': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorrfwsaaagent._get_fitted_model',
                                                                                                                         'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent',
                                                                                                    'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.__init__': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.__init__',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.__init__': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.__init__',
                                                                                                             'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.draw_action_': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.draw_action_',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.draw_action_': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.draw_action_',
                                                                                                                 'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.fit': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.fit',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.draw_actions_': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.draw_actions_',
+                                                                                                                 'ddopai/agents/newsvendor/saa.py'),
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.fit': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.fit',
                                                                                                        'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.load': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.load',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.load': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.load',
                                                                                                         'ddopai/agents/newsvendor/saa.py'),
-                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.save': ( '41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.save',
+                                              'ddopai.agents.newsvendor.saa.NewsvendorSAAagent.save': ( '30_agents/41_NV_agents/nv_saa_agents.html#newsvendorsaaagent.save',
                                                                                                         'ddopai/agents/newsvendor/saa.py')},
-            'ddopai.agents.rl.mushroom_rl': { 'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent',
+            'ddopai.agents.rl.mushroom_rl': { 'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent',
                                                                                                   'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.__init__': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.__init__',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.__init__': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.__init__',
                                                                                                            'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.add_batch_dimension_for_shape': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.add_batch_dimension_for_shape',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.add_batch_dimension_for_shape': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.add_batch_dimension_for_shape',
                                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.add_obsprocessor': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.add_obsprocessor',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.add_obsprocessor': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.add_obsprocessor',
                                                                                                                    'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.draw_action_': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.draw_action_',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.draw_action_': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.draw_action_',
                                                                                                                'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.episode_start': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.episode_start',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.episode_start': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.episode_start',
                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.eval': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.eval',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.eval': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.eval',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.fit': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.fit',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.fit': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.fit',
                                                                                                       'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_input_shape': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_input_shape',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_input_shape': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_input_shape',
                                                                                                                   'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_loss_function': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_loss_function',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_loss_function': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_loss_function',
                                                                                                                     'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_optimizer_class': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_optimizer_class',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.get_optimizer_class': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.get_optimizer_class',
                                                                                                                       'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.load': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.load',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.load': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.load',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict',
                                                                                                           'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict_': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict_',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.predict_': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.predict_',
                                                                                                            'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.preprocessors': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.preprocessors',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.preprocessors': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.preprocessors',
                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.save': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.save',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.save': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.save',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_device': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_device',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_device': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_device',
                                                                                                              'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_model': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_model',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_model': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_model',
                                                                                                             'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_optimizer': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_optimizer',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.set_optimizer': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.set_optimizer',
                                                                                                                 'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.stop': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.stop',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.stop': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.stop',
                                                                                                        'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.to': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.to',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.to': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.to',
                                                                                                      'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.train': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.train',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.train': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.train',
                                                                                                         'ddopai/agents/rl/mushroom_rl.py'),
-                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.transfer_obs_processors_to_mushroom_agent': ( '51_RL_agents/mushroom_base_agent.html#mushroombaseagent.transfer_obs_processors_to_mushroom_agent',
+                                              'ddopai.agents.rl.mushroom_rl.MushroomBaseAgent.transfer_obs_processors_to_mushroom_agent': ( '30_agents/51_RL_agents/mushroom_base_agent.html#mushroombaseagent.transfer_obs_processors_to_mushroom_agent',
                                                                                                                                             'ddopai/agents/rl/mushroom_rl.py')},
-            'ddopai.agents.rl.ppo': { 'ddopai.agents.rl.ppo.PPOAgent': ('51_RL_agents/ppo_agents.html#ppoagent', 'ddopai/agents/rl/ppo.py'),
-                                      'ddopai.agents.rl.ppo.PPOAgent.__init__': ( '51_RL_agents/ppo_agents.html#ppoagent.__init__',
+            'ddopai.agents.rl.ppo': { 'ddopai.agents.rl.ppo.PPOAgent': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent',
+                                                                         'ddopai/agents/rl/ppo.py'),
+                                      'ddopai.agents.rl.ppo.PPOAgent.__init__': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent.__init__',
                                                                                   'ddopai/agents/rl/ppo.py'),
-                                      'ddopai.agents.rl.ppo.PPOAgent.get_network_list': ( '51_RL_agents/ppo_agents.html#ppoagent.get_network_list',
+                                      'ddopai.agents.rl.ppo.PPOAgent.get_network_list': ( '30_agents/51_RL_agents/ppo_agents.html#ppoagent.get_network_list',
                                                                                           'ddopai/agents/rl/ppo.py')},
-            'ddopai.agents.rl.sac': { 'ddopai.agents.rl.sac.SACAgent': ('51_RL_agents/sac_agents.html#sacagent', 'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACAgent.__init__': ( '51_RL_agents/sac_agents.html#sacagent.__init__',
+            'ddopai.agents.rl.sac': { 'ddopai.agents.rl.sac.SACAgent': ( '30_agents/51_RL_agents/sac_agents.html#sacagent',
+                                                                         'ddopai/agents/rl/sac.py'),
+                                      'ddopai.agents.rl.sac.SACAgent.__init__': ( '30_agents/51_RL_agents/sac_agents.html#sacagent.__init__',
                                                                                   'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACBaseAgent': ( '51_RL_agents/sac_agents.html#sacbaseagent',
+                                      'ddopai.agents.rl.sac.SACBaseAgent': ( '30_agents/51_RL_agents/sac_agents.html#sacbaseagent',
                                                                              'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACBaseAgent.__init__': ( '51_RL_agents/sac_agents.html#sacbaseagent.__init__',
+                                      'ddopai.agents.rl.sac.SACBaseAgent.__init__': ( '30_agents/51_RL_agents/sac_agents.html#sacbaseagent.__init__',
                                                                                       'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACBaseAgent.get_network_list': ( '51_RL_agents/sac_agents.html#sacbaseagent.get_network_list',
+                                      'ddopai.agents.rl.sac.SACBaseAgent.get_network_list': ( '30_agents/51_RL_agents/sac_agents.html#sacbaseagent.get_network_list',
                                                                                               'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACBaseAgent.predict_': ( '51_RL_agents/sac_agents.html#sacbaseagent.predict_',
+                                      'ddopai.agents.rl.sac.SACBaseAgent.predict_': ( '30_agents/51_RL_agents/sac_agents.html#sacbaseagent.predict_',
                                                                                       'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACRNNAgent': ( '51_RL_agents/sac_agents.html#sacrnnagent',
+                                      'ddopai.agents.rl.sac.SACRNNAgent': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent',
                                                                             'ddopai/agents/rl/sac.py'),
-                                      'ddopai.agents.rl.sac.SACRNNAgent.__init__': ( '51_RL_agents/sac_agents.html#sacrnnagent.__init__',
+                                      'ddopai.agents.rl.sac.SACRNNAgent.__init__': ( '30_agents/51_RL_agents/sac_agents.html#sacrnnagent.__init__',
                                                                                      'ddopai/agents/rl/sac.py')},
-            'ddopai.agents.rl.td3': { 'ddopai.agents.rl.td3.TD3Agent': ('51_RL_agents/td3_agents.html#td3agent', 'ddopai/agents/rl/td3.py'),
-                                      'ddopai.agents.rl.td3.TD3Agent.__init__': ( '51_RL_agents/td3_agents.html#td3agent.__init__',
+            'ddopai.agents.rl.td3': { 'ddopai.agents.rl.td3.TD3Agent': ( '30_agents/51_RL_agents/td3_agents.html#td3agent',
+                                                                         'ddopai/agents/rl/td3.py'),
+                                      'ddopai.agents.rl.td3.TD3Agent.__init__': ( '30_agents/51_RL_agents/td3_agents.html#td3agent.__init__',
                                                                                   'ddopai/agents/rl/td3.py'),
-                                      'ddopai.agents.rl.td3.TD3Agent.get_network_list': ( '51_RL_agents/td3_agents.html#td3agent.get_network_list',
+                                      'ddopai.agents.rl.td3.TD3Agent.get_network_list': ( '30_agents/51_RL_agents/td3_agents.html#td3agent.get_network_list',
                                                                                           'ddopai/agents/rl/td3.py')},
-            'ddopai.approximators': { 'ddopai.approximators.BaseModule': ( '60_approximators/approximators.html#basemodule',
+            'ddopai.approximators': { 'ddopai.approximators.BaseModule': ( '30_agents/60_approximators/approximators.html#basemodule',
                                                                            'ddopai/approximators.py'),
-                                      'ddopai.approximators.BaseModule.__init__': ( '60_approximators/approximators.html#basemodule.__init__',
+                                      'ddopai.approximators.BaseModule.__init__': ( '30_agents/60_approximators/approximators.html#basemodule.__init__',
                                                                                     'ddopai/approximators.py'),
-                                      'ddopai.approximators.BaseModule.select_activation': ( '60_approximators/approximators.html#basemodule.select_activation',
+                                      'ddopai.approximators.BaseModule.select_activation': ( '30_agents/60_approximators/approximators.html#basemodule.select_activation',
                                                                                              'ddopai/approximators.py'),
-                                      'ddopai.approximators.Block': ( '60_approximators/approximators.html#block',
+                                      'ddopai.approximators.Block': ( '30_agents/60_approximators/approximators.html#block',
                                                                       'ddopai/approximators.py'),
-                                      'ddopai.approximators.Block.__init__': ( '60_approximators/approximators.html#block.__init__',
+                                      'ddopai.approximators.Block.__init__': ( '30_agents/60_approximators/approximators.html#block.__init__',
                                                                                'ddopai/approximators.py'),
-                                      'ddopai.approximators.Block.forward': ( '60_approximators/approximators.html#block.forward',
+                                      'ddopai.approximators.Block.forward': ( '30_agents/60_approximators/approximators.html#block.forward',
                                                                               'ddopai/approximators.py'),
-                                      'ddopai.approximators.CausalSelfAttention': ( '60_approximators/approximators.html#causalselfattention',
+                                      'ddopai.approximators.CausalSelfAttention': ( '30_agents/60_approximators/approximators.html#causalselfattention',
                                                                                     'ddopai/approximators.py'),
-                                      'ddopai.approximators.CausalSelfAttention.__init__': ( '60_approximators/approximators.html#causalselfattention.__init__',
+                                      'ddopai.approximators.CausalSelfAttention.__init__': ( '30_agents/60_approximators/approximators.html#causalselfattention.__init__',
                                                                                              'ddopai/approximators.py'),
-                                      'ddopai.approximators.CausalSelfAttention._init_rope': ( '60_approximators/approximators.html#causalselfattention._init_rope',
+                                      'ddopai.approximators.CausalSelfAttention._init_rope': ( '30_agents/60_approximators/approximators.html#causalselfattention._init_rope',
                                                                                                'ddopai/approximators.py'),
-                                      'ddopai.approximators.CausalSelfAttention.forward': ( '60_approximators/approximators.html#causalselfattention.forward',
+                                      'ddopai.approximators.CausalSelfAttention.forward': ( '30_agents/60_approximators/approximators.html#causalselfattention.forward',
                                                                                             'ddopai/approximators.py'),
-                                      'ddopai.approximators.LinearModel': ( '60_approximators/approximators.html#linearmodel',
+                                      'ddopai.approximators.LinearModel': ( '30_agents/60_approximators/approximators.html#linearmodel',
                                                                             'ddopai/approximators.py'),
-                                      'ddopai.approximators.LinearModel.__init__': ( '60_approximators/approximators.html#linearmodel.__init__',
+                                      'ddopai.approximators.LinearModel.__init__': ( '30_agents/60_approximators/approximators.html#linearmodel.__init__',
                                                                                      'ddopai/approximators.py'),
-                                      'ddopai.approximators.LinearModel.forward': ( '60_approximators/approximators.html#linearmodel.forward',
+                                      'ddopai.approximators.LinearModel.forward': ( '30_agents/60_approximators/approximators.html#linearmodel.forward',
                                                                                     'ddopai/approximators.py'),
-                                      'ddopai.approximators.LlamaRotaryEmbedding': ( '60_approximators/approximators.html#llamarotaryembedding',
+                                      'ddopai.approximators.LlamaRotaryEmbedding': ( '30_agents/60_approximators/approximators.html#llamarotaryembedding',
                                                                                      'ddopai/approximators.py'),
-                                      'ddopai.approximators.LlamaRotaryEmbedding.__init__': ( '60_approximators/approximators.html#llamarotaryembedding.__init__',
+                                      'ddopai.approximators.LlamaRotaryEmbedding.__init__': ( '30_agents/60_approximators/approximators.html#llamarotaryembedding.__init__',
                                                                                               'ddopai/approximators.py'),
-                                      'ddopai.approximators.LlamaRotaryEmbedding._set_cos_sin_cache': ( '60_approximators/approximators.html#llamarotaryembedding._set_cos_sin_cache',
+                                      'ddopai.approximators.LlamaRotaryEmbedding._set_cos_sin_cache': ( '30_agents/60_approximators/approximators.html#llamarotaryembedding._set_cos_sin_cache',
                                                                                                         'ddopai/approximators.py'),
-                                      'ddopai.approximators.LlamaRotaryEmbedding.forward': ( '60_approximators/approximators.html#llamarotaryembedding.forward',
+                                      'ddopai.approximators.LlamaRotaryEmbedding.forward': ( '30_agents/60_approximators/approximators.html#llamarotaryembedding.forward',
                                                                                              'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP': ('60_approximators/approximators.html#mlp', 'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP.__init__': ( '60_approximators/approximators.html#mlp.__init__',
+                                      'ddopai.approximators.MLP': ( '30_agents/60_approximators/approximators.html#mlp',
+                                                                    'ddopai/approximators.py'),
+                                      'ddopai.approximators.MLP.__init__': ( '30_agents/60_approximators/approximators.html#mlp.__init__',
                                                                              'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP.forward': ( '60_approximators/approximators.html#mlp.forward',
+                                      'ddopai.approximators.MLP.forward': ( '30_agents/60_approximators/approximators.html#mlp.forward',
                                                                             'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP_block': ( '60_approximators/approximators.html#mlp_block',
+                                      'ddopai.approximators.MLP_block': ( '30_agents/60_approximators/approximators.html#mlp_block',
                                                                           'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP_block.__init__': ( '60_approximators/approximators.html#mlp_block.__init__',
+                                      'ddopai.approximators.MLP_block.__init__': ( '30_agents/60_approximators/approximators.html#mlp_block.__init__',
                                                                                    'ddopai/approximators.py'),
-                                      'ddopai.approximators.MLP_block.forward': ( '60_approximators/approximators.html#mlp_block.forward',
+                                      'ddopai.approximators.MLP_block.forward': ( '30_agents/60_approximators/approximators.html#mlp_block.forward',
                                                                                   'ddopai/approximators.py'),
-                                      'ddopai.approximators.RMSNorm': ( '60_approximators/approximators.html#rmsnorm',
+                                      'ddopai.approximators.RMSNorm': ( '30_agents/60_approximators/approximators.html#rmsnorm',
                                                                         'ddopai/approximators.py'),
-                                      'ddopai.approximators.RMSNorm.__init__': ( '60_approximators/approximators.html#rmsnorm.__init__',
+                                      'ddopai.approximators.RMSNorm.__init__': ( '30_agents/60_approximators/approximators.html#rmsnorm.__init__',
                                                                                  'ddopai/approximators.py'),
-                                      'ddopai.approximators.RMSNorm.forward': ( '60_approximators/approximators.html#rmsnorm.forward',
+                                      'ddopai.approximators.RMSNorm.forward': ( '30_agents/60_approximators/approximators.html#rmsnorm.forward',
                                                                                 'ddopai/approximators.py'),
-                                      'ddopai.approximators.Transformer': ( '60_approximators/approximators.html#transformer',
+                                      'ddopai.approximators.Transformer': ( '30_agents/60_approximators/approximators.html#transformer',
                                                                             'ddopai/approximators.py'),
-                                      'ddopai.approximators.Transformer.__init__': ( '60_approximators/approximators.html#transformer.__init__',
+                                      'ddopai.approximators.Transformer.__init__': ( '30_agents/60_approximators/approximators.html#transformer.__init__',
                                                                                      'ddopai/approximators.py'),
-                                      'ddopai.approximators.Transformer.forward': ( '60_approximators/approximators.html#transformer.forward',
+                                      'ddopai.approximators.Transformer.forward': ( '30_agents/60_approximators/approximators.html#transformer.forward',
                                                                                     'ddopai/approximators.py'),
-                                      'ddopai.approximators.apply_rotary_pos_emb': ( '60_approximators/approximators.html#apply_rotary_pos_emb',
+                                      'ddopai.approximators.apply_rotary_pos_emb': ( '30_agents/60_approximators/approximators.html#apply_rotary_pos_emb',
                                                                                      'ddopai/approximators.py'),
-                                      'ddopai.approximators.find_multiple': ( '60_approximators/approximators.html#find_multiple',
+                                      'ddopai.approximators.find_multiple': ( '30_agents/60_approximators/approximators.html#find_multiple',
                                                                               'ddopai/approximators.py'),
-                                      'ddopai.approximators.rotate_half': ( '60_approximators/approximators.html#rotate_half',
+                                      'ddopai.approximators.rotate_half': ( '30_agents/60_approximators/approximators.html#rotate_half',
                                                                             'ddopai/approximators.py')},
             'ddopai.dataloaders.base': { 'ddopai.dataloaders.base.BaseDataLoader': ( '10_dataloaders/base_dataloader.html#basedataloader',
                                                                                      'ddopai/dataloaders/base.py'),
@@ -401,26 +470,62 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.__len__': ( '10_dataloaders/base_dataloader.html#basedataloader.__len__',
                                                                                              'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.arrays_to_validate': ( '10_dataloaders/base_dataloader.html#basedataloader.arrays_to_validate',
+                                                                                                        'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.attach_shared': ( '10_dataloaders/base_dataloader.html#basedataloader.attach_shared',
+                                                                                                   'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.get_all_X': ( '10_dataloaders/base_dataloader.html#basedataloader.get_all_x',
                                                                                                'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.get_all_Y': ( '10_dataloaders/base_dataloader.html#basedataloader.get_all_y',
                                                                                                'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.get_batch': ( '10_dataloaders/base_dataloader.html#basedataloader.get_batch',
+                                                                                               'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.get_mask': ( '10_dataloaders/base_dataloader.html#basedataloader.get_mask',
+                                                                                              'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.len_test': ( '10_dataloaders/base_dataloader.html#basedataloader.len_test',
                                                                                               'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.len_train': ( '10_dataloaders/base_dataloader.html#basedataloader.len_train',
                                                                                                'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.len_val': ( '10_dataloaders/base_dataloader.html#basedataloader.len_val',
                                                                                              'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.set_SKU_chunk': ( '10_dataloaders/base_dataloader.html#basedataloader.set_sku_chunk',
+                                                                                                   'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.test': ( '10_dataloaders/base_dataloader.html#basedataloader.test',
                                                                                           'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.to_shared': ( '10_dataloaders/base_dataloader.html#basedataloader.to_shared',
+                                                                                               'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.train': ( '10_dataloaders/base_dataloader.html#basedataloader.train',
                                                                                            'ddopai/dataloaders/base.py'),
                                          'ddopai.dataloaders.base.BaseDataLoader.val': ( '10_dataloaders/base_dataloader.html#basedataloader.val',
-                                                                                         'ddopai/dataloaders/base.py')},
+                                                                                         'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.BaseDataLoader.validate_data': ( '10_dataloaders/base_dataloader.html#basedataloader.validate_data',
+                                                                                                   'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedArrayReference': ( '10_dataloaders/base_dataloader.html#sharedarrayreference',
+                                                                                           'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedArrayReference.__init__': ( '10_dataloaders/base_dataloader.html#sharedarrayreference.__init__',
+                                                                                                    'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle',
+                                                                                             'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle.__enter__': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle.__enter__',
+                                                                                                       'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle.__exit__': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle.__exit__',
+                                                                                                      'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle.__getstate__': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle.__getstate__',
+                                                                                                          'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle.__init__': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle.__init__',
+                                                                                                      'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.SharedDataLoaderHandle.release': ( '10_dataloaders/base_dataloader.html#shareddataloaderhandle.release',
+                                                                                                     'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.find_invalid_values': ( '10_dataloaders/base_dataloader.html#find_invalid_values',
+                                                                                          'ddopai/dataloaders/base.py'),
+                                         'ddopai.dataloaders.base.format_invalid_values': ( '10_dataloaders/base_dataloader.html#format_invalid_values',
+                                                                                            'ddopai/dataloaders/base.py')},
             'ddopai.dataloaders.distribution': { 'ddopai.dataloaders.distribution.BaseDistributionDataLoader': ( '10_dataloaders/distribution_loaders.html#basedistributiondataloader',
                                                                                                                  'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.BaseDistributionDataLoader.__init__': ( '10_dataloaders/distribution_loaders.html#basedistributiondataloader.__init__',
                                                                                                                           'ddopai/dataloaders/distribution.py'),
+                                                 'ddopai.dataloaders.distribution.BaseDistributionDataLoader.arrays_to_validate': ( '10_dataloaders/distribution_loaders.html#basedistributiondataloader.arrays_to_validate',
+                                                                                                                                    'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader',
                                                                                                                    'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader.X_shape': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.x_shape',
@@ -437,6 +542,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                              'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader.get_all_Y': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.get_all_y',
                                                                                                                              'ddopai/dataloaders/distribution.py'),
+                                                 'ddopai.dataloaders.distribution.NormalDistributionDataLoader.get_batch': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.get_batch',
+                                                                                                                             'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader.len_test': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.len_test',
                                                                                                                             'ddopai/dataloaders/distribution.py'),
                                                  'ddopai.dataloaders.distribution.NormalDistributionDataLoader.len_train': ( '10_dataloaders/distribution_loaders.html#normaldistributiondataloader.len_train',
@@ -455,12 +562,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.__len__': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.__len__',
                                                                                                      'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.arrays_to_validate': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.arrays_to_validate',
+                                                                                                                'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.build_engineered_SKU_features': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.build_engineered_sku_features',
                                                                                                                            'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.get_all_X': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_all_x',
                                                                                                        'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.get_all_Y': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_all_y',
                                                                                                        'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.get_mask': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_mask',
+                                                                                                      'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.get_time_SKU_idx': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.get_time_sku_idx',
                                                                                                               'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.identify_train_SKUs': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.identify_train_skus',
@@ -481,6 +592,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                          'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.save_indices': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.save_indices',
                                                                                                           'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.MultiShapeLoader.set_SKU_chunk': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.set_sku_chunk',
+                                                                                                           'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.set_in_sample_val_test_SKUs': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.set_in_sample_val_test_skus',
                                                                                                                          'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.MultiShapeLoader.set_out_of_sample_SKUs': ( '10_dataloaders/tabular_dataloaders.html#multishapeloader.set_out_of_sample_skus',
@@ -505,10 +618,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.__len__': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.__len__',
                                                                                                  'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.arrays_to_validate': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.arrays_to_validate',
+                                                                                                            'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.get_all_X': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_all_x',
                                                                                                    'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.get_all_Y': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_all_y',
                                                                                                    'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.get_batch': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_batch',
+                                                                                                   'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.get_data_indices': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_data_indices',
+                                                                                                          'ddopai/dataloaders/tabular.py'),
+                                            'ddopai.dataloaders.tabular.XYDataLoader.get_mask': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.get_mask',
+                                                                                                  'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.len_test': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.len_test',
                                                                                                   'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.len_train': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.len_train',
@@ -521,163 +642,390 @@ d = { 'settings': { 'branch': 'main',
                                                                                                            'ddopai/dataloaders/tabular.py'),
                                             'ddopai.dataloaders.tabular.XYDataLoader.update_lag_features': ( '10_dataloaders/tabular_dataloaders.html#xydataloader.update_lag_features',
                                                                                                              'ddopai/dataloaders/tabular.py')},
-            'ddopai.datasets.default_datasets': { 'ddopai.datasets.default_datasets.DatasetLoader': ( '80_datasets/default_datasets.html#datasetloader',
+            'ddopai.datasets.default_datasets': { 'ddopai.datasets.default_datasets.DatasetLoader': ( '90_datasets/default_datasets.html#datasetloader',
                                                                                                       'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.DatasetLoader.__init__': ( '80_datasets/default_datasets.html#datasetloader.__init__',
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.__init__': ( '90_datasets/default_datasets.html#datasetloader.__init__',
                                                                                                                'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.DatasetLoader.load_dataset': ( '80_datasets/default_datasets.html#datasetloader.load_dataset',
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.load_dataset': ( '90_datasets/default_datasets.html#datasetloader.load_dataset',
                                                                                                                    'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.DatasetLoader.show_dataset_types': ( '80_datasets/default_datasets.html#datasetloader.show_dataset_types',
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.load_manifest': ( '90_datasets/default_datasets.html#datasetloader.load_manifest',
+                                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.read_mirror_manifest': ( '90_datasets/default_datasets.html#datasetloader.read_mirror_manifest',
+                                                                                                                           'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.resolve_asset': ( '90_datasets/default_datasets.html#datasetloader.resolve_asset',
+                                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.resolve_release_tag': ( '90_datasets/default_datasets.html#datasetloader.resolve_release_tag',
+                                                                                                                          'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.save_manifest': ( '90_datasets/default_datasets.html#datasetloader.save_manifest',
+                                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.DatasetLoader.show_dataset_types': ( '90_datasets/default_datasets.html#datasetloader.show_dataset_types',
                                                                                                                          'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.download_file_from_github': ( '80_datasets/default_datasets.html#download_file_from_github',
+                                                  'ddopai.datasets.default_datasets.download_file_from_github': ( '90_datasets/default_datasets.html#download_file_from_github',
                                                                                                                   'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.get_all_release_tags': ( '80_datasets/default_datasets.html#get_all_release_tags',
+                                                  'ddopai.datasets.default_datasets.fetch_file': ( '90_datasets/default_datasets.html#fetch_file',
+                                                                                                   'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.file_signature': ( '90_datasets/default_datasets.html#file_signature',
+                                                                                                       'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.get_all_release_tags': ( '90_datasets/default_datasets.html#get_all_release_tags',
                                                                                                              'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.get_asset_url': ( '80_datasets/default_datasets.html#get_asset_url',
+                                                  'ddopai.datasets.default_datasets.get_asset_url': ( '90_datasets/default_datasets.html#get_asset_url',
                                                                                                       'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.get_dataset_url': ( '80_datasets/default_datasets.html#get_dataset_url',
+                                                  'ddopai.datasets.default_datasets.get_dataset_asset': ( '90_datasets/default_datasets.html#get_dataset_asset',
+                                                                                                          'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.get_dataset_url': ( '90_datasets/default_datasets.html#get_dataset_url',
                                                                                                         'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.get_release_tag': ( '80_datasets/default_datasets.html#get_release_tag',
+                                                  'ddopai.datasets.default_datasets.get_release_tag': ( '90_datasets/default_datasets.html#get_release_tag',
                                                                                                         'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.load_data_from_directory': ( '80_datasets/default_datasets.html#load_data_from_directory',
+                                                  'ddopai.datasets.default_datasets.load_columnar': ( '90_datasets/default_datasets.html#load_columnar',
+                                                                                                      'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.load_csv_cached': ( '90_datasets/default_datasets.html#load_csv_cached',
+                                                                                                        'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.load_data_from_directory': ( '90_datasets/default_datasets.html#load_data_from_directory',
                                                                                                                  'ddopai/datasets/default_datasets.py'),
-                                                  'ddopai.datasets.default_datasets.unzip_file': ( '80_datasets/default_datasets.html#unzip_file',
+                                                  'ddopai.datasets.default_datasets.save_columnar': ( '90_datasets/default_datasets.html#save_columnar',
+                                                                                                      'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.select_release_tag': ( '90_datasets/default_datasets.html#select_release_tag',
+                                                                                                           'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.sha256_file': ( '90_datasets/default_datasets.html#sha256_file',
+                                                                                                    'ddopai/datasets/default_datasets.py'),
+                                                  'ddopai.datasets.default_datasets.unzip_file': ( '90_datasets/default_datasets.html#unzip_file',
                                                                                                    'ddopai/datasets/default_datasets.py')},
-            'ddopai.datasets.kaggle_m5': { 'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader',
+            'ddopai.datasets.kaggle_m5': { 'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader',
                                                                                                 'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.__init__': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.__init__',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.__init__': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.__init__',
                                                                                                          'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.check_data_path': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.check_data_path',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.cache_is_valid': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.cache_is_valid',
+                                                                                                               'ddopai/datasets/kaggle_m5.py'),
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.cache_signature': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.cache_signature',
                                                                                                                 'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.create_paths': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.create_paths',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.check_data_path': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.check_data_path',
+                                                                                                                'ddopai/datasets/kaggle_m5.py'),
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.create_paths': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.create_paths',
                                                                                                              'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.download_data': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.download_data',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.download_data': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.download_data',
                                                                                                               'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.import_from_folder': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.import_from_folder',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.import_from_folder': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.import_from_folder',
                                                                                                                    'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.load_dataset': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.load_dataset',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.load_dataset': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.load_dataset',
                                                                                                              'ddopai/datasets/kaggle_m5.py'),
-                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.preprocess_pipeline': ( '80_datasets/kaggle_m5.html#kagglem5datasetloader.preprocess_pipeline',
-                                                                                                                    'ddopai/datasets/kaggle_m5.py')},
-            'ddopai.envs.base': { 'ddopai.envs.base.BaseEnvironment': ('20_base_env/base_env.html#baseenvironment', 'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.__init__': ( '20_base_env/base_env.html#baseenvironment.__init__',
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.load_from_cache': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.load_from_cache',
+                                                                                                                'ddopai/datasets/kaggle_m5.py'),
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.preprocess_pipeline': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.preprocess_pipeline',
+                                                                                                                    'ddopai/datasets/kaggle_m5.py'),
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.read_filtered_csv': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.read_filtered_csv',
+                                                                                                                  'ddopai/datasets/kaggle_m5.py'),
+                                           'ddopai.datasets.kaggle_m5.KaggleM5DatasetLoader.save_to_cache': ( '90_datasets/kaggle_m5.html#kagglem5datasetloader.save_to_cache',
+                                                                                                              'ddopai/datasets/kaggle_m5.py')},
+            'ddopai.datasets.synthetic': { 'ddopai.datasets.synthetic.generate_arma_dataset': ( '90_datasets/synthetic_datasets.html#generate_arma_dataset',
+                                                                                                'ddopai/datasets/synthetic.py'),
+                                           'ddopai.datasets.synthetic.generate_m5_like_dataset': ( '90_datasets/synthetic_datasets.html#generate_m5_like_dataset',
+                                                                                                   'ddopai/datasets/synthetic.py'),
+                                           'ddopai.datasets.synthetic.sample_stationary_ar_coefficients': ( '90_datasets/synthetic_datasets.html#sample_stationary_ar_coefficients',
+                                                                                                            'ddopai/datasets/synthetic.py'),
+                                           'ddopai.datasets.synthetic.simulate_arma': ( '90_datasets/synthetic_datasets.html#simulate_arma',
+                                                                                        'ddopai/datasets/synthetic.py')},
+            'ddopai.envs.async_vector': { 'ddopai.envs.async_vector.GymnasiumEnvAdapter': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter',
+                                                                                            'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.__init__': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.__init__',
+                                                                                                     'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.reset': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.reset',
+                                                                                                  'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.step': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.step',
+                                                                                                 'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.test': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.test',
+                                                                                                 'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.train': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.train',
+                                                                                                  'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.GymnasiumEnvAdapter.val': ( '20_environments/20_base_env/async_vector_env.html#gymnasiumenvadapter.val',
+                                                                                                'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.SharedDataAsyncVectorEnv': ( '20_environments/20_base_env/async_vector_env.html#shareddataasyncvectorenv',
+                                                                                                 'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.SharedDataAsyncVectorEnv.__init__': ( '20_environments/20_base_env/async_vector_env.html#shareddataasyncvectorenv.__init__',
+                                                                                                          'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.SharedDataAsyncVectorEnv.close_extras': ( '20_environments/20_base_env/async_vector_env.html#shareddataasyncvectorenv.close_extras',
+                                                                                                              'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.SharedDataAsyncVectorEnv.release_shared_data': ( '20_environments/20_base_env/async_vector_env.html#shareddataasyncvectorenv.release_shared_data',
+                                                                                                                     'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.make_async_vector_env': ( '20_environments/20_base_env/async_vector_env.html#make_async_vector_env',
+                                                                                              'ddopai/envs/async_vector.py'),
+                                          'ddopai.envs.async_vector.make_shared_data_env': ( '20_environments/20_base_env/async_vector_env.html#make_shared_data_env',
+                                                                                             'ddopai/envs/async_vector.py')},
+            'ddopai.envs.base': { 'ddopai.envs.base.BaseEnvironment': ( '20_environments/20_base_env/base_env.html#baseenvironment',
+                                                                        'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.__init__': ( '20_environments/20_base_env/base_env.html#baseenvironment.__init__',
                                                                                  'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.add_postprocessor': ( '20_base_env/base_env.html#baseenvironment.add_postprocessor',
+                                  'ddopai.envs.base.BaseEnvironment.add_postprocessor': ( '20_environments/20_base_env/base_env.html#baseenvironment.add_postprocessor',
                                                                                           'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.get_observation': ( '20_base_env/base_env.html#baseenvironment.get_observation',
+                                  'ddopai.envs.base.BaseEnvironment.copy_state_value': ( '20_environments/20_base_env/base_env.html#baseenvironment.copy_state_value',
+                                                                                         'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.expand_action': ( '20_environments/20_base_env/base_env.html#baseenvironment.expand_action',
+                                                                                      'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.fuse_postprocessors': ( '20_environments/20_base_env/base_env.html#baseenvironment.fuse_postprocessors',
+                                                                                            'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.get_observation': ( '20_environments/20_base_env/base_env.html#baseenvironment.get_observation',
                                                                                         'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.get_start_index': ( '20_base_env/base_env.html#baseenvironment.get_start_index',
+                                  'ddopai.envs.base.BaseEnvironment.get_start_index': ( '20_environments/20_base_env/base_env.html#baseenvironment.get_start_index',
                                                                                         'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.info': ( '20_base_env/base_env.html#baseenvironment.info',
+                                  'ddopai.envs.base.BaseEnvironment.get_state': ( '20_environments/20_base_env/base_env.html#baseenvironment.get_state',
+                                                                                  'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.info': ( '20_environments/20_base_env/base_env.html#baseenvironment.info',
                                                                              'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.mdp_info': ( '20_base_env/base_env.html#baseenvironment.mdp_info',
+                                  'ddopai.envs.base.BaseEnvironment.mdp_info': ( '20_environments/20_base_env/base_env.html#baseenvironment.mdp_info',
                                                                                  'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.mode': ( '20_base_env/base_env.html#baseenvironment.mode',
+                                  'ddopai.envs.base.BaseEnvironment.mode': ( '20_environments/20_base_env/base_env.html#baseenvironment.mode',
                                                                              'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.reset': ( '20_base_env/base_env.html#baseenvironment.reset',
+                                  'ddopai.envs.base.BaseEnvironment.reset': ( '20_environments/20_base_env/base_env.html#baseenvironment.reset',
                                                                               'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.reset_index': ( '20_base_env/base_env.html#baseenvironment.reset_index',
+                                  'ddopai.envs.base.BaseEnvironment.reset_index': ( '20_environments/20_base_env/base_env.html#baseenvironment.reset_index',
                                                                                     'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.return_truncation_handler': ( '20_base_env/base_env.html#baseenvironment.return_truncation_handler',
+                                  'ddopai.envs.base.BaseEnvironment.return_truncation_handler': ( '20_environments/20_base_env/base_env.html#baseenvironment.return_truncation_handler',
                                                                                                   'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.set_action_space': ( '20_base_env/base_env.html#baseenvironment.set_action_space',
+                                  'ddopai.envs.base.BaseEnvironment.set_action_space': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_action_space',
                                                                                          'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.set_index': ( '20_base_env/base_env.html#baseenvironment.set_index',
+                                  'ddopai.envs.base.BaseEnvironment.set_index': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_index',
                                                                                   'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.set_observation_space': ( '20_base_env/base_env.html#baseenvironment.set_observation_space',
+                                  'ddopai.envs.base.BaseEnvironment.set_observation_space': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_observation_space',
                                                                                               'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.set_param': ( '20_base_env/base_env.html#baseenvironment.set_param',
+                                  'ddopai.envs.base.BaseEnvironment.set_param': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_param',
                                                                                   'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.set_return_truncation': ( '20_base_env/base_env.html#baseenvironment.set_return_truncation',
+                                  'ddopai.envs.base.BaseEnvironment.set_return_truncation': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_return_truncation',
                                                                                               'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.step': ( '20_base_env/base_env.html#baseenvironment.step',
+                                  'ddopai.envs.base.BaseEnvironment.set_seed': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_seed',
+                                                                                 'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.set_state': ( '20_environments/20_base_env/base_env.html#baseenvironment.set_state',
+                                                                                  'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.spawn_rng': ( '20_environments/20_base_env/base_env.html#baseenvironment.spawn_rng',
+                                                                                  'ddopai/envs/base.py'),
+                                  'ddopai.envs.base.BaseEnvironment.step': ( '20_environments/20_base_env/base_env.html#baseenvironment.step',
                                                                              'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.step_': ( '20_base_env/base_env.html#baseenvironment.step_',
+                                  'ddopai.envs.base.BaseEnvironment.step_': ( '20_environments/20_base_env/base_env.html#baseenvironment.step_',
                                                                               'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.stop': ( '20_base_env/base_env.html#baseenvironment.stop',
+                                  'ddopai.envs.base.BaseEnvironment.stop': ( '20_environments/20_base_env/base_env.html#baseenvironment.stop',
                                                                              'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.test': ( '20_base_env/base_env.html#baseenvironment.test',
+                                  'ddopai.envs.base.BaseEnvironment.test': ( '20_environments/20_base_env/base_env.html#baseenvironment.test',
                                                                              'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.train': ( '20_base_env/base_env.html#baseenvironment.train',
+                                  'ddopai.envs.base.BaseEnvironment.train': ( '20_environments/20_base_env/base_env.html#baseenvironment.train',
                                                                               'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.update_mdp_info': ( '20_base_env/base_env.html#baseenvironment.update_mdp_info',
+                                  'ddopai.envs.base.BaseEnvironment.update_mdp_info': ( '20_environments/20_base_env/base_env.html#baseenvironment.update_mdp_info',
                                                                                         'ddopai/envs/base.py'),
-                                  'ddopai.envs.base.BaseEnvironment.val': ( '20_base_env/base_env.html#baseenvironment.val',
+                                  'ddopai.envs.base.BaseEnvironment.val': ( '20_environments/20_base_env/base_env.html#baseenvironment.val',
                                                                             'ddopai/envs/base.py')},
-            'ddopai.envs.inventory.base': { 'ddopai.envs.inventory.base.BaseInventoryEnv': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv',
+            'ddopai.envs.inventory.base': { 'ddopai.envs.inventory.base.BaseInventoryEnv': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv',
                                                                                              'ddopai/envs/inventory/base.py'),
-                                            'ddopai.envs.inventory.base.BaseInventoryEnv.__init__': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv.__init__',
+                                            'ddopai.envs.inventory.base.BaseInventoryEnv.__init__': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv.__init__',
                                                                                                       'ddopai/envs/inventory/base.py'),
-                                            'ddopai.envs.inventory.base.BaseInventoryEnv.get_observation': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv.get_observation',
+                                            'ddopai.envs.inventory.base.BaseInventoryEnv.get_observation': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv.get_observation',
                                                                                                              'ddopai/envs/inventory/base.py'),
-                                            'ddopai.envs.inventory.base.BaseInventoryEnv.reset': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv.reset',
+                                            'ddopai.envs.inventory.base.BaseInventoryEnv.reset': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv.reset',
                                                                                                    'ddopai/envs/inventory/base.py'),
-                                            'ddopai.envs.inventory.base.BaseInventoryEnv.set_action_space': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv.set_action_space',
+                                            'ddopai.envs.inventory.base.BaseInventoryEnv.set_action_space': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv.set_action_space',
                                                                                                               'ddopai/envs/inventory/base.py'),
-                                            'ddopai.envs.inventory.base.BaseInventoryEnv.set_observation_space': ( '21_envs_inventory/base_inventory_env.html#baseinventoryenv.set_observation_space',
+                                            'ddopai.envs.inventory.base.BaseInventoryEnv.set_observation_space': ( '20_environments/21_envs_inventory/base_inventory_env.html#baseinventoryenv.set_observation_space',
                                                                                                                    'ddopai/envs/inventory/base.py')},
-            'ddopai.envs.inventory.inventory_utils': { 'ddopai.envs.inventory.inventory_utils.OrderPipeline': ( '21_envs_inventory/inventory_utils.html#orderpipeline',
+            'ddopai.envs.inventory.inventory_utils': { 'ddopai.envs.inventory.inventory_utils.OrderPipeline': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline',
                                                                                                                 'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.__init__': ( '21_envs_inventory/inventory_utils.html#orderpipeline.__init__',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.__init__': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.__init__',
                                                                                                                          'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.check_max_min_mean_lt': ( '21_envs_inventory/inventory_utils.html#orderpipeline.check_max_min_mean_lt',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.check_max_min_mean_lt': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.check_max_min_mean_lt',
                                                                                                                                       'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.check_stochasticity': ( '21_envs_inventory/inventory_utils.html#orderpipeline.check_stochasticity',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.check_stochasticity': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.check_stochasticity',
                                                                                                                                     'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.draw_lead_times': ( '21_envs_inventory/inventory_utils.html#orderpipeline.draw_lead_times',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.draw_lead_time_block': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.draw_lead_time_block',
+                                                                                                                                     'ddopai/envs/inventory/inventory_utils.py'),
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.draw_lead_times': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.draw_lead_times',
                                                                                                                                 'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.get_orders_arriving': ( '21_envs_inventory/inventory_utils.html#orderpipeline.get_orders_arriving',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.get_orders_arriving': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.get_orders_arriving',
                                                                                                                                     'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.get_pipeline': ( '21_envs_inventory/inventory_utils.html#orderpipeline.get_pipeline',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.get_pipeline': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.get_pipeline',
                                                                                                                              'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.reset': ( '21_envs_inventory/inventory_utils.html#orderpipeline.reset',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.get_state': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.get_state',
+                                                                                                                          'ddopai/envs/inventory/inventory_utils.py'),
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.lead_time_realized': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.lead_time_realized',
+                                                                                                                                   'ddopai/envs/inventory/inventory_utils.py'),
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.pipeline': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.pipeline',
+                                                                                                                         'ddopai/envs/inventory/inventory_utils.py'),
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.reset': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.reset',
                                                                                                                       'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.set_param': ( '21_envs_inventory/inventory_utils.html#orderpipeline.set_param',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.set_param': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.set_param',
+                                                                                                                          'ddopai/envs/inventory/inventory_utils.py'),
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.set_state': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.set_state',
                                                                                                                           'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.shape': ( '21_envs_inventory/inventory_utils.html#orderpipeline.shape',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.shape': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.shape',
                                                                                                                       'ddopai/envs/inventory/inventory_utils.py'),
-                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.step': ( '21_envs_inventory/inventory_utils.html#orderpipeline.step',
+                                                       'ddopai.envs.inventory.inventory_utils.OrderPipeline.step': ( '20_environments/21_envs_inventory/inventory_utils.html#orderpipeline.step',
                                                                                                                      'ddopai/envs/inventory/inventory_utils.py')},
-            'ddopai.envs.inventory.multi_period': { 'ddopai.envs.inventory.multi_period.MultiPeriodEnv': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv',
+            'ddopai.envs.inventory.multi_period': { 'ddopai.envs.inventory.multi_period.MultiPeriodEnv': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv',
                                                                                                            'ddopai/envs/inventory/multi_period.py'),
-                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.__init__': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv.__init__',
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.__init__': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.__init__',
                                                                                                                     'ddopai/envs/inventory/multi_period.py'),
-                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.get_observation': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv.get_observation',
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.get_observation': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.get_observation',
                                                                                                                            'ddopai/envs/inventory/multi_period.py'),
-                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.reset': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv.reset',
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.get_state': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.get_state',
+                                                                                                                     'ddopai/envs/inventory/multi_period.py'),
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.reset': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.reset',
                                                                                                                  'ddopai/envs/inventory/multi_period.py'),
-                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.set_observation_space': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv.set_observation_space',
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.set_observation_space': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.set_observation_space',
                                                                                                                                  'ddopai/envs/inventory/multi_period.py'),
-                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.step_': ( '21_envs_inventory/multi_period_envs.html#multiperiodenv.step_',
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.set_seed': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.set_seed',
+                                                                                                                    'ddopai/envs/inventory/multi_period.py'),
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.set_state': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.set_state',
+                                                                                                                     'ddopai/envs/inventory/multi_period.py'),
+                                                    'ddopai.envs.inventory.multi_period.MultiPeriodEnv.step_': ( '20_environments/21_envs_inventory/multi_period_envs.html#multiperiodenv.step_',
                                                                                                                  'ddopai/envs/inventory/multi_period.py')},
-            'ddopai.envs.inventory.single_period': { 'ddopai.envs.inventory.single_period.NewsvendorEnv': ( '21_envs_inventory/single_period_envs.html#newsvendorenv',
+            'ddopai.envs.inventory.single_period': { 'ddopai.envs.inventory.single_period.NewsvendorEnv': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv',
                                                                                                             'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.__init__': ( '21_envs_inventory/single_period_envs.html#newsvendorenv.__init__',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.__init__': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.__init__',
                                                                                                                      'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.determine_cost': ( '21_envs_inventory/single_period_envs.html#newsvendorenv.determine_cost',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.determine_cost': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.determine_cost',
                                                                                                                            'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.step_': ( '21_envs_inventory/single_period_envs.html#newsvendorenv.step_',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.expand_action': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.expand_action',
+                                                                                                                          'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.get_active_SKUs': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.get_active_skus',
+                                                                                                                            'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.get_episode': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.get_episode',
+                                                                                                                        'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.score_episode': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.score_episode',
+                                                                                                                          'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.score_period': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.score_period',
+                                                                                                                         'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.select_SKUs': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.select_skus',
+                                                                                                                        'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.step_': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.step_',
                                                                                                                   'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.update_cu_co': ( '21_envs_inventory/single_period_envs.html#newsvendorenv.update_cu_co',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnv.update_cu_co': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenv.update_cu_co',
                                                                                                                          'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl',
                                                                                                                       'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.__init__': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.__init__',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.__init__': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.__init__',
                                                                                                                                'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_evaluation_metric': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_evaluation_metric',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_SKU_chunks': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_sku_chunks',
+                                                                                                                                       'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_evaluation_metric': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_evaluation_metric',
                                                                                                                                               'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_sl_distribution': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_sl_distribution',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_observation': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_observation',
+                                                                                                                                        'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.check_sl_distribution': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.check_sl_distribution',
                                                                                                                                             'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.determine_cost': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.determine_cost',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.determine_cost': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.determine_cost',
                                                                                                                                      'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.draw_parameter': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.draw_parameter',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.draw_parameter': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.draw_parameter',
                                                                                                                                      'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.get_observation': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.get_observation',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.draw_sl_block': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.draw_sl_block',
+                                                                                                                                    'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.get_episode': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.get_episode',
+                                                                                                                                  'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.get_observation': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.get_observation',
                                                                                                                                       'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_observation_space': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_observation_space',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.get_state': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.get_state',
+                                                                                                                                'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.reset': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.reset',
+                                                                                                                            'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.reset_SKU_chunks': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.reset_sku_chunks',
+                                                                                                                                       'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.reset_sl_sampler': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.reset_sl_sampler',
+                                                                                                                                       'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_observation_space': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_observation_space',
                                                                                                                                             'ddopai/envs/inventory/single_period.py'),
-                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_val_test_sl': ( '21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_val_test_sl',
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_seed': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_seed',
+                                                                                                                               'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_state': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_state',
+                                                                                                                                'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.set_val_test_sl': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.set_val_test_sl',
+                                                                                                                                      'ddopai/envs/inventory/single_period.py'),
+                                                     'ddopai.envs.inventory.single_period.NewsvendorEnvVariableSL.step_SKU_chunks': ( '20_environments/21_envs_inventory/single_period_envs.html#newsvendorenvvariablesl.step_sku_chunks',
                                                                                                                                       'ddopai/envs/inventory/single_period.py')},
+            'ddopai.envs.inventory.vector': { 'ddopai.envs.inventory.vector.VecEnvMixin': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin',
+                                                                                            'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.check_action': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.check_action',
+                                                                                                         'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.copy': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.copy',
+                                                                                                 'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.is_positive': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.is_positive',
+                                                                                                        'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.maximum': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.maximum',
+                                                                                                    'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.minimum': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.minimum',
+                                                                                                    'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.reset_index': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.reset_index',
+                                                                                                        'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.set_backend': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.set_backend',
+                                                                                                        'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.set_n_envs': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.set_n_envs',
+                                                                                                       'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecEnvMixin.to_backend': ( '20_environments/21_envs_inventory/vector_envs.html#vecenvmixin.to_backend',
+                                                                                                       'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv',
+                                                                                                  'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv.__init__': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv.__init__',
+                                                                                                           'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv.detach_state': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv.detach_state',
+                                                                                                               'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv.get_observation': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv.get_observation',
+                                                                                                                  'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv.reset': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv.reset',
+                                                                                                        'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecMultiPeriodEnv.step_': ( '20_environments/21_envs_inventory/vector_envs.html#vecmultiperiodenv.step_',
+                                                                                                        'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv',
+                                                                                                 'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv.__init__': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv.__init__',
+                                                                                                          'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv.determine_cost': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv.determine_cost',
+                                                                                                                'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv.get_observation': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv.get_observation',
+                                                                                                                 'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv.reset': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv.reset',
+                                                                                                       'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnv.step_': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenv.step_',
+                                                                                                       'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl',
+                                                                                                           'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL.__init__': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl.__init__',
+                                                                                                                    'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL.determine_cost': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl.determine_cost',
+                                                                                                                          'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL.draw_sl_block': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl.draw_sl_block',
+                                                                                                                         'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL.get_observation': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl.get_observation',
+                                                                                                                           'ddopai/envs/inventory/vector.py'),
+                                              'ddopai.envs.inventory.vector.VecNewsvendorEnvVariableSL.reset': ( '20_environments/21_envs_inventory/vector_envs.html#vecnewsvendorenvvariablesl.reset',
+                                                                                                                 'ddopai/envs/inventory/vector.py')},
+            'ddopai.envs.prefetch': { 'ddopai.envs.prefetch.PrefetchDataLoader': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader',
+                                                                                   'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.__getattr__': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.__getattr__',
+                                                                                               'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.__getitem__': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.__getitem__',
+                                                                                               'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.__init__': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.__init__',
+                                                                                            'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.__len__': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.__len__',
+                                                                                           'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.close': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.close',
+                                                                                         'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.discard_prefetch': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.discard_prefetch',
+                                                                                                    'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.prefetch': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.prefetch',
+                                                                                            'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.set_SKU_chunk': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.set_sku_chunk',
+                                                                                                 'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.take_prefetch': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.take_prefetch',
+                                                                                                 'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.test': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.test',
+                                                                                        'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.train': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.train',
+                                                                                         'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchDataLoader.val': ( '20_environments/20_base_env/prefetch_env.html#prefetchdataloader.val',
+                                                                                       'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchEnv': ( '20_environments/20_base_env/prefetch_env.html#prefetchenv',
+                                                                            'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchEnv.__init__': ( '20_environments/20_base_env/prefetch_env.html#prefetchenv.__init__',
+                                                                                     'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchEnv.close': ( '20_environments/20_base_env/prefetch_env.html#prefetchenv.close',
+                                                                                  'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchEnv.fetches_randomly': ( '20_environments/20_base_env/prefetch_env.html#prefetchenv.fetches_randomly',
+                                                                                             'ddopai/envs/prefetch.py'),
+                                      'ddopai.envs.prefetch.PrefetchEnv.reset': ( '20_environments/20_base_env/prefetch_env.html#prefetchenv.reset',
+                                                                                  'ddopai/envs/prefetch.py')},
             'ddopai.experiment_functions': { 'ddopai.experiment_functions.EarlyStoppingHandler': ( '30_experiment_functions/experiment_functions.html#earlystoppinghandler',
                                                                                                    'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.EarlyStoppingHandler.__init__': ( '30_experiment_functions/experiment_functions.html#earlystoppinghandler.__init__',
@@ -686,12 +1034,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                                               'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.calculate_score': ( '30_experiment_functions/experiment_functions.html#calculate_score',
                                                                                               'ddopai/experiment_functions.py'),
+                                             'ddopai.experiment_functions.can_batch_episode': ( '30_experiment_functions/experiment_functions.html#can_batch_episode',
+                                                                                                'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.log_info': ( '30_experiment_functions/experiment_functions.html#log_info',
                                                                                        'ddopai/experiment_functions.py'),
+                                             'ddopai.experiment_functions.make_cost_grid': ( '30_experiment_functions/experiment_functions.html#make_cost_grid',
+                                                                                             'ddopai/experiment_functions.py'),
+                                             'ddopai.experiment_functions.rescore_episode': ( '30_experiment_functions/experiment_functions.html#rescore_episode',
+                                                                                              'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.run_experiment': ( '30_experiment_functions/experiment_functions.html#run_experiment',
                                                                                              'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.run_test_episode': ( '30_experiment_functions/experiment_functions.html#run_test_episode',
                                                                                                'ddopai/experiment_functions.py'),
+                                             'ddopai.experiment_functions.run_test_episode_SKU_chunks': ( '30_experiment_functions/experiment_functions.html#run_test_episode_sku_chunks',
+                                                                                                          'ddopai/experiment_functions.py'),
+                                             'ddopai.experiment_functions.run_test_episode_batched': ( '30_experiment_functions/experiment_functions.html#run_test_episode_batched',
+                                                                                                       'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.save_agent': ( '30_experiment_functions/experiment_functions.html#save_agent',
                                                                                          'ddopai/experiment_functions.py'),
                                              'ddopai.experiment_functions.test_agent': ( '30_experiment_functions/experiment_functions.html#test_agent',
@@ -761,6 +1119,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'ddopai/obsprocessors.py'),
                                       'ddopai.obsprocessors.ConvertDictSpace.__init__': ( '00_utils/obsprocessors.html#convertdictspace.__init__',
                                                                                           'ddopai/obsprocessors.py'),
+                                      'ddopai.obsprocessors.DictLayoutProcessor': ( '00_utils/obsprocessors.html#dictlayoutprocessor',
+                                                                                    'ddopai/obsprocessors.py'),
+                                      'ddopai.obsprocessors.DictLayoutProcessor.__call__': ( '00_utils/obsprocessors.html#dictlayoutprocessor.__call__',
+                                                                                             'ddopai/obsprocessors.py'),
+                                      'ddopai.obsprocessors.DictLayoutProcessor.__init__': ( '00_utils/obsprocessors.html#dictlayoutprocessor.__init__',
+                                                                                             'ddopai/obsprocessors.py'),
+                                      'ddopai.obsprocessors.DictLayoutProcessor.allocate': ( '00_utils/obsprocessors.html#dictlayoutprocessor.allocate',
+                                                                                             'ddopai/obsprocessors.py'),
+                                      'ddopai.obsprocessors.DictLayoutProcessor.compile': ( '00_utils/obsprocessors.html#dictlayoutprocessor.compile',
+                                                                                            'ddopai/obsprocessors.py'),
                                       'ddopai.obsprocessors.FlattenTimeDimNumpy': ( '00_utils/obsprocessors.html#flattentimedimnumpy',
                                                                                     'ddopai/obsprocessors.py'),
                                       'ddopai.obsprocessors.FlattenTimeDimNumpy.__call__': ( '00_utils/obsprocessors.html#flattentimedimnumpy.__call__',
@@ -783,6 +1151,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'ddopai/postprocessors.py'),
                                        'ddopai.postprocessors.MoveBatchToProductDim.__init__': ( '00_utils/postprocessors.html#movebatchtoproductdim.__init__',
                                                                                                  'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline': ( '00_utils/postprocessors.html#postprocessorpipeline',
+                                                                                        'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.__call__': ( '00_utils/postprocessors.html#postprocessorpipeline.__call__',
+                                                                                                 'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.__init__': ( '00_utils/postprocessors.html#postprocessorpipeline.__init__',
+                                                                                                 'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.check_parameter': ( '00_utils/postprocessors.html#postprocessorpipeline.check_parameter',
+                                                                                                        'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.get_input_shape': ( '00_utils/postprocessors.html#postprocessorpipeline.get_input_shape',
+                                                                                                        'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.move_parameter': ( '00_utils/postprocessors.html#postprocessorpipeline.move_parameter',
+                                                                                                       'ddopai/postprocessors.py'),
+                                       'ddopai.postprocessors.PostprocessorPipeline.setup': ( '00_utils/postprocessors.html#postprocessorpipeline.setup',
+                                                                                              'ddopai/postprocessors.py'),
                                        'ddopai.postprocessors.RoundAction': ( '00_utils/postprocessors.html#roundaction',
                                                                               'ddopai/postprocessors.py'),
                                        'ddopai.postprocessors.RoundAction.__call__': ( '00_utils/postprocessors.html#roundaction.__call__',
@@ -791,6 +1173,31 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'ddopai/postprocessors.py'),
                                        'ddopai.postprocessors.RoundAction._validate_unit_size': ( '00_utils/postprocessors.html#roundaction._validate_unit_size',
                                                                                                   'ddopai/postprocessors.py')},
+            'ddopai.profiling': { 'ddopai.profiling.PhaseTimer': ('00_utils/profiling.html#phasetimer', 'ddopai/profiling.py'),
+                                  'ddopai.profiling.PhaseTimer.__enter__': ( '00_utils/profiling.html#phasetimer.__enter__',
+                                                                             'ddopai/profiling.py'),
+                                  'ddopai.profiling.PhaseTimer.__exit__': ( '00_utils/profiling.html#phasetimer.__exit__',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.PhaseTimer.__init__': ( '00_utils/profiling.html#phasetimer.__init__',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry': ('00_utils/profiling.html#timerregistry', 'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.__init__': ( '00_utils/profiling.html#timerregistry.__init__',
+                                                                               'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.aggregates': ( '00_utils/profiling.html#timerregistry.aggregates',
+                                                                                 'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.disable': ( '00_utils/profiling.html#timerregistry.disable',
+                                                                              'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.enable': ( '00_utils/profiling.html#timerregistry.enable',
+                                                                             'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.reset': ( '00_utils/profiling.html#timerregistry.reset',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.summary': ( '00_utils/profiling.html#timerregistry.summary',
+                                                                              'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.timer': ( '00_utils/profiling.html#timerregistry.timer',
+                                                                            'ddopai/profiling.py'),
+                                  'ddopai.profiling.TimerRegistry.to_chrome_trace': ( '00_utils/profiling.html#timerregistry.to_chrome_trace',
+                                                                                      'ddopai/profiling.py'),
+                                  'ddopai.profiling.profiling': ('00_utils/profiling.html#profiling', 'ddopai/profiling.py')},
             'ddopai.torch_utils.loss_functions': { 'ddopai.torch_utils.loss_functions.TorchPinballLoss': ( '00_utils/torch_loss_functions.html#torchpinballloss',
                                                                                                            'ddopai/torch_utils/loss_functions.py'),
                                                    'ddopai.torch_utils.loss_functions.TorchPinballLoss.__init__': ( '00_utils/torch_loss_functions.html#torchpinballloss.__init__',
@@ -811,10 +1218,23 @@ d = { 'settings': { 'branch': 'main',
                                                                                                        'ddopai/torch_utils/loss_functions.py'),
                                                    'ddopai.torch_utils.loss_functions.quantile_loss': ( '00_utils/torch_loss_functions.html#quantile_loss',
                                                                                                         'ddopai/torch_utils/loss_functions.py')},
+            'ddopai.torch_utils.relaxations': { 'ddopai.torch_utils.relaxations.straight_through_heaviside': ( '00_utils/torch_relaxations.html#straight_through_heaviside',
+                                                                                                               'ddopai/torch_utils/relaxations.py'),
+                                                'ddopai.torch_utils.relaxations.straight_through_max': ( '00_utils/torch_relaxations.html#straight_through_max',
+                                                                                                         'ddopai/torch_utils/relaxations.py'),
+                                                'ddopai.torch_utils.relaxations.straight_through_min': ( '00_utils/torch_relaxations.html#straight_through_min',
+                                                                                                         'ddopai/torch_utils/relaxations.py')},
             'ddopai.tracking': { 'ddopai.tracking.get_git_hash': ('00_utils/tracking.html#get_git_hash', 'ddopai/tracking.py'),
                                  'ddopai.tracking.get_library_version': ( '00_utils/tracking.html#get_library_version',
-                                                                          'ddopai/tracking.py')},
-            'ddopai.utils': { 'ddopai.utils.DatasetWrapper': ('00_utils/utils.html#datasetwrapper', 'ddopai/utils.py'),
+                                                                          'ddopai/tracking.py'),
+                                 'ddopai.tracking.track_profile': ('00_utils/tracking.html#track_profile', 'ddopai/tracking.py')},
+            'ddopai.utils': { 'ddopai.utils.BlockSampler': ('00_utils/utils.html#blocksampler', 'ddopai/utils.py'),
+                              'ddopai.utils.BlockSampler.__call__': ('00_utils/utils.html#blocksampler.__call__', 'ddopai/utils.py'),
+                              'ddopai.utils.BlockSampler.__init__': ('00_utils/utils.html#blocksampler.__init__', 'ddopai/utils.py'),
+                              'ddopai.utils.BlockSampler.get_state': ('00_utils/utils.html#blocksampler.get_state', 'ddopai/utils.py'),
+                              'ddopai.utils.BlockSampler.reset': ('00_utils/utils.html#blocksampler.reset', 'ddopai/utils.py'),
+                              'ddopai.utils.BlockSampler.set_state': ('00_utils/utils.html#blocksampler.set_state', 'ddopai/utils.py'),
+                              'ddopai.utils.DatasetWrapper': ('00_utils/utils.html#datasetwrapper', 'ddopai/utils.py'),
                               'ddopai.utils.DatasetWrapper.__getitem__': ( '00_utils/utils.html#datasetwrapper.__getitem__',
                                                                            'ddopai/utils.py'),
                               'ddopai.utils.DatasetWrapper.__init__': ('00_utils/utils.html#datasetwrapper.__init__', 'ddopai/utils.py'),
@@ -836,5 +1256,7 @@ d = { 'settings': { 'branch': 'main',
                               'ddopai.utils.Parameter.shape': ('00_utils/utils.html#parameter.shape', 'ddopai/utils.py'),
                               'ddopai.utils.Parameter.size': ('00_utils/utils.html#parameter.size', 'ddopai/utils.py'),
                               'ddopai.utils.check_parameter_types': ('00_utils/utils.html#check_parameter_types', 'ddopai/utils.py'),
+                              'ddopai.utils.get_rng_state': ('00_utils/utils.html#get_rng_state', 'ddopai/utils.py'),
                               'ddopai.utils.merge_dictionaries': ('00_utils/utils.html#merge_dictionaries', 'ddopai/utils.py'),
-                              'ddopai.utils.set_param': ('00_utils/utils.html#set_param', 'ddopai/utils.py')}}}
+                              'ddopai.utils.set_param': ('00_utils/utils.html#set_param', 'ddopai/utils.py'),
+                              'ddopai.utils.set_rng_state': ('00_utils/utils.html#set_rng_state', 'ddopai/utils.py')}}}
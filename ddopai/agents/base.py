@@ -1,11 +1,11 @@
 """Base agent that all agents shall inherit from"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_base_agents/10_base_agents.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/30_agents/40_base_agents/10_base_agents.ipynb.
 
 # %% auto 0
 __all__ = ['BaseAgent']
 
-# %% ../../nbs/40_base_agents/10_base_agents.ipynb 3
+# %% ../../nbs/30_agents/40_base_agents/10_base_agents.ipynb 3
 # import logging
 # logging_level = logging.DEBUG
 
@@ -15,13 +15,14 @@ import numpy as np
 
 from ..envs.base import BaseEnvironment
 from ..utils import MDPInfo, Parameter
+from ..profiling import PROFILER
 import numbers
 
 # # TEMPORARY
 # from sklearn.utils.validation import check_array
 # import numbers
 
-# %% ../../nbs/40_base_agents/10_base_agents.ipynb 4
+# %% ../../nbs/30_agents/40_base_agents/10_base_agents.ipynb 4
 class BaseAgent():
 
     """  
@@ -30,6 +31,7 @@ class BaseAgent():
     """
 
     train_mode = "direct_fit" # or "epochs_fit" or "env_interaction"
+    supports_action_batching = True # whether draw_action_ returns one action per row of a batch of processed observations
     
     def __init__(self,
                     environment_info: MDPInfo,
@@ -54,6 +56,21 @@ class BaseAgent():
         Internal logic of the agent to be implemented in draw_action_ method.
         """
 
+        with PROFILER.timer("agent/obsprocessors"):
+            observation = self.process_observation(observation)
+
+        with PROFILER.timer("agent/draw_action_"):
+            action = self.draw_action_(observation)
+
+        return action
+
+    def process_observation(self, observation: np.ndarray | dict) -> np.ndarray: #
+
+        """
+        Apply the obsprocessors to a single observation from the environment and add the batch dimension
+        (unless receive_batch_dim is True). This is the part of draw_action before draw_action_ is called.
+        """
+
         batch_added = False
         if not isinstance(observation, dict):
             observation = self.add_batch_dim(observation) # adds batch dim if self.receive_batch_dim is False
@@ -65,15 +82,111 @@ class BaseAgent():
                 observation = self.add_batch_dim(observation) # adds batch dim afterwards, if self.receive_batch_dim is False    
                 batch_added = True
 
-        action = self.draw_action_(observation)
+        return observation
 
-        return action
+    def draw_actions(self, observations: np.ndarray | dict) -> np.ndarray: #
+
+        """
+        Draw the actions for a batch of observations, stacked along the first dimension as array or as dict of
+        arrays, and return one action per observation. The obsprocessors are applied once per batch (see
+        process_observations) and the actions are drawn with one call of draw_actions_. If receive_batch_dim is
+        True, the batch dimension of each observation (e.g., SKUs) is merged into the batch and restored in the
+        actions. If the agent does not support action batching, the batch dimensions of the observations differ
+        or the agent does not return one action per observation, the actions are drawn one by one via draw_action.
+        """
+
+        batch_shape = self.get_batch_shape(observations)
+
+        if self.supports_action_batching and batch_shape is not None:
+
+            if self.receive_batch_dim:
+                merged_observations = self.map_observation(lambda value: value.reshape((-1,) + value.shape[2:]), observations)
+            else:
+                merged_observations = observations
+
+            with PROFILER.timer("agent/obsprocessors"):
+                processed_observations = self.process_observations(merged_observations)
+            with PROFILER.timer("agent/draw_action_"):
+                actions = self.draw_actions_(processed_observations)
+
+            if isinstance(actions, np.ndarray) and actions.ndim > 1 and len(actions) == np.prod(batch_shape):
+                return actions.reshape(batch_shape + actions.shape[1:])
+
+        actions = [self.draw_action(observation) for observation in self.unstack_observations(observations)]
+        if not self.receive_batch_dim:
+            actions = [action[0] if action.ndim > 1 and len(action) == 1 else action for action in map(np.asarray, actions)] # remove the batch dimension added by draw_action
+
+        return np.stack(actions)
+
+    def process_observations(self, observations: np.ndarray | dict) -> np.ndarray: #
+
+        """
+        Apply the obsprocessors to a batch of observations. Arrays already have the batch dimension and are
+        processed once per batch. Dicts are processed once per batch by obsprocessors that can handle stacked
+        observations (attribute supports_batching or receive_batch_dim) and observation by observation otherwise.
+        """
+
+        for obsprocessor in self.obsprocessors:
+            if isinstance(observations, dict) and not self.processes_batches(obsprocessor):
+                outputs = [self.map_observation(np.copy, obsprocessor(observation)) for observation in self.unstack_observations(observations)] # obsprocessors may reuse their output array
+                observations = self.stack_observations(outputs)
+            else:
+                observations = obsprocessor(observations)
+
+        return observations
+
+    @staticmethod
+    def processes_batches(obsprocessor: object) -> bool: #
+        """Check if an obsprocessor can process a dict of stacked observations at once"""
+        return getattr(obsprocessor, "supports_batching", False) or getattr(obsprocessor, "receive_batch_dim", False)
+
+    @staticmethod
+    def map_observation(function: callable, observation: np.ndarray | dict) -> np.ndarray | dict: #
+        """Apply a function to an array or to each array of a dict"""
+        if isinstance(observation, dict):
+            return {key: function(value) for key, value in observation.items()}
+        return function(observation)
+
+    @staticmethod
+    def get_batch_size(observations: np.ndarray | dict) -> int: #
+        """Number of observations stacked along the first dimension"""
+        if isinstance(observations, dict):
+            return len(next(iter(observations.values())))
+        return len(observations)
+
+    def get_batch_shape(self, observations: np.ndarray | dict) -> Tuple[int, ...] | None: #
+        """
+        Shape of the batch dimensions, i.e., (n_observations,) or, if receive_batch_dim is True, (n_observations, batch_size)
+        of the observations. None if the observations do not share the same batch size.
+        """
+        if not self.receive_batch_dim:
+            return (self.get_batch_size(observations),)
+        values = list(observations.values()) if isinstance(observations, dict) else [observations]
+        batch_shapes = {value.shape[:2] if value.ndim > 1 else None for value in values}
+        return batch_shapes.pop() if len(batch_shapes) == 1 and None not in batch_shapes else None
+
+    @staticmethod
+    def stack_observations(observations: list) -> np.ndarray | dict: #
+        """Stack a list of observations, arrays or dicts of arrays, along a new first dimension"""
+        if isinstance(observations[0], dict):
+            return {key: np.stack([observation[key] for observation in observations]) for key in observations[0]}
+        return np.stack(observations)
+
+    def unstack_observations(self, observations: np.ndarray | dict) -> list: #
+        """Split a batch of observations into a list of single observations"""
+        if isinstance(observations, dict):
+            return [{key: value[i] for key, value in observations.items()} for i in range(self.get_batch_size(observations))]
+        return list(observations)
 
     @abstractmethod
     def draw_action_(self, observation: np.ndarray) -> np.ndarray: #
         """Generate an action based on the observation - this is the core method that needs to be implemented by all agents."""
         pass
 
+    def draw_actions_(self, observations: np.ndarray) -> np.ndarray: #
+        """Generate the actions for a batch of processed observations. By default, draw_action_ is called on the whole batch (see supports_action_batching)."""
+        return self.draw_action_(observations)
+
     def add_obsprocessor(self, obsprocessor: object): # pre-processor object that can be called via the "__call__" method
         """Add a preprocessor to the agent"""
         self.obsprocessors.append(obsprocessor)
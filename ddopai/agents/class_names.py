@@ -1,11 +1,11 @@
 """Dict of agent classes and (standard) agent names to allow for dynamic loading of agents."""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/40_base_agents/10_AGENT_CLASSES.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/30_agents/40_base_agents/10_AGENT_CLASSES.ipynb.
 
 # %% auto 0
 __all__ = ['AGENT_CLASSES']
 
-# %% ../../nbs/40_base_agents/10_AGENT_CLASSES.ipynb 3
+# %% ../../nbs/30_agents/40_base_agents/10_AGENT_CLASSES.ipynb 3
 AGENT_CLASSES = {
     "RandomAgent": "ddopai.agents.saa.SAA",
 
@@ -30,4 +30,7 @@ AGENT_CLASSES = {
 
     "TD3": "ddopai.agents.rl.td3.TD3Agent",
     "PPO": "ddopai.agents.rl.ppo.PPOAgent",
+
+    "BaseStock": "ddopai.agents.inventory.policies.BaseStockAgent",
+    "sS": "ddopai.agents.inventory.policies.sSPolicyAgent",
 }
@@ -0,0 +1,375 @@
+"""Classical base-stock and (s,S) policies for the MultiPeriodEnv, fitted by simulating bootstrapped demand scenarios"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/42_inventory_agents/10_inventory_policy_agents.ipynb.
+
+# %% auto 0
+__all__ = ['BaseInventoryPolicyAgent', 'BaseStockAgent', 'sSPolicyAgent']
+
+# %% ../../../nbs/30_agents/42_inventory_agents/10_inventory_policy_agents.ipynb 3
+import logging
+
+from abc import abstractmethod
+from typing import Callable, Literal
+import numpy as np
+import os
+
+from ...envs.base import BaseEnvironment
+from ..base import BaseAgent
+from ...utils import MDPInfo, Parameter
+
+# %% ../../../nbs/30_agents/42_inventory_agents/10_inventory_policy_agents.ipynb 4
+class BaseInventoryPolicyAgent(BaseAgent):
+
+    """
+    Base class for classical inventory policies that order up to a level S whenever the inventory position (inventory
+    on hand plus the orders in the pipeline) is at or below a reorder point s. The levels are fitted per SKU by simulating
+    demand scenarios bootstrapped from the training data for many candidate levels at once (see simulate_costs) and
+    searching the levels with the lowest expected cost on a grid or with golden-section search.
+    """
+
+    supports_action_batching = False # observations are dicts with the inventory and the order pipeline
+
+    def __init__(self,
+                environment_info: MDPInfo,
+                underage_cost: np.ndarray | Parameter | int | float = 1, # underage cost per unit
+                holding_cost: np.ndarray | Parameter | int | float = 1, # holding cost per unit
+                fixed_ordering_cost: np.ndarray | Parameter | int | float = 0, # fixed ordering cost per order and SKU
+                variable_ordering_cost: np.ndarray | Parameter | int | float = 0, # variable ordering cost per unit
+                lead_time: np.ndarray | Parameter | int = 1, # fixed lead time per SKU, see OrderPipeline
+                max_inventory: np.ndarray | Parameter | int | float = np.inf, # maximum inventory, excess inventory is lost
+                start_inventory: np.ndarray | Parameter | int | float = 0, # inventory at the start of each simulated scenario
+                n_scenarios: int = 500, # number of simulated demand scenarios
+                simulation_horizon: int | None = None, # periods per scenario, the horizon of environment_info if None
+                block_length: int = 1, # number of consecutive training periods bootstrapped at once, larger values preserve autocorrelation
+                search: Literal["grid", "golden_section"] = "grid", # search method for the levels
+                n_grid: int = 20, # number of grid points per level
+                n_iterations: int = 25, # number of iterations of the golden-section search
+                simulation_batch_size: int = 2**22, # maximum number of candidate x scenario x SKU states simulated at once, bounds the memory
+                seed: int | None = None, # seed for bootstrapping the demand scenarios
+                obsprocessors: list[object] | None = None,
+                agent_name: str | None = None,
+                ):
+
+        super().__init__(environment_info = environment_info, obsprocessors = obsprocessors, agent_name = agent_name)
+
+        self.num_SKUs = environment_info.action_space.shape[-1]
+
+        self.underage_cost = self.to_SKU_array(underage_cost)
+        self.holding_cost = self.to_SKU_array(holding_cost)
+        self.fixed_ordering_cost = self.to_SKU_array(fixed_ordering_cost)
+        self.variable_ordering_cost = self.to_SKU_array(variable_ordering_cost)
+        self.max_inventory = self.to_SKU_array(max_inventory)
+        self.start_inventory = self.to_SKU_array(start_inventory)
+        self.lead_time = np.maximum(np.round(self.to_SKU_array(lead_time)), 1).astype(int) # orders without lead time arrive in the next period as in the OrderPipeline
+
+        self.q_bound_low = self.to_SKU_array(environment_info.action_space.low)
+        self.q_bound_high = self.to_SKU_array(environment_info.action_space.high)
+
+        if simulation_horizon is None:
+            simulation_horizon = environment_info.horizon
+        if not isinstance(simulation_horizon, (int, np.integer)) or simulation_horizon < 1:
+            raise ValueError("simulation_horizon must be a positive integer if the horizon of the environment is not.")
+        if search not in ["grid", "golden_section"]:
+            raise ValueError("search must be 'grid' or 'golden_section'.")
+
+        self.n_scenarios = n_scenarios
+        self.simulation_horizon = int(simulation_horizon)
+        self.block_length = block_length
+        self.search = search
+        self.n_grid = n_grid
+        self.n_iterations = n_iterations
+        self.simulation_batch_size = simulation_batch_size
+        self.rng = np.random.default_rng(seed)
+
+        self.reorder_point = None # s per SKU
+        self.order_up_to_level = None # S per SKU
+        self.fitted = False
+
+    @classmethod
+    def from_env(cls,
+                env: BaseEnvironment, # MultiPeriodEnv whose costs, lead times and inventory limits are used
+                **kwargs # further arguments of the agent
+                ):
+
+        """ Create the agent with the costs, lead times and inventory limits of a MultiPeriodEnv """
+
+        if env.order_pipeline.lead_time_stochasticity != "fixed":
+            logging.warning("Stochastic lead times are simulated with the mean lead time.")
+
+        params = dict(
+            underage_cost=env.underage_cost,
+            holding_cost=env.holding_cost,
+            fixed_ordering_cost=env.fixed_ordering_cost,
+            variable_ordering_cost=env.variable_ordering_cost,
+            lead_time=env.order_pipeline.lead_time_mean,
+            max_inventory=env.max_inventory,
+            start_inventory=env.start_inventory,
+        )
+        params.update(kwargs)
+
+        return cls(env.mdp_info, **params)
+
+    def to_SKU_array(self, value) -> np.ndarray:
+        """ Convert a parameter to a float array with one value per SKU """
+        value = value.get_value() if isinstance(value, Parameter) else value
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.num_SKUs,)).copy()
+
+    def order_quantity(self,
+                inventory_position: np.ndarray, # inventory on hand plus orders in the pipeline, SKUs in the last dimension
+                reorder_point: np.ndarray, # s, broadcastable to inventory_position
+                order_up_to_level: np.ndarray, # S, broadcastable to inventory_position
+                ) -> np.ndarray:
+
+        """ Order up to S if the inventory position is at or below s, within the bounds of the action space """
+
+        order = np.where(inventory_position <= reorder_point, order_up_to_level - inventory_position, 0)
+
+        return np.clip(order, self.q_bound_low, self.q_bound_high)
+
+    def draw_action_(self,
+                    observation: dict, # observation of the MultiPeriodEnv with inventory and order_pipeline
+                    ) -> np.ndarray:
+
+        """ Order quantities of the fitted policy given the inventory and the order pipeline """
+
+        inventory_position = observation["inventory"] + np.sum(observation["order_pipeline"], axis=-2)
+
+        if not self.fitted:
+            return np.zeros_like(inventory_position)
+
+        return self.order_quantity(inventory_position, self.reorder_point, self.order_up_to_level)
+
+    def fit(self,
+            X: np.ndarray, # features will be ignored
+            Y: np.ndarray, # demand of the training periods, shape (periods, SKUs)
+            ) -> None:
+
+        """ Fit the levels of all SKUs on demand scenarios bootstrapped from Y """
+
+        Y = np.asarray(Y, dtype=float).reshape(len(Y), -1)
+        if Y.shape[1] != self.num_SKUs:
+            raise ValueError(f"Y must contain the demand of {self.num_SKUs} SKUs, got {Y.shape[1]}.")
+
+        demand = self.bootstrap_demand(Y)
+        self.reorder_point, self.order_up_to_level = self.search_levels(demand)
+
+        self.fitted = True
+
+    def bootstrap_demand(self,
+                Y: np.ndarray, # demand of the training periods, shape (periods, SKUs)
+                ) -> np.ndarray:
+
+        """ Sample demand scenarios of shape (n_scenarios, simulation_horizon, SKUs) from blocks of consecutive periods of Y """
+
+        if self.block_length > len(Y):
+            raise ValueError("block_length must not be larger than the number of training periods.")
+
+        n_blocks = -(-self.simulation_horizon // self.block_length)
+        starts = self.rng.integers(0, len(Y) - self.block_length + 1, size=(self.n_scenarios, n_blocks))
+        indices = (starts[..., None] + np.arange(self.block_length)).reshape(self.n_scenarios, -1)[:, :self.simulation_horizon]
+
+        return Y[indices]
+
+    def simulate_costs(self,
+                demand: np.ndarray, # demand scenarios of shape (scenarios, periods, SKUs)
+                reorder_point: np.ndarray, # s of each candidate, shape (candidates, SKUs)
+                order_up_to_level: np.ndarray, # S of each candidate, shape (candidates, SKUs)
+                ) -> np.ndarray:
+
+        """
+        Expected discounted cost per SKU of each candidate policy, shape (candidates, SKUs). All candidates and scenarios
+        are simulated at once with the recursion of MultiPeriodEnv.step_: orders arrive after the lead time, inventory is
+        capped at max_inventory, unmet demand is lost. Candidates are simulated in batches of simulation_batch_size states.
+        """
+
+        n_candidates = len(reorder_point)
+        n_scenarios, horizon, n_SKUs = demand.shape
+
+        batch_size = max(1, self.simulation_batch_size // (n_scenarios * n_SKUs))
+        if n_candidates > batch_size:
+            return np.concatenate([self.simulate_costs(demand, reorder_point[i:i+batch_size], order_up_to_level[i:i+batch_size])
+                                   for i in range(0, n_candidates, batch_size)])
+
+        shape = (n_candidates, n_scenarios, n_SKUs)
+        reorder_point, order_up_to_level = reorder_point[:, None], order_up_to_level[:, None]
+
+        inventory = np.broadcast_to(self.start_inventory, shape).copy()
+        in_transit = np.zeros(shape) # orders in the pipeline
+        n_slots = int(self.lead_time.max()) + 1
+        arrivals = np.zeros((n_slots,) + shape) # ring buffer of the orders arriving in the next periods
+        SKUs = np.arange(n_SKUs)
+        cost = np.zeros(shape)
+
+        for t in range(horizon):
+
+            order = self.order_quantity(inventory + in_transit, reorder_point, order_up_to_level)
+
+            arriving = arrivals[t % n_slots].copy()
+            arrivals[t % n_slots] = 0
+            arrivals[(t + self.lead_time) % n_slots, :, :, SKUs] = np.moveaxis(order, -1, 0)
+            in_transit += order - arriving
+
+            inventory = np.minimum(inventory + arriving - demand[:, t], self.max_inventory)
+            underage = np.maximum(-inventory, 0)
+            inventory = np.maximum(inventory, 0)
+
+            cost += self.environment_info.gamma**t * (order * self.variable_ordering_cost + np.where(order > 0, self.fixed_ordering_cost, 0) \
+                + underage * self.underage_cost + inventory * self.holding_cost)
+
+        return cost.mean(axis=1)
+
+    def upper_level_bound(self,
+                demand: np.ndarray, # demand scenarios of shape (scenarios, periods, SKUs)
+                ) -> np.ndarray:
+        """ Upper bound of the levels per SKU: the maximum demand per period over the lead time and one more period """
+        return (self.lead_time + 1) * demand.max(axis=(0, 1))
+
+    def grid_search(self,
+                demand: np.ndarray, # demand scenarios of shape (scenarios, periods, SKUs)
+                reorder_point: np.ndarray, # s of each candidate, shape (candidates, SKUs)
+                order_up_to_level: np.ndarray, # S of each candidate, shape (candidates, SKUs)
+                ) -> tuple[np.ndarray, np.ndarray]:
+
+        """ Return s and S of the candidate with the lowest simulated cost per SKU """
+
+        best = np.argmin(self.simulate_costs(demand, reorder_point, order_up_to_level), axis=0)
+        SKUs = np.arange(self.num_SKUs)
+
+        return reorder_point[best, SKUs], order_up_to_level[best, SKUs]
+
+    def golden_section_search(self,
+                cost_function: Callable, # maps candidates of shape (candidates, SKUs) to costs of the same shape
+                low: np.ndarray, # lower bound per SKU
+                high: np.ndarray, # upper bound per SKU
+                ) -> np.ndarray:
+
+        """ Minimize a cost per SKU within [low, high] for all SKUs at once, assuming it is unimodal """
+
+        ratio = (np.sqrt(5) - 1) / 2
+        low, high = np.array(low, dtype=float), np.array(high, dtype=float)
+
+        for _ in range(self.n_iterations):
+            left, right = high - ratio * (high - low), low + ratio * (high - low)
+            costs = cost_function(np.stack([left, right]))
+            keep_left = costs[0] <= costs[1]
+            low, high = np.where(keep_left, low, left), np.where(keep_left, right, high)
+
+        return (low + high) / 2
+
+    @abstractmethod
+    def search_levels(self,
+                demand: np.ndarray, # demand scenarios of shape (scenarios, periods, SKUs)
+                ) -> tuple[np.ndarray, np.ndarray]:
+        """ Return the reorder points s and order-up-to levels S per SKU with the lowest simulated cost """
+        pass
+
+    def save(self,
+                path: str, # The directory where the file will be saved.
+                overwrite: bool=True): # Allow overwriting; if False, a FileExistsError will be raised if the file exists.
+
+        """ Save the levels to a file in the specified directory """
+
+        if not self.fitted:
+            raise ValueError("Agent has not been fitted yet")
+
+        os.makedirs(path, exist_ok=True)
+
+        full_path = os.path.join(path, "inventory_policy_levels.npz")
+
+        if os.path.exists(full_path):
+            if not overwrite:
+                raise FileExistsError(f"The file {full_path} already exists and will not be overwritten.")
+            else:
+                logging.warning(f"Overwriting file {full_path}")
+
+        np.savez(full_path, reorder_point=self.reorder_point, order_up_to_level=self.order_up_to_level)
+
+    def load(self, path: str): # Only the path to the folder is needed, not the file itself
+
+        """ Load the levels from a file """
+
+        full_path = os.path.join(path, "inventory_policy_levels.npz")
+
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"The file {full_path} does not exist.")
+
+        levels = np.load(full_path)
+        self.reorder_point, self.order_up_to_level = levels["reorder_point"], levels["order_up_to_level"]
+        self.fitted = True
+        logging.info(f"Levels loaded successfully from {full_path}")
+
+# %% ../../../nbs/30_agents/42_inventory_agents/10_inventory_policy_agents.ipynb 8
+class BaseStockAgent(BaseInventoryPolicyAgent):
+
+    """
+    Base-stock policy: each period, order up to the base-stock level S (reorder point s = S). The level is searched
+    per SKU on a grid between zero and the maximum demand over the lead time and one more period, or with
+    golden-section search.
+    """
+
+    def __init__(self,
+                environment_info: MDPInfo,
+                agent_name: str = "BaseStock",
+                **kwargs # arguments of BaseInventoryPolicyAgent
+                ):
+
+        super().__init__(environment_info = environment_info, agent_name = agent_name, **kwargs)
+
+    def search_levels(self, demand: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+
+        """ Return the base-stock levels with the lowest simulated cost as reorder points and order-up-to levels """
+
+        upper = self.upper_level_bound(demand)
+
+        if self.search == "grid":
+            levels = np.linspace(0, 1, self.n_grid)[:, None] * upper
+            return self.grid_search(demand, levels, levels)
+
+        level = self.golden_section_search(lambda levels: self.simulate_costs(demand, levels, levels), np.zeros_like(upper), upper)
+
+        return level, level.copy()
+
+# %% ../../../nbs/30_agents/42_inventory_agents/10_inventory_policy_agents.ipynb 10
+class sSPolicyAgent(BaseInventoryPolicyAgent):
+
+    """
+    (s,S) policy: order up to S whenever the inventory position is at or below s. Fixed ordering costs make it
+    worthwhile to order less often than a base-stock policy. The grid search covers all combinations of s and
+    S - s on n_grid points each, the golden-section search alternates between s and S - s for n_rounds rounds,
+    starting from the best base-stock policy.
+    """
+
+    def __init__(self,
+                environment_info: MDPInfo,
+                n_rounds: int = 2, # rounds of the alternating golden-section search
+                agent_name: str = "sS",
+                **kwargs # arguments of BaseInventoryPolicyAgent
+                ):
+
+        self.n_rounds = n_rounds
+
+        super().__init__(environment_info = environment_info, agent_name = agent_name, **kwargs)
+
+    def search_levels(self, demand: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+
+        """ Return the reorder points and order-up-to levels with the lowest simulated cost """
+
+        upper = self.upper_level_bound(demand)
+        grid = np.linspace(0, 1, self.n_grid)[:, None] * upper
+
+        if self.search == "grid":
+            reorder_point = np.repeat(grid, self.n_grid, axis=0)
+            order_size = np.tile(grid, (self.n_grid, 1)) # S - s
+            return self.grid_search(demand, reorder_point, reorder_point + order_size)
+
+        zeros = np.zeros_like(upper)
+        reorder_point = self.golden_section_search(lambda s: self.simulate_costs(demand, s, s), zeros, upper)
+        order_size = zeros
+
+        for _ in range(self.n_rounds):
+            order_size = self.golden_section_search(
+                lambda q: self.simulate_costs(demand, np.broadcast_to(reorder_point, q.shape), reorder_point + q), zeros, upper)
+            reorder_point = self.golden_section_search(
+                lambda s: self.simulate_costs(demand, s, s + order_size), zeros, upper)
+
+        return reorder_point, reorder_point + order_size
@@ -1,13 +1,13 @@
 """Newsvendor agents based on Empirical Risk Minimization (ERM) principles."""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb.
 
 # %% auto 0
 __all__ = ['NewsvendorXGBAgent', 'SGDBaseAgent', 'NVBaseAgent', 'NewsvendorlERMAgent', 'NewsvendorDLAgent', 'BaseMetaAgent',
            'NewsvendorlERMMetaAgent', 'NewsvendorDLMetaAgent', 'NewsvendorDLTransformerAgent',
            'NewsvendorDLTransformerMetaAgent']
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 3
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 3
 import logging
 
 from abc import ABC, abstractmethod
@@ -24,6 +24,7 @@ from ...envs.base import BaseEnvironment
 from ..base import BaseAgent
 from ...utils import MDPInfo, Parameter, DatasetWrapper, DatasetWrapperMeta
 from ...torch_utils.loss_functions import TorchQuantileLoss, TorchPinballLoss
+from ...profiling import PROFILER
 from ...obsprocessors import FlattenTimeDimNumpy
 from ...dataloaders.base import BaseDataLoader
 from ...ml_utils import LRSchedulerPerStep
@@ -32,7 +33,7 @@ import torch
 
 from torchinfo import summary
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 4
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 4
 class NewsvendorXGBAgent(BaseAgent):
 
     """
@@ -193,7 +194,7 @@ class NewsvendorXGBAgent(BaseAgent):
 
 
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 5
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 5
 class SGDBaseAgent(BaseAgent):
 
     """
@@ -341,44 +342,48 @@ class SGDBaseAgent(BaseAgent):
 
         """ Fit the model for one epoch using the dataloader """
 
-        device = next(self.model.parameters()).device
-        self.model.train()
-        total_loss=0
+        with PROFILER.timer("agent/fit_epoch"):
 
-        for i, output in enumerate(tqdm(self.dataloader)):
-            
-            if len(output)==3:
-                X, y, loss_function_params = output
-            else:
-                X, y = output
-                loss_function_params = None
+            device = next(self.model.parameters()).device
+            self.model.train()
+            total_loss=0
 
-            # convert X and y to float32
-            X = X.type(torch.float32)
-            y = y.type(torch.float32)
-            
-            X, y = X.to(device), y.to(device)
+            for i, output in enumerate(tqdm(self.dataloader)):
+                
+                with PROFILER.timer("agent/optimization_step"):
 
-            self.optimizer.zero_grad()
+                    if len(output)==3:
+                        X, y, loss_function_params = output
+                    else:
+                        X, y = output
+                        loss_function_params = None
 
-            y_pred = self.model(X)
+                    # convert X and y to float32
+                    X = X.type(torch.float32)
+                    y = y.type(torch.float32)
+                    
+                    X, y = X.to(device), y.to(device)
 
-            if loss_function_params is not None:
-                loss = self.loss_function(y_pred, y, **loss_function_params)
-            elif self.loss_function_params is not None:
-                loss = self.loss_function(y_pred, y, **self.loss_function_params)
-            else:
-                loss = self.loss_function(y_pred, y)
+                    self.optimizer.zero_grad()
 
-            loss.backward()
-            self.optimizer.step()
+                    y_pred = self.model(X)
 
-            if self.learning_rate_scheduler is not None:
-                self.learning_rate_scheduler.step()
-        
-            total_loss += loss.item()
-        
-        self.model.eval()
+                    if loss_function_params is not None:
+                        loss = self.loss_function(y_pred, y, **loss_function_params)
+                    elif self.loss_function_params is not None:
+                        loss = self.loss_function(y_pred, y, **self.loss_function_params)
+                    else:
+                        loss = self.loss_function(y_pred, y)
+
+                    loss.backward()
+                    self.optimizer.step()
+
+                    if self.learning_rate_scheduler is not None:
+                        self.learning_rate_scheduler.step()
+                
+                    total_loss += loss.item()
+            
+            self.model.eval()
         
         return total_loss
 
@@ -509,7 +514,7 @@ class SGDBaseAgent(BaseAgent):
             raise RuntimeError(f"An error occurred while loading the model: {e}")
     
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 21
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 21
 class NVBaseAgent(SGDBaseAgent):
 
     """
@@ -582,7 +587,7 @@ class NVBaseAgent(SGDBaseAgent):
         else:
             raise ValueError(f"Loss function {self.loss_function} not supported")
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 24
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 24
 class NewsvendorlERMAgent(NVBaseAgent):
 
     """
@@ -650,7 +655,7 @@ class NewsvendorlERMAgent(NVBaseAgent):
 
         self.model = LinearModel(input_size=input_size, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 31
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 31
 class NewsvendorDLAgent(NVBaseAgent):
 
     """
@@ -722,7 +727,7 @@ class NewsvendorDLAgent(NVBaseAgent):
         from ddopai.approximators import MLP
         self.model = MLP(input_size=input_size, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 37
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 37
 class BaseMetaAgent():
 
     def set_meta_dataloader(
@@ -738,7 +743,7 @@ class BaseMetaAgent():
 
         self.dataloader = torch.utils.data.DataLoader(dataset, **dataloader_params)
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 38
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 38
 class NewsvendorlERMMetaAgent(NewsvendorlERMAgent, BaseMetaAgent):
 
     """
@@ -793,7 +798,7 @@ class NewsvendorlERMMetaAgent(NewsvendorlERMAgent, BaseMetaAgent):
             loss_function=loss_function,
         )
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 39
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 39
 class NewsvendorDLMetaAgent(NewsvendorDLAgent, BaseMetaAgent):
 
     """
@@ -852,7 +857,7 @@ class NewsvendorDLMetaAgent(NewsvendorDLAgent, BaseMetaAgent):
         )
 
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 40
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 40
 class NewsvendorDLTransformerAgent(NVBaseAgent):
 
     """
@@ -932,7 +937,7 @@ class NewsvendorDLTransformerAgent(NVBaseAgent):
         from ddopai.approximators import Transformer
         self.model = Transformer(input_size=input_shape, output_size=output_size, **self.model_params)
 
-# %% ../../../nbs/41_NV_agents/11_NV_erm_agents.ipynb 41
+# %% ../../../nbs/30_agents/41_NV_agents/11_NV_erm_agents.ipynb 41
 class NewsvendorDLTransformerMetaAgent(NewsvendorDLTransformerAgent, BaseMetaAgent):
 
     """
@@ -1,11 +1,11 @@
 """Agents based on Sample Average Approximation (SAA) or weighted Sample Average Approximation (wSAA)"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb.
 
 # %% auto 0
 __all__ = ['BaseSAAagent', 'NewsvendorSAAagent', 'BasewSAAagent', 'NewsvendorRFwSAAagent']
 
-# %% ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb 3
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 3
 import logging
 
 from abc import ABC, abstractmethod
@@ -22,7 +22,7 @@ from ...obsprocessors import FlattenTimeDimNumpy
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.utils.validation import check_array
 
-# %% ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb 4
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 4
 class BaseSAAagent(BaseAgent):
 
     """
@@ -94,7 +94,7 @@ class BaseSAAagent(BaseAgent):
                              % (self.n_features_, n_features))
         return X
 
-# %% ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb 8
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 8
 class NewsvendorSAAagent(BaseSAAagent):
 
     """
@@ -153,6 +153,16 @@ class NewsvendorSAAagent(BaseSAAagent):
 
         return self.quantiles
 
+    def draw_actions_(self,
+                    observations: np.ndarray) -> np.ndarray: #
+        """
+
+        Draw the actions for a batch of observations. The quantiles do not depend on the observation and are repeated for each observation.
+
+        """
+
+        return np.tile(np.reshape(self.draw_action_(observations), (1, -1)), (len(observations), 1))
+
 
     def save(self,
                 path: str, # The directory where the file will be saved.
@@ -198,7 +208,7 @@ class NewsvendorSAAagent(BaseSAAagent):
         except Exception as e:
             raise ValueError(f"An error occurred while loading the file: {e}")
 
-# %% ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb 15
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 16
 class BasewSAAagent(BaseSAAagent):
 
 
@@ -366,7 +376,7 @@ class BasewSAAagent(BaseSAAagent):
         except Exception as e:
             raise ValueError(f"An error occurred while loading the model: {e}")
 
-# %% ../../../nbs/41_NV_agents/10_NV_saa_agents.ipynb 24
+# %% ../../../nbs/30_agents/41_NV_agents/10_NV_saa_agents.ipynb 25
 class NewsvendorRFwSAAagent(BasewSAAagent):
 
     """
@@ -1,11 +1,11 @@
 """Base agent for the integration of mushroom_rl-based agents"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/51_RL_agents/10_mushroom_base_agent.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/30_agents/51_RL_agents/10_mushroom_base_agent.ipynb.
 
 # %% auto 0
 __all__ = ['MushroomBaseAgent']
 
-# %% ../../../nbs/51_RL_agents/10_mushroom_base_agent.ipynb 3
+# %% ../../../nbs/30_agents/51_RL_agents/10_mushroom_base_agent.ipynb 3
 import logging
 
 # set logging level to INFO
@@ -24,7 +24,7 @@ import torch.nn.functional as F
 
 import time
 
-# %% ../../../nbs/51_RL_agents/10_mushroom_base_agent.ipynb 4
+# %% ../../../nbs/30_agents/51_RL_agents/10_mushroom_base_agent.ipynb 4
 class MushroomBaseAgent(BaseAgent):
 
     """
@@ -32,6 +32,7 @@ class MushroomBaseAgent(BaseAgent):
     """
 
     train_mode = "env_interaction"
+    supports_action_batching = False # mushroom agents draw actions for a single observation
     dropout = True # always keep in True for mushroom_RL, dropout is not desired set drop_prob=0.0
     
     def __init__(self, 
@@ -3,14 +3,140 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/10_dataloaders/10_base_dataloader.ipynb.
 
 # %% auto 0
-__all__ = ['BaseDataLoader']
+__all__ = ['find_invalid_values', 'format_invalid_values', 'SharedArrayReference', 'SharedDataLoaderHandle', 'BaseDataLoader']
 
 # %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 3
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Union, List, Tuple, Literal
+import logging
+import copy
+import os
+import shutil
+import tempfile
+from multiprocessing import shared_memory
 
 # %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 4
+def find_invalid_values(
+        array: np.ndarray, # array to scan
+        name: str = "array", # name of the array in the report
+        dim_names: Tuple[str] | None = None, # names of the dimensions of the array, e.g., ("time", "SKU")
+        max_coordinates: int = 10, # maximum number of offending coordinates reported per type of value
+        ) -> List[dict]:
+
+    """
+    Scan an array for NaN and Inf values with one vectorized pass. Returns one report entry per type of
+    invalid value with the number of occurrences and the coordinates of the first occurrences.
+    """
+
+    array = np.asarray(array)
+    if not np.issubdtype(array.dtype, np.inexact): # integer and boolean arrays cannot contain NaN or Inf
+        return []
+
+    invalid = ~np.isfinite(array)
+    if not invalid.any():
+        return []
+
+    dim_names = dim_names or tuple(f"dim_{i}" for i in range(array.ndim))
+    if len(dim_names) != array.ndim:
+        raise ValueError(f"dim_names must have one name per dimension of {name}, got {len(dim_names)} names for {array.ndim} dimensions.")
+
+    coordinates = np.argwhere(invalid)
+    is_nan = np.isnan(array[invalid]) # only evaluated for the invalid values
+
+    report = []
+    for kind, selection in [("nan", is_nan), ("inf", ~is_nan)]:
+        if selection.any():
+            report.append({
+                "array": name,
+                "kind": kind,
+                "count": int(selection.sum()),
+                "coordinates": [dict(zip(dim_names, map(int, coordinate))) for coordinate in coordinates[selection][:max_coordinates]],
+            })
+
+    return report
+
+def format_invalid_values(entry: dict # one entry of the report returned by find_invalid_values
+                        ) -> str:
+
+    """ Format one entry of the report returned by find_invalid_values as a single line """
+
+    coordinates = ", ".join("(" + ", ".join(f"{dim}={idx}" for dim, idx in coordinate.items()) + ")" for coordinate in entry["coordinates"])
+    
+    return f"{entry['array']}: {entry['count']} {entry['kind']} values, first at {coordinates}"
+
+# %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 7
+class SharedArrayReference():
+
+    """
+    Picklable reference to a numpy array in shared memory (name of the block) or in a memory-mapped file (path of the file),
+    replacing the array in the copy of a dataloader that is sent to other processes.
+    """
+
+    def __init__(self,
+            name: str, # name of the shared memory block or path of the memmap file
+            shape: tuple, # shape of the array
+            dtype: str, # dtype of the array
+            ) -> None:
+
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+class SharedDataLoaderHandle():
+
+    """
+    Picklable handle to a dataloader whose arrays are placed in shared memory or memory-mapped files, see
+    BaseDataLoader.to_shared. Other processes rebuild the dataloader with BaseDataLoader.attach_shared(handle).
+    The process that created the handle owns the memory and must release it when all other processes are done,
+    either with release() or by using the handle as a context manager.
+    """
+
+    def __init__(self,
+            shell: object, # copy of the dataloader with SharedArrayReference objects instead of arrays
+            backend: Literal["shared_memory", "memmap"], # where the arrays are stored
+            blocks: List[shared_memory.SharedMemory] | None = None, # shared memory blocks (shared_memory backend)
+            files: List[str] | None = None, # memmap files (memmap backend)
+            directory: str | None = None, # temporary directory of the memmap files, removed on release
+            ) -> None:
+
+        self.shell = shell
+        self.backend = backend
+        self.blocks = blocks or []
+        self.files = files or []
+        self.directory = directory
+        self.owner_pid = os.getpid()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["blocks"] = [] # the blocks stay open in the owner, other processes attach by name
+        return state
+
+    def release(self) -> None:
+
+        """ Free the shared memory blocks or delete the memmap files. Only the owner process can release the data """
+
+        if os.getpid() != self.owner_pid:
+            raise ValueError("Only the process that created the handle can release the shared data.")
+
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        for file in self.files:
+            if os.path.exists(file):
+                os.remove(file)
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+        self.blocks, self.files, self.directory = [], [], None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+# %% ../../nbs/10_dataloaders/10_base_dataloader.ipynb 8
 class BaseDataLoader(ABC):
    
     """
@@ -20,8 +146,53 @@ class BaseDataLoader(ABC):
     inventory levels) is to be added from within the environment
     """
 
+    validated = False # True if validate_data found no NaN or Inf values in the stored data
+    SKU_chunk = None # if set, val and test items only contain these SKUs, see set_SKU_chunk
+
     def __init__(self):
         self.dataset_type = "train"
+        self.validate_data()
+
+    def arrays_to_validate(self) -> dict | None:
+
+        """
+        Returns the stored arrays that are scanned by validate_data as a dict of the form
+        {name: (array, dimension names)}. Dataloaders that generate data on the fly and
+        store no data return an empty dict. The default None means that the data cannot be
+        validated up front, environments then check every observation.
+        """
+
+        return None
+
+    def validate_data(self,
+                max_coordinates: int = 10 # maximum number of offending coordinates reported per array and type of value
+                ) -> List[dict] | None:
+
+        """
+        Scans all stored arrays for NaN and Inf values with one vectorized pass per array (called at the end of the
+        construction of the dataloader). The report is stored under self.validation_report and self.validated is set
+        to True if no invalid values were found. Call again after modifying the stored data.
+        """
+
+        arrays = self.arrays_to_validate()
+
+        if arrays is None:
+            self.validation_report = None
+            self.validated = False
+            return None
+
+        report = []
+        for name, (array, dim_names) in arrays.items():
+            if array is not None:
+                report.extend(find_invalid_values(array, name, dim_names, max_coordinates))
+
+        if len(report) > 0:
+            logging.warning("Invalid values found in the data of the dataloader:\n%s", "\n".join(format_invalid_values(entry) for entry in report))
+
+        self.validation_report = report
+        self.validated = len(report) == 0
+
+        return report
 
     @abstractmethod
     def __len__(self):
@@ -127,6 +298,114 @@ class BaseDataLoader(ABC):
         pass
 
         
+    def get_batch(self,
+                indices: np.ndarray # indices of the samples to return
+                ):
+
+        """
+        Returns the X and Y data for several indices at once, stacked along a new first dimension.
+        This default implementation loops over __getitem__, dataloaders should overwrite it with a
+        vectorized version where possible.
+        """
+
+        items = [self[int(idx)] for idx in indices]
+        X = None if items[0][0] is None else np.stack([X_item for X_item, _ in items])
+        Y = np.stack([Y_item for _, Y_item in items])
+
+        return X, Y
+
+    def get_mask(self,
+                idx: int # index of the sample
+                ) -> np.ndarray | None:
+
+        """
+        Returns the availability of the units at idx (1 if available, 0 otherwise), such that environments can
+        restrict the per-unit computations to the available units. None if all units are always available.
+        """
+
+        return None
+
+    def set_SKU_chunk(self,
+                SKU_chunk: slice | None # SKUs (positions among the SKUs of the current dataset type) returned by __getitem__, all SKUs if None
+                ) -> None:
+
+        """
+        Restrict the val and test items to a chunk of SKUs, such that environments can evaluate many SKUs chunk by chunk
+        with bounded memory. Only supported by dataloaders that put the SKUs into the last dimension of the features.
+        """
+
+        raise NotImplementedError(f"{type(self).__name__} does not support SKU chunks.")
+
+    def to_shared(self,
+                backend: Literal["shared_memory", "memmap"] = "shared_memory", # place the arrays in shared memory or in memory-mapped files
+                directory: str | None = None, # directory of the memmap files, a new temporary directory if None
+                ) -> SharedDataLoaderHandle:
+
+        """
+        Place all numpy array attributes of the dataloader in shared memory or memory-mapped files and return a picklable
+        handle. Other processes rebuild the dataloader with attach_shared(handle), referencing the same pages instead of
+        building or unpickling their own copy. The dataloader itself is not changed. The calling process must release
+        the handle when all other processes are done.
+        """
+
+        if backend not in ["shared_memory", "memmap"]:
+            raise ValueError("backend must be 'shared_memory' or 'memmap'")
+
+        shell = copy.copy(self)
+        blocks, files = [], []
+        temporary_directory = tempfile.mkdtemp(prefix="ddopai_") if backend == "memmap" and directory is None else None
+
+        try:
+            for name, value in vars(self).items():
+                if not isinstance(value, np.ndarray) or value.nbytes == 0 or value.dtype.hasobject:
+                    continue
+                if backend == "shared_memory":
+                    block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+                    np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+                    blocks.append(block)
+                    location = block.name
+                else:
+                    location = os.path.join(directory or temporary_directory, f"{type(self).__name__}_{id(self)}_{name}.npy")
+                    array = np.lib.format.open_memmap(location, mode="w+", dtype=value.dtype, shape=value.shape)
+                    array[...] = value
+                    array.flush()
+                    del array
+                    files.append(location)
+                setattr(shell, name, SharedArrayReference(location, value.shape, value.dtype.str))
+        except Exception:
+            SharedDataLoaderHandle(shell, backend, blocks, files, temporary_directory).release()
+            raise
+
+        return SharedDataLoaderHandle(shell, backend, blocks, files, temporary_directory)
+
+    @staticmethod
+    def attach_shared(handle: SharedDataLoaderHandle # handle returned by to_shared
+                    ) -> "BaseDataLoader":
+
+        """
+        Rebuild a dataloader from a handle returned by to_shared. The arrays reference the shared pages and are read-only.
+        Shared memory blocks stay attached as long as the returned dataloader lives.
+        """
+
+        dataloader = copy.copy(handle.shell)
+        blocks = []
+
+        for name, value in vars(handle.shell).items():
+            if not isinstance(value, SharedArrayReference):
+                continue
+            if handle.backend == "shared_memory":
+                block = shared_memory.SharedMemory(name=value.name)
+                array = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=block.buf)
+                blocks.append(block)
+            else:
+                array = np.load(value.name, mmap_mode="r")
+            array.flags.writeable = False
+            setattr(dataloader, name, array)
+
+        dataloader.shared_memories = blocks # set last, such that the arrays are released before the blocks
+
+        return dataloader
+
     def train(self):
 
         """
@@ -20,6 +20,12 @@ class BaseDistributionDataLoader(BaseDataLoader):
     def __init__(self):
         super().__init__()
 
+    def arrays_to_validate(self) -> dict:
+
+        """ Data is generated on the fly, hence no stored data needs to be validated """
+
+        return {}
+
 # %% ../../nbs/10_dataloaders/11_distribution_loaders.ipynb 5
 class NormalDistributionDataLoader(BaseDistributionDataLoader):
 
@@ -61,6 +67,21 @@ class NormalDistributionDataLoader(BaseDistributionDataLoader):
 
         return None, Y
 
+    def get_batch(self, indices):
+
+        """
+        Samples one datapoint per index from the distribution at once.
+        """
+
+        Y = np.random.normal(self.mean, self.std, (len(indices), self.num_units))
+
+        if self.truncated_low is not None:
+            Y = np.maximum(Y, self.truncated_low)
+        if self.truncated_high is not None:
+            Y = np.minimum(Y, self.truncated_high)
+
+        return None, Y
+
     def __len__(self):
         """
         Returns the length of the distribution. As the distribution is generated on the fly, the length is not defined.
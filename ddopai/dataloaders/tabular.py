@@ -38,10 +38,12 @@ class XYDataLoader(BaseDataLoader):
         test_index_start: Union[int, None] = None, 
         lag_window_params: Union[dict] = None, # default: {'lag_window': 0, 'include_y': False, 'pre_calc': False}
         normalize_features: Union[dict] = None, # default: {'normalize': True, 'ignore_one_hot': True}
+        mask: Union[np.ndarray, None] = None, # availability of the units with the shape of Y (1 if available), see get_mask
     ):
 
         self.X = X
         self.Y = Y
+        self.mask = None if mask is None else np.asarray(mask).reshape(len(Y), -1) # trimmed together with Y in prep_lag_features
 
         self.val_index_start = val_index_start
         self.test_index_start = test_index_start
@@ -72,10 +74,21 @@ class XYDataLoader(BaseDataLoader):
 
         assert len(X) == len(Y), 'X and Y must have the same length'
 
+        if self.mask is not None and self.mask.shape != self.Y.shape:
+            raise ValueError(f"mask must have the shape of Y {self.Y.shape}, but got {self.mask.shape}")
+
         self.num_units = Y.shape[1] # shape 0 is alsways time, shape 1 is the number of units (e.g., SKUs)
 
         super().__init__()
 
+    def arrays_to_validate(self) -> dict:
+
+        """ Return X and Y with the names of their dimensions for the up-front validation of the data """
+
+        X_dims = ("time", "lag", "feature") if len(self.X.shape) == 3 else ("time", "feature")
+
+        return {"X": (self.X, X_dims), "Y": (self.Y, ("time", "SKU"))}
+
     def normalize_features(self,
         normalize: bool = True,
         ignore_one_hot: bool = True,
@@ -136,6 +149,8 @@ class XYDataLoader(BaseDataLoader):
                 self.X = np.concatenate((self.X, np.roll(self.Y, 1, axis=0)), axis=1)
                 self.X = self.X[1:] # remove first row
                 self.Y = self.Y[1:] # remove first row
+                if self.mask is not None:
+                    self.mask = self.mask[1:]
                 
                 self.val_index_start = self.val_index_start-1
                 self.test_index_start = self.test_index_start-1
@@ -153,6 +168,8 @@ class XYDataLoader(BaseDataLoader):
                     X_lag[i:, self.lag_window-i, :] = features
                 self.X = X_lag[self.lag_window:]
                 self.Y = self.Y[self.lag_window:]
+                if self.mask is not None:
+                    self.mask = self.mask[self.lag_window:]
 
                 self.val_index_start = self.val_index_start-self.lag_window
                 self.test_index_start = self.test_index_start-self.lag_window
@@ -199,6 +216,50 @@ class XYDataLoader(BaseDataLoader):
 
         return self.X[idx], self.Y[idx]
 
+    def get_batch(self, indices):
+
+        """ get items for an array of indices at once, depending on the dataset type (train, val, test)"""
+
+        indices = self.get_data_indices(indices)
+
+        return self.X[indices], self.Y[indices]
+
+    def get_mask(self, idx):
+
+        """ get the availability of the units at idx (or an array of indices), None if no mask is given """
+
+        if self.mask is None:
+            return None
+
+        return self.mask[self.get_data_indices(idx)]
+
+    def get_data_indices(self, indices):
+
+        """ map indices of the current dataset type (train, val, test) to rows of the data """
+
+        indices = np.asarray(indices, dtype=int)
+
+        if self.dataset_type == "train":
+            if np.any(indices > self.train_index_end):
+                raise IndexError(f'index {indices.max()} out of range{self.train_index_end}')
+
+        elif self.dataset_type == "val":
+            indices = indices + self.val_index_start
+
+            if np.any(indices >= self.test_index_start):
+                raise IndexError(f'index{indices.max()} out of range{self.test_index_start}')
+
+        elif self.dataset_type == "test":
+            indices = indices + self.test_index_start
+
+            if np.any(indices >= len(self.X)):
+                raise IndexError(f'index{indices.max()} out of range{len(self.X)}')
+
+        else:
+            raise ValueError('dataset_type not set')
+
+        return indices
+
     def __len__(self):
         return len(self.X)
     
@@ -267,7 +328,7 @@ class XYDataLoader(BaseDataLoader):
             raise ValueError('dataset_type not recognized')
         
 
-# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 18
+# %% ../../nbs/10_dataloaders/12_tabular_dataloaders.ipynb 25
 class MultiShapeLoader(BaseDataLoader):
 
     """
@@ -519,6 +580,31 @@ class MultiShapeLoader(BaseDataLoader):
 
         super().__init__()
 
+    def arrays_to_validate(self) -> dict:
+
+        """ Return all stored arrays (including out-of-sample SKUs) with the names of their dimensions for the up-front validation of the data """
+
+        arrays = {
+            "demand": (self.demand, ("time", "SKU")),
+            "demand_lag": (self.demand_lag, ("time", "SKU")),
+            "SKU_features": (self.SKU_features, ("SKU", "feature")),
+            "time_features": (self.time_features, ("time", "feature")),
+            "time_SKU_features": (self.time_SKU_features, ("time", "column")),
+            "mask": (self.mask, ("time", "SKU")),
+        }
+
+        if self.out_of_sample:
+            for split in ["val", "test"]:
+                arrays.update({
+                    f"demand_out_of_sample_{split}": (getattr(self, f"demand_out_of_sample_{split}"), ("time", "SKU")),
+                    f"demand_lag_out_of_sample_{split}": (getattr(self, f"demand_lag_out_of_sample_{split}"), ("time", "SKU")),
+                    f"SKU_features_out_of_sample_{split}": (getattr(self, f"SKU_features_out_of_sample_{split}"), ("SKU", "feature")),
+                    f"time_SKU_features_out_of_sample_{split}": (getattr(self, f"time_SKU_features_out_of_sample_{split}"), ("time", "column")),
+                    f"mask_out_of_sample_{split}": (getattr(self, f"mask_out_of_sample_{split}"), ("time", "SKU")),
+                })
+
+        return arrays
+
     def set_train_subset(self, train_subset, train_subset_SKUs):
         """ Prepare setting the attributes train_subset and train_subset_SKUs """
 
@@ -1010,6 +1096,9 @@ class MultiShapeLoader(BaseDataLoader):
         else:
             raise ValueError('dataset_type not set')
 
+        if self.dataset_type != "train" and self.SKU_chunk is not None:
+            idx_skus = idx_skus[self.SKU_chunk]
+
         return idx_time, idx_skus
 
     def __getitem__(self, idx: int):
@@ -1147,6 +1236,28 @@ class MultiShapeLoader(BaseDataLoader):
  
         return item, demand
 
+    def set_SKU_chunk(self, SKU_chunk: slice | None):
+
+        """ restrict val and test items to a chunk of the SKUs of the current SKU type, all SKUs if None """
+
+        self.SKU_chunk = SKU_chunk
+
+    def get_mask(self, idx: int):
+
+        """ get the availability of the SKUs at idx, depending on the dataset type (train, val, test), None if no mask is given """
+
+        if self.mask is None:
+            return None
+
+        if self.dataset_type != "train" and self.return_SKU_type != "in_sample":
+            mask = getattr(self, f"mask_{self.return_SKU_type}") # mask_out_of_sample_val or mask_out_of_sample_test
+        else:
+            mask = self.mask
+
+        idx_time, idx_skus = self.get_time_SKU_idx(idx)
+
+        return mask[idx_time, idx_skus]
+
     def __len__(self):
         return len(self.demand)
     
@@ -1,12 +1,14 @@
 """Class to load datasets available in GitHub releases of this repository."""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/80_datasets/default_datasets.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/90_datasets/default_datasets.ipynb.
 
 # %% auto 0
-__all__ = ['get_all_release_tags', 'get_release_tag', 'get_dataset_url', 'get_asset_url', 'download_file_from_github',
-           'unzip_file', 'load_data_from_directory', 'DatasetLoader']
+__all__ = ['columnar_cache_dir', 'get_all_release_tags', 'get_release_tag', 'select_release_tag', 'get_dataset_asset',
+           'get_dataset_url', 'get_asset_url', 'sha256_file', 'fetch_file', 'download_file_from_github', 'unzip_file',
+           'file_signature', 'save_columnar', 'load_columnar', 'load_csv_cached', 'load_data_from_directory',
+           'DatasetLoader']
 
-# %% ../../nbs/80_datasets/default_datasets.ipynb 3
+# %% ../../nbs/90_datasets/default_datasets.ipynb 3
 import numpy as np
 import logging
 import requests
@@ -14,9 +16,14 @@ import os
 import re
 import pandas as pd
 import zipfile
-
-
-# %% ../../nbs/80_datasets/default_datasets.ipynb 6
+import hashlib
+import json
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# %% ../../nbs/90_datasets/default_datasets.ipynb 6
 def get_all_release_tags(token=None):
     url = "https://api.github.com/repos/opimwue/ddopai/releases"
     headers = {'Authorization': f'Bearer {token}'} if token else {}
@@ -30,10 +37,15 @@ def get_all_release_tags(token=None):
         raise ValueError(f"Failed to fetch releases: {response.status_code} with message: {response.text}")
 
 def get_release_tag(dataset_type, version, token=None):
-    release_tags = get_all_release_tags(token)
+    release_tags = get_all_release_tags(token) if version == "latest" else []
+    return select_release_tag(release_tags, dataset_type, version)
+
+def select_release_tag(release_tags, dataset_type, version):
     release_tags_filtered = [tag for tag in release_tags if dataset_type in tag]
 
     if version == "latest":
+        if len(release_tags_filtered) == 0:
+            raise ValueError(f"No release found for dataset type {dataset_type}")
         release_tags_filtered.sort(key=lambda x: [int(num) if num.isdigit() else num for num in re.findall(r'\d+|\D+', x.split('_v')[-1])])
         release_tag = release_tags_filtered[-1]
     else:
@@ -42,7 +54,7 @@ def get_release_tag(dataset_type, version, token=None):
     logging.debug(f"Filtered release tags: {release_tags_filtered}")
     return release_tag
 
-def get_dataset_url(dataset_type, dataset_number, release_tag, token=None):
+def get_dataset_asset(dataset_type, dataset_number, release_tag, token=None):
     api_url = f"https://api.github.com/repos/opimwue/ddopai/releases/tags/{release_tag}"
     headers = {'Authorization': f'Bearer {token}'} if token else {}
     response = requests.get(api_url, headers=headers)
@@ -62,57 +74,211 @@ def get_dataset_url(dataset_type, dataset_number, release_tag, token=None):
             raise ValueError(f"Multiple datasets found for {dataset_type}_dataset_{dataset_number} in release {release_tag}")
         else:
             asset = assets[0]
-            return asset['browser_download_url']
+            # GitHub reports the checksum as "sha256:<hex>" for newer assets, older assets have no digest
+            digest = asset.get("digest") or ""
+            sha256 = digest.split(":", 1)[1] if digest.startswith("sha256:") else None
+            return {"name": asset['name'], "url": asset['browser_download_url'], "sha256": sha256}
     else:
         raise ValueError(f"Failed to fetch release information: {response.status_code} with message: {response.text}")
 
+def get_dataset_url(dataset_type, dataset_number, release_tag, token=None):
+    return get_dataset_asset(dataset_type, dataset_number, release_tag, token)["url"]
+
 def get_asset_url(dataset_type, dataset_number, version="latest", token=None):
     release_tag = get_release_tag(dataset_type, version, token)
     asset_url = get_dataset_url(dataset_type, dataset_number, release_tag, token)
     return asset_url
 
-def download_file_from_github(url, output_path, token=None):
-    headers = {'Authorization': f'Bearer {token}'} if token else {}
-    response = requests.get(url, headers=headers, stream=True)
-    if response.status_code == 200:
-        with open(output_path, 'wb') as file:
-            for chunk in response.iter_content(chunk_size=1024):
-                if chunk:
-                    file.write(chunk)
-        logging.debug(f"File downloaded successfully: {output_path}")
-    else:
-        logging.error(f"Failed to download file: {response.status_code}")
-
-def unzip_file(zip_file_path, output_dir, delete_zip_file=True):
-    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-        zip_ref.extractall(output_dir)
+def sha256_file(path, chunk_size=1024*1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def fetch_file(source, output_path, token=None, sha256=None):
+
+    """ Copy a file from a URL or local path to output_path. The file is first written to a
+    temporary file in the target directory, verified against sha256 (if given) and then
+    moved into place, such that output_path never holds a partial download.
+    Returns the SHA-256 of the file. """
+
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_path) or ".", suffix=".part")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            if re.match(r"^https?://", source):
+                headers = {'Authorization': f'Bearer {token}'} if token else {}
+                with requests.get(source, headers=headers, stream=True) as response:
+                    if response.status_code != 200:
+                        raise ValueError(f"Failed to download file {source}: {response.status_code}")
+                    for chunk in response.iter_content(chunk_size=1024*1024):
+                        if chunk:
+                            digest.update(chunk)
+                            file.write(chunk)
+            else:
+                source = source[len("file://"):] if source.startswith("file://") else source
+                with open(source, 'rb') as source_file:
+                    for chunk in iter(lambda: source_file.read(1024*1024), b""):
+                        digest.update(chunk)
+                        file.write(chunk)
+        if sha256 is not None and digest.hexdigest() != sha256:
+            raise ValueError(f"Checksum mismatch for {source}: expected {sha256}, got {digest.hexdigest()}")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logging.debug(f"File downloaded successfully: {output_path}")
+    return digest.hexdigest()
+
+def download_file_from_github(url, output_path, token=None, sha256=None):
+    return fetch_file(url, output_path, token=token, sha256=sha256)
+
+def unzip_file(zip_file_path, output_dir, delete_zip_file=True, columnar=False):
+
+    """ Extract a zip file. With columnar=True, csv members are parsed directly from the zip
+    stream into the columnar cache of output_dir instead of being extracted. """
+
+    # extract next to the target and swap it in, such that an interrupted extraction leaves no partial directory
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(output_dir)), suffix=".part")
+    try:
+        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+            for member in zip_ref.infolist():
+                if columnar and not member.is_dir() and member.filename.endswith(".csv"):
+                    key = os.path.splitext(os.path.basename(member.filename))[0]
+                    with zip_ref.open(member) as file:
+                        save_columnar(pd.read_csv(file), os.path.join(tmp_dir, columnar_cache_dir), key, source=None)
+                else:
+                    zip_ref.extract(member, tmp_dir)
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)
+        os.replace(tmp_dir, output_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
     if delete_zip_file:
         os.remove(zip_file_path)
 
-def load_data_from_directory(dir):
-    data = dict()
+columnar_cache_dir = ".columnar" # hidden subdirectory of a dataset directory holding the converted csv files
+
+def file_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def save_columnar(df, cache_dir, key, source):
+
+    """ Save a DataFrame to the columnar cache. Frames with a single numeric dtype are stored as
+    .npy (memory-mappable), other frames as pickle. source is the signature of the original csv
+    file (or None if the frame has no file on disk, e.g., when streamed from a zip file). """
+
+    os.makedirs(cache_dir, exist_ok=True)
+    dtypes = set(df.dtypes)
+    homogeneous = len(df.columns) > 0 and len(dtypes) == 1 and next(iter(dtypes)).kind in "biuf"
+    data_path = os.path.join(cache_dir, f"{key}.npy" if homogeneous else f"{key}.pkl")
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+    with os.fdopen(fd, 'wb') as file:
+        if homogeneous:
+            np.save(file, df.to_numpy())
+        else:
+            pd.to_pickle(df, file)
+    os.replace(tmp_path, data_path)
+    stale_path = os.path.join(cache_dir, f"{key}.pkl" if homogeneous else f"{key}.npy")
+    if os.path.exists(stale_path):
+        os.remove(stale_path)
+
+    # the meta file is written last and marks the entry as complete
+    meta = {"source": source, "format": "npy" if homogeneous else "pkl", "index": df.index, "columns": df.columns}
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+    with os.fdopen(fd, 'wb') as file:
+        pd.to_pickle(meta, file)
+    os.replace(tmp_path, os.path.join(cache_dir, f"{key}.meta.pkl"))
+
+def load_columnar(cache_dir, key, mmap_mode="c"):
+
+    """ Load a DataFrame from the columnar cache, .npy entries are memory-mapped. """
+
+    meta = pd.read_pickle(os.path.join(cache_dir, f"{key}.meta.pkl"))
+    if meta["format"] == "npy":
+        values = np.load(os.path.join(cache_dir, f"{key}.npy"), mmap_mode=mmap_mode)
+        return pd.DataFrame(values, index=meta["index"], columns=meta["columns"], copy=False)
+    return pd.read_pickle(os.path.join(cache_dir, f"{key}.pkl"))
+
+def load_csv_cached(path, mmap_mode="c"):
+
+    """ Load a csv file through the columnar cache next to it. The csv file is converted on the first
+    load and again whenever its content changes (checked via size and mtime, then SHA-256). """
+
+    cache_dir = os.path.join(os.path.dirname(path), columnar_cache_dir)
+    key = os.path.splitext(os.path.basename(path))[0]
+    meta_path = os.path.join(cache_dir, f"{key}.meta.pkl")
+    signature = file_signature(path)
+
+    if os.path.exists(meta_path):
+        meta = pd.read_pickle(meta_path)
+        source = meta["source"]
+        if source is not None and {k: source[k] for k in signature} == signature:
+            return load_columnar(cache_dir, key, mmap_mode)
+        if source is not None and source["size"] == signature["size"] and source["sha256"] == sha256_file(path):
+            # only the mtime changed (e.g. the file was copied), refresh the signature without converting again
+            meta["source"] = {**signature, "sha256": source["sha256"]}
+            pd.to_pickle(meta, meta_path)
+            return load_columnar(cache_dir, key, mmap_mode)
+
+    logging.debug(f"Converting {path} to columnar cache")
+    df = pd.read_csv(path)
+    try:
+        save_columnar(df, cache_dir, key, source={**signature, "sha256": sha256_file(path)})
+    except OSError as e:
+        logging.warning(f"Could not write columnar cache for {path}: {e}")
+        return df
+    return load_columnar(cache_dir, key, mmap_mode)
+
+def load_data_from_directory(dir,
+        use_cache=True, # Whether to convert csv files to the columnar cache on first load and read from it afterwards
+        mmap_mode="c", # Memory-map mode for .npy data, "c" (copy-on-write) keeps in-place changes private, None loads into memory
+        max_workers=None # Number of threads to load files concurrently, None uses the default of ThreadPoolExecutor
+        ):
+    loaders = dict()
     for file in os.listdir(dir):
+        path = os.path.join(dir, file)
+        key = os.path.splitext(file)[0]
+        if file.startswith("."):
+            continue
         if file.endswith(".csv"):
-            key = os.path.splitext(file)[0]
-            data[key] = pd.read_csv(os.path.join(dir, file))
+            loaders[key] = (load_csv_cached, path, mmap_mode) if use_cache else (pd.read_csv, path)
         elif file.endswith(".pkl"):
-            key = os.path.splitext(file)[0]
-            data[key] = pd.read_pickle(os.path.join(dir, file))
+            loaders[key] = (pd.read_pickle, path)
         elif file.endswith(".npy"):
-            key = os.path.splitext(file)[0]
-            data[key] = np.load(os.path.join(dir, file))
+            loaders[key] = (np.load, path, mmap_mode)
         else:
             raise ValueError(f"File {file} is not a valid file type (csv, pkl, or npy)")
-    
-    return data
 
+    # csv files that were streamed from a zip file only exist in the columnar cache
+    cache_dir = os.path.join(dir, columnar_cache_dir)
+    if os.path.isdir(cache_dir):
+        for file in os.listdir(cache_dir):
+            if file.endswith(".meta.pkl"):
+                key = file[:-len(".meta.pkl")]
+                if key not in loaders:
+                    loaders[key] = (load_columnar, cache_dir, key, mmap_mode)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(*loader) for key, loader in loaders.items()}
+        data = {key: future.result() for key, future in futures.items()}
 
-# %% ../../nbs/80_datasets/default_datasets.ipynb 8
+    return data
+
+# %% ../../nbs/90_datasets/default_datasets.ipynb 8
 class DatasetLoader():
 
     """
-    Class to load datasets from the GitHub repository.
+    Class to load datasets from the GitHub repository. Release tags, asset URLs and SHA-256
+    checksums are cached in a local manifest, such that datasets that are already on disk
+    are loaded without any network call.
     """
 
     dataset_types_univariate = [
@@ -124,9 +290,19 @@ class DatasetLoader():
         "ar_1",
     ]
     
-    def __init__(self):
-        pass
-    
+    def __init__(self,
+            data_dir: str = "data", # Directory where datasets and the manifest are stored
+            mirror: str = None, # Local directory or base URL serving the release assets as <mirror>/<release_tag>/<asset_name>
+            manifest_ttl: float = 24*3600, # Seconds after which the cached list of release tags is refreshed
+            offline: bool = False # If True, never contact GitHub and only use the manifest, the mirror and data on disk
+            ):
+        self.data_dir = data_dir
+        self.mirror = mirror.rstrip("/") if mirror is not None else None
+        self.manifest_ttl = manifest_ttl
+        self.offline = offline
+        self.manifest_path = os.path.join(data_dir, "manifest.json")
+        self.manifest = None
+
     def show_dataset_types(self,
             show_num_datasets_per_type=False # Whether to show the number of datasets per type
             ):
@@ -157,31 +333,136 @@ class DatasetLoader():
         if dataset_type not in self.dataset_types_univariate and dataset_type not in self.dataset_types_multivariate:
             raise ValueError(f"Dataset type {dataset_type} is not valid. Use the function show_dataset_types() to see valid dataset types.")
 
-        asset_url = get_asset_url(dataset_type, dataset_number, version=version, token=token)
+        output_file_path = os.path.join(self.data_dir, f"{dataset_type}_dataset_{dataset_number}")
 
+        # check if the dataset has already been downloaded
+        if os.path.exists(output_file_path) and not overwrite:
+            logging.info(f"Dataset {dataset_type}_dataset_{dataset_number} has already been downloaded, keeping existing dataset.")
+            return load_data_from_directory(output_file_path)
+        if os.path.exists(output_file_path):
+            logging.warning(f"Dataset {dataset_type}_dataset_{dataset_number} has already been downloaded, overwriting dataset.")
 
-        # check if folder "data" exists, if not create it
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        os.makedirs(self.data_dir, exist_ok=True)
 
-        output_file_path = f"data/{dataset_type}_dataset_{dataset_number}"
+        release_tag = self.resolve_release_tag(dataset_type, version, token=token)
+        asset = self.resolve_asset(dataset_type, dataset_number, release_tag, token=token)
 
-        download = False
-        # check if the dataset has already been downloaded
-        if os.path.exists(output_file_path):
-            logging.warning(f"Dataset {dataset_type}_dataset_{dataset_number} has already been downloaded.")
-            if overwrite:
-                logging.warning("Overwriting dataset.")
-                download = True
-            else:
-                logging.warning("Keeping existing dataset.")
+        if self.mirror is not None:
+            # the GitHub token is not sent to mirrors
+            sha256 = fetch_file(f"{self.mirror}/{release_tag}/{asset['name']}", output_file_path+".zip", sha256=asset["sha256"])
         else:
-            download = True
+            sha256 = fetch_file(asset["url"], output_file_path+".zip", token=token, sha256=asset["sha256"])
+
+        if asset["sha256"] is None:
+            # record the checksum of the first download such that later downloads are verified against it
+            asset["sha256"] = sha256
+            self.save_manifest()
 
-        if download:
-            download_file_from_github(asset_url, output_file_path+".zip", token=token)
-            unzip_file(output_file_path+".zip", output_file_path)
+        unzip_file(output_file_path+".zip", output_file_path, columnar=True)
 
         data = load_data_from_directory(output_file_path)
 
         return data
+
+    def load_manifest(self):
+
+        """ Load the local manifest and merge the manifest of the mirror (if any) into it. """
+
+        if self.manifest is not None:
+            return self.manifest
+
+        self.manifest = {"release_tags": None, "assets": {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as file:
+                self.manifest.update(json.load(file))
+
+        if self.mirror is not None:
+            mirror_manifest = self.read_mirror_manifest()
+            if mirror_manifest is not None:
+                for key, asset in mirror_manifest.get("assets", {}).items():
+                    self.manifest["assets"].setdefault(key, asset)
+                mirror_tags = mirror_manifest.get("release_tags")
+                local_tags = self.manifest["release_tags"]
+                if mirror_tags is not None and (local_tags is None or mirror_tags["fetched_at"] > local_tags["fetched_at"]):
+                    self.manifest["release_tags"] = mirror_tags
+
+        return self.manifest
+
+    def read_mirror_manifest(self):
+
+        """ Read <mirror>/manifest.json, returns None if the mirror has no manifest. """
+
+        source = f"{self.mirror}/manifest.json"
+        try:
+            if re.match(r"^https?://", source):
+                response = requests.get(source)
+                if response.status_code != 200:
+                    return None
+                return response.json()
+            source = source[len("file://"):] if source.startswith("file://") else source
+            if not os.path.exists(source):
+                return None
+            with open(source, "r") as file:
+                return json.load(file)
+        except (requests.RequestException, ValueError) as e:
+            logging.warning(f"Could not read mirror manifest {source}: {e}")
+            return None
+
+    def save_manifest(self):
+
+        """ Write the manifest atomically, such that concurrent runs never read a partial file. """
+
+        os.makedirs(self.data_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, suffix=".part")
+        with os.fdopen(fd, "w") as file:
+            json.dump(self.manifest, file, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def resolve_release_tag(self,
+            dataset_type: str,
+            version: str,
+            token: str = None
+            ):
+
+        """ Resolve the release tag of a dataset type, using the cached release tags while they are younger than manifest_ttl. """
+
+        if version != "latest":
+            return select_release_tag([], dataset_type, version)
+
+        manifest = self.load_manifest()
+        cached = manifest["release_tags"]
+        fresh = cached is not None and time.time() - cached["fetched_at"] < self.manifest_ttl
+
+        if not fresh and not self.offline:
+            try:
+                manifest["release_tags"] = {"tags": get_all_release_tags(token), "fetched_at": time.time()}
+                self.save_manifest()
+            except (requests.RequestException, ValueError) as e:
+                if cached is None:
+                    raise
+                logging.warning(f"Failed to refresh release tags, using cached release tags: {e}")
+
+        if manifest["release_tags"] is None:
+            raise ValueError("No cached release tags available in offline mode, specify a version or a mirror with a manifest.")
+
+        return select_release_tag(manifest["release_tags"]["tags"], dataset_type, version)
+
+    def resolve_asset(self,
+            dataset_type: str,
+            dataset_number: int,
+            release_tag: str,
+            token: str = None
+            ):
+
+        """ Resolve name, URL and SHA-256 of a dataset asset. Assets of a release do not change, so they are cached without expiry. """
+
+        manifest = self.load_manifest()
+        key = f"{release_tag}/{dataset_type}_dataset_{dataset_number}"
+
+        if key not in manifest["assets"]:
+            if self.offline:
+                raise ValueError(f"Dataset {key} is not in the manifest and cannot be resolved in offline mode.")
+            manifest["assets"][key] = get_dataset_asset(dataset_type, dataset_number, release_tag, token)
+            self.save_manifest()
+
+        return manifest["assets"][key]
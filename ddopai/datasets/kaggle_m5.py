@@ -1,33 +1,68 @@
 """Class to load the Kaggle_M5 dataset and prepare it for the context of inventory management"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/80_datasets/kaggle_m5.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/90_datasets/kaggle_m5.ipynb.
 
 # %% auto 0
 __all__ = ['KaggleM5DatasetLoader']
 
-# %% ../../nbs/80_datasets/kaggle_m5.ipynb 3
+# %% ../../nbs/90_datasets/kaggle_m5.ipynb 3
 import logging
 logging.basicConfig(level=logging.INFO)
 
 import numpy as np
 import os
+import hashlib
 import pandas as pd
 
-# %% ../../nbs/80_datasets/kaggle_m5.ipynb 4
+# %% ../../nbs/90_datasets/kaggle_m5.ipynb 4
 class KaggleM5DatasetLoader():
 
     """ Class to download the Kaggle M5 dataset and apply some preprocessing steps
-    to prepare it for application in inventory management. """
+    to prepare it for application in inventory management. The preprocessed outputs
+    are cached as column-major numpy arrays such that later calls of load_dataset()
+    do not need to parse the csv files again. Optional filters on stores, states,
+    departments, categories and items restrict loading to a subset of the SKUs. """
 
-    def __init__(self, data_path, overwrite=False, product_as_feature=False):
+    output_names = ["demand", "SKU_features", "time_features", "time_SKU_features", "mask"]
+
+    def __init__(self,
+                 data_path,
+                 overwrite=False,
+                 product_as_feature=False,
+                 use_cache=True,
+                 stores=None, # list of store_ids to keep, e.g. ["CA_1"]. None keeps all
+                 states=None, # list of state_ids to keep, e.g. ["CA", "TX"]. None keeps all
+                 depts=None, # list of dept_ids to keep, e.g. ["FOODS_1"]. None keeps all
+                 cats=None, # list of cat_ids to keep, e.g. ["FOODS"]. None keeps all
+                 items=None, # list of item_ids to keep. None keeps all
+                 chunksize=100_000, # number of csv rows parsed at once when filtering
+                 ):
         self.create_paths(data_path)
         self.check_data_path(data_path, overwrite)
         self.product_as_feature = product_as_feature
-    
+        self.use_cache = use_cache
+        self.filters = {}
+        for column, values in zip(["store_id", "state_id", "dept_id", "cat_id", "item_id"], [stores, states, depts, cats, items]):
+            if values is not None:
+                values = [values] if isinstance(values, str) else list(values)
+                if len(values) == 0:
+                    raise ValueError(f"Filter for {column} must not be empty")
+                self.filters[column] = sorted(set(values))
+        self.chunksize = chunksize
+        if self.filters:
+            # each subset gets its own cache such that switching between subsets does not invalidate it
+            subset_key = hashlib.sha1(repr(sorted(self.filters.items())).encode()).hexdigest()[:16]
+            self.cache_path = os.path.join(self.cache_path, f"subset_{subset_key}")
+
     def load_dataset(self):
 
         """ Main function to load the dataset. """
 
+        if self.use_cache and not self.download_data_flag and self.cache_is_valid():
+            logging.info("Loading preprocessed data from cache")
+            self.load_from_cache()
+            return self.demand, self.SKU_features, self.time_features, self.time_SKU_features, self.mask
+
         if self.download_data_flag:
             logging.info("Downloading dataset from Kaggle")
             self.download_data()
@@ -38,6 +73,10 @@ class KaggleM5DatasetLoader():
         logging.info("Preprocessing data")
         self.preprocess_pipeline()
 
+        if self.use_cache:
+            logging.info("Saving preprocessed data to cache")
+            self.save_to_cache()
+
         return self.demand, self.SKU_features, self.time_features, self.time_SKU_features, self.mask
 
     def check_data_path(self, data_path, overwrite):
@@ -61,35 +100,33 @@ class KaggleM5DatasetLoader():
         self.calendar_path = os.path.join(data_path, "calendar.csv")
         self.sale_path = os.path.join(data_path, "sales_train_evaluation.csv")
         self.price_path = os.path.join(data_path, "sell_prices.csv")
+        self.cache_path = os.path.join(data_path, "preprocessed")
 
     def preprocess_pipeline(self):
-    
+
         """ Apply simple preprocessing steps to the data. """
-        
-        logging.info("--Creating catogory mapping and features")  
-        self.sale["id"] = self.sale["id"].str.replace("_evaluation", "")
-        unique_mapping = self.sale[['item_id', 'dept_id', 'cat_id', 'store_id']].drop_duplicates()
+
+        logging.info("--Creating catogory mapping and features")
+        unique_mapping = self.sale[['item_id', 'dept_id', 'cat_id', 'store_id']].astype(str)
         unique_mapping["SKU_id"] = unique_mapping["item_id"] + "_" + unique_mapping["store_id"]
         unique_mapping["state"] = unique_mapping["store_id"].str.split("_", expand=True)[0]
-        unique_mapping.set_index("SKU_id", inplace=True)
+        unique_mapping = unique_mapping.drop_duplicates().set_index("SKU_id")
+        SKU_ids = unique_mapping.index
+        if len(SKU_ids) != len(self.sale):
+            raise ValueError("Each row of the sales data must belong to a unique SKU (item_id and store_id)")
 
         dummy_columns = ["dept_id", "cat_id", "store_id", "state"]
         if self.product_as_feature:
             dummy_columns.append("item_id")
-        categories = pd.get_dummies(unique_mapping[dummy_columns], drop_first=True) 
+        categories = pd.get_dummies(unique_mapping[dummy_columns], drop_first=True)
 
         logging.info("--Preparing sales time series data")
-        id = self.sale["id"]
-        self.sale = self.sale.iloc[:,6:]
-        self.sale["SKU_id"] = id
-        self.sale.set_index("SKU_id", inplace=True)
-        self.sale = self.sale.transpose()
-        self.sale.reset_index(inplace=True, drop=True)
-        self.sale.rename_axis(None, axis=1, inplace=True)
-        self.sale = self.sale[unique_mapping.index]
-        
+        day_columns = [col for col in self.sale.columns if col.startswith("d_")]
+        demand = self.sale[day_columns].to_numpy().T # time x SKU, rows are in the same order as SKU_ids
+        num_days = demand.shape[0]
+
         logging.info("--Preparing calendric information")
-        self.calendar = self.calendar[:1941] # we are only interested in the data we also have sales data for
+        self.calendar = self.calendar[:num_days].copy() # we are only interested in the data we also have sales data for
         self.calendar.drop(["date", "d", "weekday"], axis=1, inplace=True)
         self.calendar["trend"] = np.arange(1, len(self.calendar)+1)
         # For even larger datasets this coule be done at runtime when creating samples, but for this one it should be fine memory-wise
@@ -100,61 +137,159 @@ class KaggleM5DatasetLoader():
         self.calendar = self.calendar[cols]
 
         logging.info("--Preparing snap features")
-        snap_features = self.calendar[["snap_CA", "snap_TX", "snap_WI"]].copy()
-        self.calendar.drop(["snap_CA", "snap_TX", "snap_WI"], axis=1, inplace=True)
+        snap_columns = [col for col in self.calendar.columns if col.startswith("snap_")]
+        snap_features = self.calendar[snap_columns].to_numpy()
+        self.calendar.drop(snap_columns, axis=1, inplace=True)
 
-        new_snap_features = pd.DataFrame(index=range(snap_features.shape[0]), columns=unique_mapping.index)
-        for sku in unique_mapping.index:
-            state_code = sku.split('_')[-2]
-            snap_column = f"snap_{state_code}"
-            new_snap_features[sku] = snap_features[snap_column].values
-        snap_features = new_snap_features
+        # broadcast the snap indicator of each state to all SKUs sold in that state
+        state_index = pd.Index(snap_columns).get_indexer("snap_" + unique_mapping["state"])
+        if np.any(state_index < 0):
+            raise ValueError("Snap information missing for states: ", unique_mapping["state"][state_index < 0].unique().tolist())
+        snap_features = snap_features[:, state_index]
 
         logging.info("--Preparing price information")
-        self.price["SKU_id"] = self.price["item_id"] + "_" + self.price["store_id"]
-        self.price.drop(["store_id", "item_id"], axis=1, inplace=True)
-        self.price = self.price.pivot_table(index='wm_yr_wk', columns=['SKU_id'], values='sell_price')
-        self.price = self.price[unique_mapping.index]
+        weeks = np.unique(self.calendar["wm_yr_wk"].to_numpy())
+        day_week_index = np.searchsorted(weeks, self.calendar["wm_yr_wk"].to_numpy())
+
+        week_codes = pd.Categorical(self.price["wm_yr_wk"], categories=weeks).codes
+        weeks_in_price = np.bincount(week_codes[week_codes >= 0], minlength=len(weeks)) > 0
+        # for subsets, weeks without prices just mean that none of the selected SKUs was available
+        if not weeks_in_price.all() and not self.filters:
+            raise ValueError("The following wm_yr_wk values are in calendar but not in price: ", weeks[~weeks_in_price].tolist())
+
+        # map (item_id, store_id) of each price row to the position of the SKU without building string keys
+        item_categories = pd.Index(self.price["item_id"].cat.categories)
+        store_categories = pd.Index(self.price["store_id"].cat.categories)
+        item_index = item_categories.get_indexer(unique_mapping["item_id"])
+        store_index = store_categories.get_indexer(unique_mapping["store_id"])
+        found = (item_index >= 0) & (store_index >= 0)
+        SKU_lookup = np.full((len(item_categories)+1, len(store_categories)+1), -1, dtype=np.int64) # last row and column catch missing values (code -1)
+        SKU_lookup[item_index[found], store_index[found]] = np.arange(len(SKU_ids))[found]
+        SKU_codes = SKU_lookup[self.price["item_id"].cat.codes.to_numpy(), self.price["store_id"].cat.codes.to_numpy()]
+
+        rows = (week_codes >= 0) & (SKU_codes >= 0)
+        week_codes, SKU_codes = week_codes[rows], SKU_codes[rows]
+        sell_price = self.price["sell_price"].to_numpy()[rows]
+
+        price_sum = np.zeros((len(weeks), len(SKU_ids)), dtype=np.float64)
+        price_count = np.zeros((len(weeks), len(SKU_ids)), dtype=np.int32)
+        np.add.at(price_sum, (week_codes, SKU_codes), sell_price)
+        np.add.at(price_count, (week_codes, SKU_codes), 1)
 
         logging.info("--Creating indicator table if products are available for purchase")
-        self.available = self.price.copy()
-        self.available = self.available.notnull().astype(int)
+        available = price_count > 0
         # fill missing values for price (indicated in the available table)
-        self.price.fillna(0, inplace=True)
+        price = np.divide(price_sum, price_count, out=np.zeros_like(price_sum), where=available)
 
         logging.info("--Preparing final outputs and ensure consistency of time and feature dimensions")
-        wm_yr_wk_per_day = self.calendar[["wm_yr_wk"]]
-        self.price = self.price.reset_index()
-        missing_wm_yr_wk_in_price = wm_yr_wk_per_day[~wm_yr_wk_per_day["wm_yr_wk"].isin(self.price["wm_yr_wk"])]
-        if not missing_wm_yr_wk_in_price.empty:
-            raise ValueError("The following wm_yr_wk values are in calendar but not in price: ", missing_wm_yr_wk_in_price.tolist())
-        self.price = self.price.merge(wm_yr_wk_per_day, on="wm_yr_wk", how="right")
-        self.price.drop(["wm_yr_wk"], axis=1, inplace=True)
-        self.available = self.available.reset_index()
-        self.available = self.available.merge(wm_yr_wk_per_day, on="wm_yr_wk", how="right")
-        self.available.drop(["wm_yr_wk"], axis=1, inplace=True)
+        # expand price and availability from weeks to days with a single take
+        price_and_available = np.concatenate([price.astype(np.float32), available.astype(np.float32)], axis=1)
+        price_and_available = np.take(price_and_available, day_week_index, axis=0)
+        price = price_and_available[:, :len(SKU_ids)]
+        available = price_and_available[:, len(SKU_ids):].astype(np.int8)
         self.calendar.drop(["wm_yr_wk"], axis=1, inplace=True)
 
-        price_multi_index = pd.MultiIndex.from_product([['Price'], self.price.columns], names=['Type', 'SKU'])
-        self.price.columns = price_multi_index
-        snap_multi_index = pd.MultiIndex.from_product([['Snap'], snap_features.columns], names=['DataType', 'SKU'])
-        snap_features.columns = snap_multi_index
-        time_SKU_features = pd.concat([self.price, snap_features], axis=1)
-       
-        self.demand = self.sale
+        time_SKU_columns = pd.MultiIndex.from_arrays([["Price"]*len(SKU_ids) + ["Snap"]*len(SKU_ids), SKU_ids.append(SKU_ids)], names=[None, "SKU"])
+        time_SKU_features = np.concatenate([price, snap_features.astype(np.float32)], axis=1)
+
+        self.demand = pd.DataFrame(demand, columns=SKU_ids.rename(None))
         self.SKU_features = categories # features that are not time-dependent
-        self.time_features = self.calendar # features that are time-dependent
-        self.time_SKU_features = time_SKU_features # features taht are time- and SKU-dependent
-        self.mask = self.available # A mask that can either mask datapoints during training or be used as a feature
+        self.time_features = self.calendar.astype(np.float32) # features that are time-dependent
+        self.time_SKU_features = pd.DataFrame(time_SKU_features, columns=time_SKU_columns) # features taht are time- and SKU-dependent
+        self.mask = pd.DataFrame(available, columns=SKU_ids.rename(None)) # A mask that can either mask datapoints during training or be used as a feature
 
     def import_from_folder(self):
-        
-        """ Import data from a folder. """
 
-        self.calendar = pd.read_csv(self.calendar_path)
-        self.sale = pd.read_csv(self.sale_path)
-        self.price = pd.read_csv(self.price_path)
-    
+        """ Import data from a folder using compact dtypes. """
+
+        calendar_dtypes = {"wm_yr_wk": np.int32, "wday": np.int8, "month": np.int8, "year": np.int16,
+                           "snap_CA": np.int8, "snap_TX": np.int8, "snap_WI": np.int8}
+        self.calendar = pd.read_csv(self.calendar_path, dtype=calendar_dtypes)
+
+        id_columns = ["id", "item_id", "dept_id", "cat_id", "store_id", "state_id"]
+        header = pd.read_csv(self.sale_path, nrows=0).columns
+        if self.filters:
+            sale_dtypes = {col: str if col in id_columns else np.int32 for col in header}
+            self.sale = self.read_filtered_csv(self.sale_path, sale_dtypes, self.filters)
+            if len(self.sale) == 0:
+                raise ValueError("No SKUs match the selected filters: ", self.filters)
+            self.sale[id_columns] = self.sale[id_columns].astype("category")
+            logging.info(f"--Selected {len(self.sale)} SKUs")
+        else:
+            sale_dtypes = {col: "category" if col in id_columns else np.int32 for col in header}
+            self.sale = pd.read_csv(self.sale_path, dtype=sale_dtypes)
+
+        price_dtypes = {"store_id": "category", "item_id": "category", "wm_yr_wk": np.int32, "sell_price": np.float32}
+        if self.filters:
+            # only keep prices of the selected SKUs
+            price_filters = {"store_id": self.sale["store_id"].unique().tolist(), "item_id": self.sale["item_id"].unique().tolist()}
+            price_dtypes.update({"store_id": str, "item_id": str})
+            self.price = self.read_filtered_csv(self.price_path, price_dtypes, price_filters)
+            self.price[["store_id", "item_id"]] = self.price[["store_id", "item_id"]].astype("category")
+        else:
+            self.price = pd.read_csv(self.price_path, dtype=price_dtypes)
+
+    def read_filtered_csv(self, path, dtypes, filters):
+
+        """ Read a csv file in chunks and only keep the rows matching all filters. """
+
+        chunks = []
+        for chunk in pd.read_csv(path, dtype=dtypes, chunksize=self.chunksize):
+            keep = np.ones(len(chunk), dtype=bool)
+            for column, values in filters.items():
+                keep &= chunk[column].isin(values).to_numpy()
+            chunks.append(chunk[keep])
+        return pd.concat(chunks, ignore_index=True)
+
+    def cache_signature(self):
+
+        """ Signature of the raw files and preprocessing settings the cache was built from. """
+
+        signature = {"product_as_feature": self.product_as_feature, "filters": self.filters}
+        for path in [self.calendar_path, self.sale_path, self.price_path]:
+            stat = os.stat(path)
+            signature[os.path.basename(path)] = (stat.st_size, stat.st_mtime_ns)
+        return signature
+
+    def cache_is_valid(self):
+
+        """ Check if the cache exists and was built from the current raw files and settings. """
+
+        metadata_path = os.path.join(self.cache_path, "metadata.pkl")
+        if not os.path.exists(metadata_path):
+            return False
+        if not all(os.path.exists(os.path.join(self.cache_path, f"{name}.npy")) for name in self.output_names):
+            return False
+        metadata = pd.read_pickle(metadata_path)
+        return metadata.get("signature") == self.cache_signature()
+
+    def save_to_cache(self):
+
+        """ Save the preprocessed outputs as column-major numpy arrays plus their row and column labels. """
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        metadata_path = os.path.join(self.cache_path, "metadata.pkl")
+        if os.path.exists(metadata_path):
+            os.remove(metadata_path)
+
+        labels = {}
+        for name in self.output_names:
+            df = getattr(self, name)
+            np.save(os.path.join(self.cache_path, f"{name}.npy"), np.asfortranarray(df.to_numpy()))
+            labels[name] = (df.index, df.columns)
+        # metadata is written last such that an interrupted write leaves an invalid cache
+        pd.to_pickle({"signature": self.cache_signature(), "labels": labels}, metadata_path)
+
+    def load_from_cache(self):
+
+        """ Load the preprocessed outputs from the cache. """
+
+        labels = pd.read_pickle(os.path.join(self.cache_path, "metadata.pkl"))["labels"]
+        for name in self.output_names:
+            values = np.load(os.path.join(self.cache_path, f"{name}.npy"))
+            index, columns = labels[name]
+            setattr(self, name, pd.DataFrame(values, index=index, columns=columns, copy=False))
+
     def download_data(self):
 
         """ Download the data directly from Kaggle. """
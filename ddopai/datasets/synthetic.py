@@ -0,0 +1,221 @@
+"""Functions to generate synthetic datasets locally, e.g., for tests and benchmarks at arbitrary sizes."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/90_datasets/synthetic_datasets.ipynb.
+
+# %% auto 0
+__all__ = ['arma_orders', 'sample_stationary_ar_coefficients', 'simulate_arma', 'generate_arma_dataset',
+           'generate_m5_like_dataset']
+
+# %% ../../nbs/90_datasets/synthetic_datasets.ipynb 3
+import logging
+import numpy as np
+import pandas as pd
+
+from .default_datasets import DatasetLoader
+
+# %% ../../nbs/90_datasets/synthetic_datasets.ipynb 6
+arma_orders = {
+    "ar_1": (1, 0),
+    "arma_2_2": (2, 2),
+    "arma_10_10": (10, 10),
+}
+
+def sample_stationary_ar_coefficients(
+        order: int, # Order p of the AR process
+        size: int, # Number of coefficient vectors to sample
+        rng: np.random.Generator,
+        max_pacf: float = 0.8 # Maximum absolute partial autocorrelation, values < 1 guarantee stationarity
+        ) -> np.ndarray: # Coefficients of shape (size, order)
+
+    """ Sample coefficients of stationary AR processes by drawing partial autocorrelations
+    and mapping them to AR coefficients with the Durbin-Levinson recursion. """
+
+    pacf = rng.uniform(-max_pacf, max_pacf, size=(size, order))
+    coefficients = np.zeros((size, order))
+    for k in range(order):
+        previous = coefficients[:, :k].copy()
+        coefficients[:, :k] = previous - pacf[:, k:k+1] * previous[:, ::-1]
+        coefficients[:, k] = pacf[:, k]
+    return coefficients
+
+def simulate_arma(
+        ar: np.ndarray, # AR coefficients of shape (num_series, p)
+        ma: np.ndarray, # MA coefficients of shape (num_series, q)
+        num_periods: int,
+        rng: np.random.Generator,
+        burn_in: int = 100 # Number of initial periods that are discarded
+        ) -> np.ndarray: # Simulated series of shape (num_periods, num_series)
+
+    """ Simulate ARMA processes with standard normal innovations for all series in parallel. """
+
+    num_series, p = ar.shape
+    q = ma.shape[1]
+    total_periods = num_periods + burn_in
+
+    noise = rng.standard_normal((total_periods, num_series))
+    innovations = noise.copy()
+    for k in range(1, q+1):
+        innovations[k:] += ma[:, k-1] * noise[:-k]
+
+    # the first p rows are zeros such that the window for each period always has p rows
+    series = np.zeros((total_periods + p, num_series))
+    ar_reversed = ar[:, ::-1].T # (p, num_series), row i multiplies y[t-p+i]
+    for t in range(total_periods):
+        series[t+p] = innovations[t] + np.einsum("ij,ij->j", ar_reversed, series[t:t+p])
+
+    return series[p+burn_in:]
+
+def generate_arma_dataset(
+        dataset_type: str, # One of DatasetLoader.dataset_types_multivariate
+        num_series: int = 10, # Number of target series
+        num_periods: int = 1000, # Number of time periods
+        num_features: int = 10, # Number of features (following an AR(1) process each)
+        seed: int = None, # Seed for the random number generator
+        demand_mean: float = 100., # Mean of each target series
+        demand_std: float = 20., # Standard deviation of each target series (before clipping at 0)
+        burn_in: int = 100 # Number of initial periods that are discarded
+        ) -> dict: # Dict with the same keys as the datasets loaded by the DatasetLoader
+
+    """ Generate a synthetic multivariate dataset: the targets follow ARMA processes of the given
+    dataset type plus a linear effect of the features. """
+
+    if dataset_type not in arma_orders:
+        raise ValueError(f"Dataset type {dataset_type} is not valid, must be one of {list(arma_orders)}")
+    if dataset_type not in DatasetLoader.dataset_types_multivariate:
+        raise ValueError(f"Dataset type {dataset_type} is not a multivariate dataset type of the DatasetLoader")
+
+    rng = np.random.default_rng(seed)
+    p, q = arma_orders[dataset_type]
+
+    features = simulate_arma(sample_stationary_ar_coefficients(1, num_features, rng), np.zeros((num_features, 0)), num_periods, rng, burn_in)
+
+    ar = sample_stationary_ar_coefficients(p, num_series, rng)
+    ma = rng.uniform(-0.5, 0.5, size=(num_series, q))
+    target = simulate_arma(ar, ma, num_periods, rng, burn_in)
+    if num_features > 0:
+        target += features @ rng.normal(0, 1/np.sqrt(num_features), size=(num_features, num_series))
+
+    target = (target - target.mean(axis=0)) / target.std(axis=0)
+    target = np.maximum(demand_mean + demand_std * target, 0)
+
+    return {
+        "data_raw_features": pd.DataFrame(features, columns=[f"feature_{i}" for i in range(num_features)]),
+        "data_raw_target": pd.DataFrame(target, columns=[f"series_{i}" for i in range(num_series)]),
+    }
+
+# %% ../../nbs/90_datasets/synthetic_datasets.ipynb 12
+def generate_m5_like_dataset(
+        num_SKUs: int = 1000, # Number of SKUs (item-store combinations)
+        num_periods: int = 1941, # Number of days
+        num_states: int = 3, # Number of states, each state has its own snap days
+        num_stores: int = 10, # Number of stores, distributed over the states
+        num_cats: int = 3, # Number of categories
+        num_depts: int = 7, # Number of departments, distributed over the categories
+        num_events: int = 30, # Number of yearly recurring events
+        zero_demand_prob: float = 0.6, # Average probability of zero demand on a day where the SKU is available (intermittency)
+        late_launch_share: float = 0.3, # Share of SKUs that are launched after the first week
+        unavailable_prob: float = 0.02, # Probability that a launched SKU is not available in a week
+        product_as_feature: bool = False, # Whether to add the item_id as a feature, as in KaggleM5DatasetLoader
+        seed: int = None, # Seed for the random number generator
+        chunk_size: int = 1000, # Number of SKUs generated at once, bounds the memory used on top of the outputs
+        ) -> tuple: # demand, SKU_features, time_features, time_SKU_features, mask
+
+    """ Generate a synthetic dataset with exactly the structure returned by KaggleM5DatasetLoader.load_dataset,
+    e.g., to test dataloaders, environments and agents at arbitrary numbers of SKUs without the Kaggle files. """
+
+    if num_stores < num_states:
+        raise ValueError("num_stores must be at least num_states")
+    if num_depts < num_cats:
+        raise ValueError("num_depts must be at least num_cats")
+
+    seed_sequence = np.random.SeedSequence(seed)
+    seed_sequence, *chunk_seeds = seed_sequence.spawn(1 + int(np.ceil(num_SKUs / chunk_size)))
+    rng = np.random.default_rng(seed_sequence)
+
+    # hierarchy: states > stores, categories > departments > items, SKUs are item-store combinations sorted by store as in M5
+    states = [f"S{i}" for i in range(num_states)]
+    store_state = np.arange(num_stores) % num_states
+    stores = [f"{states[s]}_{np.sum(store_state[:j] == s) + 1}" for j, s in enumerate(store_state)]
+    cats = [f"CAT{i}" for i in range(num_cats)]
+    dept_cat = np.arange(num_depts) % num_cats
+    depts = [f"{cats[c]}_{np.sum(dept_cat[:k] == c) + 1}" for k, c in enumerate(dept_cat)]
+    num_items = int(np.ceil(num_SKUs / num_stores))
+    item_dept = np.arange(num_items) % num_depts
+    items = [f"{depts[d]}_{i:05d}" for i, d in enumerate(item_dept)]
+
+    SKU_store = np.arange(num_SKUs) // num_items
+    SKU_item = np.arange(num_SKUs) % num_items
+    SKU_ids = pd.Index([f"{items[i]}_{stores[s]}" for i, s in zip(SKU_item, SKU_store)])
+
+    logging.info("--Creating SKU features")
+    unique_mapping = pd.DataFrame({
+        "dept_id": pd.Categorical(np.array(depts)[item_dept[SKU_item]], categories=sorted(depts)),
+        "cat_id": pd.Categorical(np.array(cats)[dept_cat[item_dept[SKU_item]]], categories=sorted(cats)),
+        "store_id": pd.Categorical(np.array(stores)[SKU_store], categories=sorted(stores)),
+        "state": pd.Categorical(np.array(states)[store_state[SKU_store]], categories=sorted(states)),
+    }, index=SKU_ids.rename("SKU_id"))
+    if product_as_feature:
+        unique_mapping["item_id"] = pd.Categorical(np.array(items)[SKU_item], categories=sorted(items))
+    SKU_features = pd.get_dummies(unique_mapping, drop_first=True)
+
+    logging.info("--Creating time features")
+    dates = pd.date_range("2011-01-29", periods=num_periods, freq="D")
+    wday = (dates.dayofweek.to_numpy() + 2) % 7 + 1 # M5 convention: Saturday is 1
+    week = np.arange(num_periods) // 7 # weeks start on Saturday as wm_yr_wk in M5
+    num_weeks = week[-1] + 1
+    event_day_of_year = rng.choice(np.arange(1, 366), size=num_events, replace=False)
+    event_type = rng.integers(0, 4, size=num_events)
+    event_index = pd.Index(event_day_of_year).get_indexer(dates.dayofyear)
+    calendar = pd.DataFrame({
+        "year": dates.year,
+        "trend": np.arange(1, num_periods+1),
+        "wday": pd.Categorical(wday, categories=range(1, 8)),
+        "month": pd.Categorical(dates.month, categories=range(1, 13)),
+        "event_name_1": pd.Categorical.from_codes(event_index, categories=[f"Event{i:02d}" for i in range(num_events)]),
+        "event_type_1": pd.Categorical.from_codes(np.where(event_index >= 0, event_type[event_index], -1), categories=["Cultural", "National", "Religious", "Sporting"]),
+    })
+    time_features = pd.get_dummies(calendar, drop_first=True).astype(np.float32)
+
+    snap_days = np.stack([np.isin(dates.day, rng.choice(np.arange(1, 29), size=10, replace=False)) for _ in range(num_states)], axis=1)
+
+    logging.info("--Creating demand, price and availability")
+    demand = np.zeros((num_periods, num_SKUs), dtype=np.int32)
+    time_SKU_features = np.zeros((num_periods, 2*num_SKUs), dtype=np.float32)
+    mask = np.zeros((num_periods, num_SKUs), dtype=np.int8)
+    weekday_effect = rng.uniform(0.8, 1.3, size=7)
+
+    for chunk, chunk_seed in enumerate(chunk_seeds):
+        chunk_rng = np.random.default_rng(chunk_seed)
+        start, stop = chunk * chunk_size, min((chunk+1) * chunk_size, num_SKUs)
+        n = stop - start
+
+        # availability on a weekly level, as prices in M5
+        launch_week = np.where(chunk_rng.random(n) < late_launch_share, chunk_rng.integers(1, num_weeks, size=n), 0)
+        available_weeks = (np.arange(num_weeks)[:, None] >= launch_week) & (chunk_rng.random((num_weeks, n)) >= unavailable_prob)
+        available = available_weeks[week]
+
+        # prices are constant within a week with occasional promotions
+        base_price = chunk_rng.lognormal(1, 0.8, size=n)
+        promotion = np.where(chunk_rng.random((num_weeks, n)) < 0.05, chunk_rng.uniform(0.6, 0.9, size=(num_weeks, n)), 1.)
+        price = np.where(available_weeks, np.round(base_price * promotion, 2), 0.)[week]
+
+        snap = snap_days[:, store_state[SKU_store[start:stop]]]
+
+        # intermittent Poisson demand driven by weekday, snap and price
+        level = chunk_rng.lognormal(0.5, 1, size=n)
+        zero_prob = chunk_rng.beta(2 * zero_demand_prob / (1 - zero_demand_prob + 1e-12), 2, size=n) if 0 < zero_demand_prob < 1 else np.full(n, zero_demand_prob)
+        rate = level * weekday_effect[wday - 1][:, None] * (1 + 0.1 * snap) * (1 / promotion)[week]
+        sales = chunk_rng.poisson(rate) * (chunk_rng.random((num_periods, n)) >= zero_prob)
+
+        demand[:, start:stop] = np.where(available, sales, 0)
+        time_SKU_features[:, start:stop] = price
+        time_SKU_features[:, num_SKUs+start:num_SKUs+stop] = snap
+        mask[:, start:stop] = available
+
+    time_SKU_columns = pd.MultiIndex.from_arrays([["Price"]*num_SKUs + ["Snap"]*num_SKUs, SKU_ids.append(SKU_ids)], names=[None, "SKU"])
+
+    demand = pd.DataFrame(demand, columns=SKU_ids, copy=False)
+    time_SKU_features = pd.DataFrame(time_SKU_features, columns=time_SKU_columns, copy=False)
+    mask = pd.DataFrame(mask, columns=SKU_ids, copy=False)
+
+    return demand, SKU_features, time_features, time_SKU_features, mask
@@ -0,0 +1,151 @@
+"""Run environments in parallel worker processes with a shared dataloader and shared-memory observations"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/20_environments/20_base_env/20_async_vector_env.ipynb.
+
+# %% auto 0
+__all__ = ['GymnasiumEnvAdapter', 'SharedDataAsyncVectorEnv', 'make_shared_data_env', 'make_async_vector_env']
+
+# %% ../../nbs/20_environments/20_base_env/20_async_vector_env.ipynb 3
+from typing import Callable, List, Tuple
+import functools
+
+import gymnasium as gym
+import numpy as np
+
+from .base import BaseEnvironment
+from ..dataloaders.base import BaseDataLoader, SharedDataLoaderHandle
+
+# %% ../../nbs/20_environments/20_base_env/20_async_vector_env.ipynb 5
+class GymnasiumEnvAdapter(gym.Wrapper):
+
+    """
+    Adapter that exposes a ddopai environment with the interface expected by gymnasium vector environments:
+    reset accepts seed and options and returns the observation together with an info dict, step always returns
+    the truncation flag. The info of each step (arrays such as demand and cost per SKU) is dropped by default, such
+    that only scalars travel between processes.
+    """
+
+    def __init__(self,
+            env: BaseEnvironment, # ddopai environment
+            step_info: bool = False, # whether to return the info dict of the environment in each step
+            ) -> None:
+
+        super().__init__(env)
+        self.env.set_return_truncation(True)
+        self.step_info = step_info
+
+    def reset(self,
+            *,
+            seed: int | np.random.SeedSequence | None = None, # re-seed the environment before the reset
+            options: dict | None = None, # arguments of the reset function of the environment, e.g., start_index
+            ) -> Tuple[object, dict]:
+
+        """ Reset the environment, returns the first observation and an empty info dict """
+
+        if seed is not None:
+            self.env.set_seed(seed)
+
+        observation = self.env.reset(**(options or {}))
+
+        return observation, {}
+
+    def step(self,
+            action: np.ndarray, # action of a single environment
+            ) -> Tuple[object, float, bool, bool, dict]:
+
+        """ Step the environment, the info is only returned if step_info is set """
+
+        observation, reward, terminated, truncated, info = self.env.step(action)
+
+        return observation, float(reward), bool(terminated), bool(truncated), info if self.step_info else {}
+
+    def train(self):
+        """ Set the environment to train mode, the vector environment must be reset afterwards """
+        self.env.train()
+
+    def val(self):
+        """ Set the environment to validation mode, the vector environment must be reset afterwards """
+        self.env.val()
+
+    def test(self):
+        """ Set the environment to test mode, the vector environment must be reset afterwards """
+        self.env.test()
+
+# %% ../../nbs/20_environments/20_base_env/20_async_vector_env.ipynb 7
+class SharedDataAsyncVectorEnv(gym.vector.AsyncVectorEnv):
+
+    """
+    Gymnasium AsyncVectorEnv that owns the shared data of its workers (dataloaders placed in shared memory with
+    BaseDataLoader.to_shared). The data is released when the vector environment is closed.
+    """
+
+    def __init__(self,
+            env_fns: List[Callable], # functions that create the environments in the workers
+            shared_data: List[SharedDataLoaderHandle] | None = None, # handles of the shared dataloaders to release on close
+            **kwargs # arguments of gym.vector.AsyncVectorEnv, e.g., context
+            ) -> None:
+
+        self.shared_data = shared_data or []
+
+        try:
+            super().__init__(env_fns, **kwargs)
+        except Exception:
+            self.release_shared_data()
+            raise
+
+    def close_extras(self, timeout: int | float | None = None, terminate: bool = False):
+        """ Close the workers and release the shared data """
+
+        super().close_extras(timeout=timeout, terminate=terminate)
+        self.release_shared_data()
+
+    def release_shared_data(self):
+        """ Release the shared dataloaders owned by the vector environment """
+
+        for handle in self.shared_data:
+            handle.release()
+        self.shared_data = []
+
+def make_shared_data_env(
+        dataloader_handle: SharedDataLoaderHandle, # handle of the shared dataloader, see BaseDataLoader.to_shared
+        env_class: type, # environment class inheriting from BaseEnvironment
+        env_kwargs: dict, # arguments of the environment class
+        seed: np.random.SeedSequence | None, # seed of the environment
+        step_info: bool, # whether to return the info dict in each step
+        ) -> GymnasiumEnvAdapter:
+
+    """ Create an environment on a dataloader in shared memory, called in each worker """
+
+    dataloader = BaseDataLoader.attach_shared(dataloader_handle)
+    env = env_class(dataloader=dataloader, seed=seed, **env_kwargs)
+
+    return GymnasiumEnvAdapter(env, step_info=step_info)
+
+def make_async_vector_env(
+        env_class: type, # environment class inheriting from BaseEnvironment, e.g., NewsvendorEnv. Must accept a seed
+        dataloader: BaseDataLoader, # dataloader that is shared by all workers
+        n_envs: int, # number of environments, each runs in its own process
+        seed: int | np.random.SeedSequence | None = None, # seed from which the seeds of the environments are spawned
+        step_info: bool = False, # whether to send the info dict of each step through the pipe
+        context: str | None = None, # start method of the worker processes, e.g., "fork", "spawn" or "forkserver"
+        **env_kwargs # further arguments of the environment class
+        ) -> SharedDataAsyncVectorEnv:
+
+    """
+    Create a gymnasium AsyncVectorEnv with one worker process per environment. The arrays of the dataloader are
+    placed in shared memory once (see BaseDataLoader.to_shared) and all workers attach to the same memory instead
+    of receiving a pickled copy. Workers write their observations into preallocated shared buffers (also for dict observations),
+    only rewards and flags travel through the pipes. Each environment gets its own seed spawned from seed.
+    """
+
+    if not isinstance(n_envs, (int, np.integer)) or n_envs < 1:
+        raise ValueError("n_envs must be a positive integer.")
+
+    seeds = [None] * n_envs if seed is None else \
+        (seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)).spawn(n_envs)
+
+    dataloader_handle = dataloader.to_shared()
+
+    env_fns = [functools.partial(make_shared_data_env, dataloader_handle, env_class, env_kwargs, env_seed, step_info) for env_seed in seeds]
+
+    return SharedDataAsyncVectorEnv(env_fns, shared_data=[dataloader_handle], shared_memory=True, context=context)
@@ -1,20 +1,22 @@
 """Base environment class based on Gymnasium"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/20_base_env/10_base_env.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/20_environments/20_base_env/10_base_env.ipynb.
 
 # %% auto 0
 __all__ = ['BaseEnvironment']
 
-# %% ../../nbs/20_base_env/10_base_env.ipynb 4
+# %% ../../nbs/20_environments/20_base_env/10_base_env.ipynb 4
 import gymnasium as gym
 from abc import ABC, abstractmethod
 from typing import Union, List
 import numpy as np
 
-from ..utils import MDPInfo, Parameter, set_param
+from ..utils import MDPInfo, Parameter, set_param, get_rng_state, set_rng_state
+from ..postprocessors import PostprocessorPipeline
+from ..profiling import PROFILER
 import time
 
-# %% ../../nbs/20_base_env/10_base_env.ipynb 5
+# %% ../../nbs/20_environments/20_base_env/10_base_env.ipynb 5
 class BaseEnvironment(gym.Env, ABC):
 
     """
@@ -22,6 +24,8 @@ class BaseEnvironment(gym.Env, ABC):
     Base class for environments enforcing a common interface.
     """
 
+    state_attributes = ["index", "start_index", "max_index", "max_index_episode"] # mutable attributes captured by get_state
+
     def __init__(self,
                     mdp_info: MDPInfo, # MDPInfo object to ensure compatibility with the agents
                     postprocessors: list[object] | None = None,  # default is empty list
@@ -32,6 +36,9 @@ class BaseEnvironment(gym.Env, ABC):
 
         super().__init__()
 
+        if not hasattr(self, "rng"): # subclasses may call set_seed before to seed their components
+            self.set_seed(None)
+
         self.horizon_train = horizon_train
 
         self.return_truncation = return_truncation
@@ -66,6 +73,87 @@ class BaseEnvironment(gym.Env, ABC):
 
         set_param(self, name, input, shape, new)
 
+    def set_seed(self,
+                seed: int | np.random.SeedSequence | None = None, # seed of the environment, None to use the global numpy random state
+                ) -> None:
+
+        """
+        Seed the environment. A seed is turned into a SeedSequence from which the environment's own random number
+        generator and those of its components (see spawn_rng) are spawned, such that episodes are reproducible
+        independently of other environments, e.g., in other processes. Without a seed, the global numpy random
+        state is used and snapshots (see get_state) do not capture the random numbers.
+        """
+
+        if seed is None:
+            self.seed_sequence = None
+            self.rng = np.random
+        else:
+            if isinstance(seed, np.random.SeedSequence): # fresh copy, spawning must not depend on earlier use of the passed sequence
+                self.seed_sequence = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size)
+            else:
+                self.seed_sequence = np.random.SeedSequence(seed)
+            self.rng = self.spawn_rng()
+
+    def spawn_rng(self) -> np.random.Generator:
+
+        """
+        Return an independent random number generator for a component of the environment (e.g., an order pipeline).
+        Children are spawned in a fixed order, hence components must always be created in the same order.
+        """
+
+        if getattr(self, "seed_sequence", None) is None:
+            return np.random
+        
+        return np.random.default_rng(self.seed_sequence.spawn(1)[0])
+
+    def get_state(self) -> dict:
+
+        """
+        Return a snapshot of the mutable state of the environment: the attributes listed in state_attributes
+        (arrays are copied), the mode, the horizon and the state of the random number generator if the environment
+        is seeded (the global numpy random state of unseeded environments is not captured). Unlike a deepcopy
+        of the environment, the dataloader and the parameters are not copied, such that branching rollouts can
+        restore the snapshot on the same instance with set_state. Subclasses with components that hold state
+        (e.g., an order pipeline) extend both functions.
+        """
+
+        state = {name: self.copy_state_value(getattr(self, name, None)) for name in self.state_attributes}
+        state["mode"] = self._mode
+        state["horizon"] = self.mdp_info.horizon
+        state["rng"] = get_rng_state(self.rng)
+
+        return state
+
+    def set_state(self,
+                state: dict, # snapshot returned by get_state
+                restore_rng: bool = True # restore the random number generators, set to False to let branches draw different random numbers
+                ) -> None:
+
+        """
+        Restore a snapshot returned by get_state. The snapshot is not modified and can be restored several times.
+        Raises a ValueError if the random number generators are restored but the environment is not seeded.
+        """
+
+        if restore_rng and state["rng"] is None:
+            raise ValueError("The environment is not seeded, hence its random numbers are not part of the snapshot. Seed the environment or use restore_rng=False.")
+
+        for name in self.state_attributes:
+            setattr(self, name, self.copy_state_value(state[name]))
+
+        if state["mode"] != self._mode:
+            self._mode = state["mode"]
+            if hasattr(self, "dataloader"):
+                getattr(self.dataloader, self._mode)()
+        self.update_mdp_info(horizon=state["horizon"])
+
+        if restore_rng:
+            set_rng_state(self.rng, state["rng"])
+
+    @staticmethod
+    def copy_state_value(value):
+        """ Copy arrays of the state such that in-place updates do not change the snapshot """
+        return value.copy() if isinstance(value, np.ndarray) else value
+
     def return_truncation_handler(self, observation, reward, terminated, truncated, info):
         """ 
         Handle the return_truncation attribute of the environment. This function is called by the step function
@@ -86,17 +174,37 @@ class BaseEnvironment(gym.Env, ABC):
         """
         
         ## apply postprocessor
-        for postprocessor in self.postprocessors:
-            action = postprocessor(action)
+        with PROFILER.timer("env/postprocessors"):
+            action = self.expand_action(action)
+            for postprocessor in self.postprocessors:
+                action = postprocessor(action)
 
-        observation, reward, terminated, truncated, info = self.step_(action)
+        with PROFILER.timer("env/step_"):
+            observation, reward, terminated, truncated, info = self.step_(action)
 
         return self.return_truncation_handler(observation, reward, terminated, truncated, info)
     
+    def expand_action(self,
+            action: np.ndarray, # action as returned by the agent
+            index: int | None = None, # index of the period, the current period if None
+            ) -> np.ndarray:
+        """
+        Bring the action to the shape of the action space before the postprocessors are applied. Environments
+        that accept partial actions (e.g., for the active SKUs only) overwrite this function.
+        """
+        return action
+
     def add_postprocessor(self, postprocessor: object): # post-processor object that can be called via the "__call__" method
         """Add a postprocessor to the agent"""
         self.postprocessors.append(postprocessor)
 
+    def fuse_postprocessors(self) -> None:
+        """
+        Replace the postprocessors by a PostprocessorPipeline that is validated once against the action space and
+        processes the actions in place. Vectorized environments process the actions of all episodes at once.
+        """
+        self.postprocessors = [PostprocessorPipeline(self.postprocessors, self.action_space, n_envs=getattr(self, "n_envs", None))]
+
     @staticmethod
     def step_(self, action):
         """
@@ -226,7 +334,7 @@ class BaseEnvironment(gym.Env, ABC):
         if start_index=="random":
             if self.mode == "train":
                 if self.dataloader.len_train is not None and self.dataloader.len_train > self.mdp_info.horizon:
-                    random_index = np.random.choice(self.dataloader.len_train-self.mdp_info.horizon)
+                    random_index = int(self.rng.choice(self.dataloader.len_train-self.mdp_info.horizon))
                 else:
                     random_index = 0
                 self.start_index = random_index 
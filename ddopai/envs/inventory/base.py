@@ -1,11 +1,11 @@
 """Base environment with some basic funcitons"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/21_envs_inventory/10_base_inventory_env.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/20_environments/21_envs_inventory/10_base_inventory_env.ipynb.
 
 # %% auto 0
 __all__ = ['BaseInventoryEnv']
 
-# %% ../../../nbs/21_envs_inventory/10_base_inventory_env.ipynb 3
+# %% ../../../nbs/20_environments/21_envs_inventory/10_base_inventory_env.ipynb 3
 from abc import ABC, abstractmethod
 from typing import Union, Tuple, List
 
@@ -19,13 +19,15 @@ import gymnasium as gym
 import numpy as np
 import time
 
-# %% ../../../nbs/21_envs_inventory/10_base_inventory_env.ipynb 4
+# %% ../../../nbs/20_environments/21_envs_inventory/10_base_inventory_env.ipynb 4
 class BaseInventoryEnv(BaseEnvironment):
     """
     Base class for inventory management environments. This class inherits from BaseEnvironment.
     
     """
 
+    state_attributes = BaseEnvironment.state_attributes + ["demand"]
+
     def __init__(self, 
 
         ## Parameters for Base env:
@@ -1,11 +1,11 @@
 """Base environment with some basic funcitons"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/21_envs_inventory/00_inventory_utils.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/20_environments/21_envs_inventory/00_inventory_utils.ipynb.
 
 # %% auto 0
 __all__ = ['OrderPipeline']
 
-# %% ../../../nbs/21_envs_inventory/00_inventory_utils.ipynb 3
+# %% ../../../nbs/20_environments/21_envs_inventory/00_inventory_utils.ipynb 3
 import logging
 
 
@@ -16,20 +16,33 @@ from ..base import BaseEnvironment
 from ...utils import Parameter, MDPInfo
 from ...dataloaders.base import BaseDataLoader
 from ...loss_functions import pinball_loss
-from ...utils import set_param, Parameter
+from ...utils import set_param, Parameter, BlockSampler, get_rng_state, set_rng_state
 
 
 import gymnasium as gym
 
 import numpy as np
 import time
+import torch
 
-# %% ../../../nbs/21_envs_inventory/00_inventory_utils.ipynb 4
+# %% ../../../nbs/20_environments/21_envs_inventory/00_inventory_utils.ipynb 4
 class OrderPipeline():
    
     """
     Class to handle the order pipeline in the inventory environments. It is used to keep track of the orders
-    that are placed. It can account for fixed and variable lead times.
+    that are placed. It can account for fixed and variable lead times. If n_envs is set, the pipeline holds
+    one independent pipeline per environment with shape (n_envs, max_lead_time, num_units), e.g., for
+    vectorized environments.
+
+    Internally, the pipeline is a ring buffer with a moving head pointer. Instead of the remaining lead
+    time, each slot stores the period in which its order is due, such that a step only writes the new
+    order and computes the arrivals with one masked reduction over the buffer.
+
+    Stochastic lead times are drawn from rng for lead_time_block_size periods at once. Pass a seeded
+    np.random.Generator (e.g., from the environment's spawn_rng) to make them reproducible.
+
+    With the torch backend, the orders are stored in a tensor that is updated without in-place operations,
+    such that arriving orders remain differentiable w.r.t. the orders placed. The due periods stay in numpy.
     
     """
 
@@ -41,9 +54,19 @@ class OrderPipeline():
         lead_time_variance: Parameter | np.ndarray | List | int | float | None = None,  # variance of the lead time
         max_lead_time: list[object] | None = None,  # maximum lead time in case of stochastic lead times
         min_lead_time: list[object] | None = 1,  # minimum lead time in case of stochastic lead times
+        n_envs: int | None = None, # number of independent pipelines, None for a single pipeline without batch dimension
+        rng: np.random.Generator | None = None, # random number generator for the lead times, global numpy random state if None
+        lead_time_block_size: int = 256, # number of periods for which stochastic lead times are drawn at once
+        backend: Literal["numpy", "torch"] = "numpy", # array library of the orders in the pipeline
 
         ) -> None:
 
+        if backend not in ["numpy", "torch"]:
+            raise ValueError("backend must be 'numpy' or 'torch'")
+
+        self.backend = backend
+        self.batch_shape = () if n_envs is None else (int(n_envs),)
+
         self.set_param('num_units', num_units, shape=(1,), new=True)
         self.set_param('lead_time_mean', lead_time_mean, shape=(self.num_units[0],), new=True)
         self.set_param('lead_time_variance', lead_time_variance, shape=(self.num_units[0],), new=True)
@@ -62,20 +85,78 @@ class OrderPipeline():
             self.min_lead_time = 1
 
         self.check_max_min_mean_lt()
+
+        self.rng = np.random if rng is None else rng
+        self.lead_time_sampler = BlockSampler(self.draw_lead_time_block, block_size=lead_time_block_size)
   
-        self.pipeline = np.zeros((np.max(self.max_lead_time), num_units))
-        self.lead_time_realized = np.zeros((np.max(self.max_lead_time), num_units))
+        self.reset()
 
     def get_pipeline(self) -> np.ndarray:
-        """ Get the current pipeline """
+        """ Get the current pipeline, ordered from the oldest to the newest order """
+
+        if self.backend == "torch":
+            return torch.roll(self.buffer, -self.head, dims=-2)
+
+        return np.roll(self.buffer, -self.head, axis=-2)
 
-        return self.pipeline
+    @property
+    def pipeline(self) -> np.ndarray:
+        """ Current pipeline, ordered from the oldest to the newest order """
+
+        return self.get_pipeline()
+
+    @property
+    def lead_time_realized(self) -> np.ndarray:
+        """ Remaining lead time of each order in the pipeline, in the same order as the pipeline """
 
-    def reset(self) -> None:
+        return np.roll(np.maximum(self.due - self.period, 0), -self.head, axis=-2).astype(float)
+
+    def reset(self,
+        env_ids: np.ndarray | None = None, # pipelines to reset if n_envs is set, all if None
+        ) -> None:
         """ Reset the pipeline """
 
-        self.pipeline = np.zeros((np.max(self.max_lead_time), self.num_units[0]))
-        self.lead_time_realized = np.zeros((np.max(self.max_lead_time), self.num_units[0]))
+        if env_ids is None:
+            shape = self.batch_shape + (np.max(self.max_lead_time), self.num_units[0])
+            self.buffer = torch.zeros(shape) if self.backend == "torch" else np.zeros(shape)
+            self.due = np.zeros(self.batch_shape + (np.max(self.max_lead_time), self.num_units[0]), dtype=int) # period in which the order arrives
+            self.head = 0 # slot of the oldest order
+            self.period = 0 # number of steps since the last reset
+            self.lead_time_sampler.reset()
+        elif self.backend == "torch":
+            reset = torch.zeros(self.batch_shape, dtype=torch.bool, device=self.buffer.device)
+            reset[torch.as_tensor(env_ids)] = True
+            self.buffer = torch.where(reset[:, None, None], 0, self.buffer)
+            self.due[env_ids] = 0
+        else:
+            self.buffer[env_ids] = 0
+            self.due[env_ids] = 0
+
+    def get_state(self) -> dict:
+        """ Return a copy of the pipeline together with the state of the lead time sampling """
+
+        return {
+            "buffer": self.buffer.clone() if self.backend == "torch" else self.buffer.copy(),
+            "due": self.due.copy(),
+            "head": self.head,
+            "period": self.period,
+            "lead_time_sampler": self.lead_time_sampler.get_state(),
+            "rng": get_rng_state(self.rng),
+        }
+
+    def set_state(self,
+        state: dict, # state returned by get_state
+        restore_rng: bool = True, # restore the pre-drawn lead times and the random number generator
+        ) -> None:
+        """ Restore a state returned by get_state """
+
+        self.buffer = state["buffer"].clone() if self.backend == "torch" else state["buffer"].copy()
+        self.due = state["due"].copy()
+        self.head = state["head"]
+        self.period = state["period"]
+        if restore_rng:
+            self.lead_time_sampler.set_state(state["lead_time_sampler"])
+            set_rng_state(self.rng, state["rng"])
 
 
     def step(self, 
@@ -84,38 +165,21 @@ class OrderPipeline():
         
         """ Add orders to the pipeline and return the orders that are arriving """
 
+        if self.backend == "torch":
+            self.buffer = self.buffer.to(orders) # same dtype and device as the orders
 
-        # print("beginnig pipeline:")
-        # print(self.pipeline)
-        # print("beginnig lead_time_realized:")
-        # print(self.lead_time_realized)
-
-
-        orders_arriving = self.get_orders_arriving().copy()
-        lead_times = self.draw_lead_times().copy()
-
-        # print("orders_arriving:")
-        # print(orders_arriving)
-        # print("new orders:")
-        # print(orders)
-        # print("new lead_times:")
-        # print(lead_times)
+        orders_arriving = self.get_orders_arriving()
+        lead_times = self.draw_lead_times()
 
-
-        self.pipeline = np.roll(self.pipeline, -1, axis=0)
-        self.lead_time_realized = np.roll(self.lead_time_realized, -1, axis=0)
-        self.pipeline[-1, :] = 0
-        self.lead_time_realized[-1, :] = 0
-        
-        self.pipeline[-1, :] = orders.copy()
-        self.lead_time_realized[-1, :] = lead_times
-        self.lead_time_realized -= 1
-        self.lead_time_realized = np.clip(self.lead_time_realized, 0, None)
-
-        # print("ending pipeline:")
-        # print(self.pipeline)
-        # print("ending lead_time_realized:")
-        # print(self.lead_time_realized)
+        # the slot of the oldest order becomes the slot of the newest order
+        if self.backend == "torch":
+            newest = torch.arange(self.buffer.shape[-2], device=self.buffer.device) == self.head
+            self.buffer = torch.where(newest[:, None], orders.unsqueeze(-2), self.buffer)
+        else:
+            self.buffer[..., self.head, :] = orders
+        self.due[..., self.head, :] = self.period + lead_times
+        self.head = (self.head + 1) % self.buffer.shape[-2]
+        self.period += 1
 
         return orders_arriving
 
@@ -123,15 +187,17 @@ class OrderPipeline():
 
         """ Get the orders that are arriving in the current period """
 
-        orders_arriving = np.zeros(self.num_units[0])
-        for i in range(self.num_units[0]):
-            # check along the pipeline where the lead time is 0
+        # orders arrive where they are due, empty slots only contain zeros
+        arriving = self.due <= self.period
 
-            arriving_indices = np.where(self.lead_time_realized[:, i] == 0)[0]
+        if self.backend == "torch":
+            arriving = torch.as_tensor(arriving, device=self.buffer.device)
+            orders_arriving = torch.where(arriving, self.buffer, 0).sum(dim=-2)
+            self.buffer = torch.where(arriving, 0, self.buffer)
+            return orders_arriving
 
-            orders_arriving[i] = np.sum(self.pipeline[arriving_indices, i])
-
-            self.pipeline[arriving_indices, i] = 0
+        orders_arriving = np.sum(self.buffer, axis=-2, where=arriving)
+        self.buffer[arriving] = 0
 
         return orders_arriving
 
@@ -139,13 +205,24 @@ class OrderPipeline():
         """ Draw lead times for the orders """
 
         if self.lead_time_stochasticity == "fixed":
-            lead_times = self.lead_time_mean
-        elif self.lead_time_stochasticity == "gamma":
-            lead_times = np.random.gamma(self.lead_time_mean, 1, self.num_units[0])
+            lead_times = np.broadcast_to(self.lead_time_mean, self.batch_shape + (self.num_units[0],))
+            return np.round(lead_times).astype(int)
+
+        return self.lead_time_sampler()
+
+    def draw_lead_time_block(self,
+        num_periods: int, # number of periods to draw lead times for
+        ) -> np.ndarray:
+        """ Draw stochastic lead times for several periods at once, the first dimension are the periods """
+
+        size = (num_periods,) + self.batch_shape + (self.num_units[0],)
+
+        if self.lead_time_stochasticity == "gamma":
+            lead_times = self.rng.gamma(self.lead_time_mean, 1, size)
         elif self.lead_time_stochasticity == "normal_absolute":
-            lead_times = np.random.normal(self.lead_time_mean, self.lead_time_variance, self.num_units[0])
+            lead_times = self.rng.normal(self.lead_time_mean, self.lead_time_variance, size)
         elif self.lead_time_stochasticity == "normal_relative":
-            lead_times = np.random.normal(self.lead_time_mean, self.lead_time_mean * self.lead_time_variance, self.num_units[0])
+            lead_times = self.rng.normal(self.lead_time_mean, self.lead_time_mean * self.lead_time_variance, size)
         else:
             raise ValueError("Invalid lead time stochasticity")
 
@@ -208,5 +285,4 @@ class OrderPipeline():
     def shape(self) -> Tuple:
         """ Get the shape of the pipeline """
 
-        return self.pipeline.shape
-
+        return self.buffer.shape
@@ -1,11 +1,11 @@
 """Dynamic inventory management problem with inventory carry-over. Can be used to model the Lost Sales problem (when fixed cost are set to 0), and the Multi-Period Fixed Cost problem (when fixed cost are larger than 0)."""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/21_envs_inventory/30_multi_period_envs.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/20_environments/21_envs_inventory/30_multi_period_envs.ipynb.
 
 # %% auto 0
 __all__ = ['MultiPeriodEnv']
 
-# %% ../../../nbs/21_envs_inventory/30_multi_period_envs.ipynb 3
+# %% ../../../nbs/20_environments/21_envs_inventory/30_multi_period_envs.ipynb 3
 from abc import ABC, abstractmethod
 from typing import Union, Tuple
 
@@ -19,13 +19,15 @@ import gymnasium as gym
 import numpy as np
 import time
 
-# %% ../../../nbs/21_envs_inventory/30_multi_period_envs.ipynb 4
+# %% ../../../nbs/20_environments/21_envs_inventory/30_multi_period_envs.ipynb 4
 class MultiPeriodEnv(BaseInventoryEnv, ABC):
     
     """
     XXX
     """
 
+    state_attributes = BaseInventoryEnv.state_attributes + ["inventory"]
+
     def __init__(self,
         
         underage_cost: np.ndarray | Parameter | int | float = 1,  # underage cost per unit
@@ -50,6 +52,7 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
         mode: str = "train",  # Initial mode (train, val, test) of the environment
         return_truncation: bool = True,  # whether to return a truncated condition in step function
         step_info_verbosity = 0,  # 0: no info, 1: some info, 2: all info
+        seed: int | np.random.SeedSequence | None = None,  # seed for the random numbers of the environment, global numpy random state if None
 
     ) -> None:
 
@@ -72,11 +75,13 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
         self.set_param("max_inventory", max_inventory, shape=(num_SKUs,), new=True)
         self.start_inventory = self.start_inventory.astype(float)
 
-        inventory_pipeline_params = inventory_pipeline_params or {}
+        inventory_pipeline_params = dict(inventory_pipeline_params or {})
         inventory_pipeline_params["num_units"] = int(self.num_SKUs[0])
         self.order_pipeline = OrderPipeline(**inventory_pipeline_params)
         self.inventory = self.start_inventory.copy()
 
+        self.set_seed(seed)
+
         self.set_observation_space(dataloader.X_shape)
         self.set_action_space(dataloader.Y_shape, low = self.q_bound_low, high = self.q_bound_high)
 
@@ -93,6 +98,36 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
                             dataloader=dataloader,
                             horizon_train = horizon_train)
 
+    def set_seed(self,
+                seed: int | np.random.SeedSequence | None = None, # seed of the environment, None to use the global numpy random state
+                ) -> None:
+
+        """ Seed the environment and spawn the random number generator for the lead times of the order pipeline """
+
+        super().set_seed(seed)
+        if hasattr(self, "order_pipeline") and self.seed_sequence is not None:
+            self.order_pipeline.rng = self.spawn_rng()
+            self.order_pipeline.lead_time_sampler.reset()
+
+    def get_state(self) -> dict:
+
+        """ Return a snapshot of the mutable state including the inventory and the order pipeline, see BaseEnvironment.get_state """
+
+        state = super().get_state()
+        state["order_pipeline"] = self.order_pipeline.get_state()
+
+        return state
+
+    def set_state(self,
+                state: dict, # snapshot returned by get_state
+                restore_rng: bool = True # restore the random number generators, set to False to let branches draw different random numbers
+                ) -> None:
+
+        """ Restore a snapshot returned by get_state """
+
+        super().set_state(state, restore_rng)
+        self.order_pipeline.set_state(state["order_pipeline"], restore_rng)
+
     def step_(self, 
             action: np.ndarray # order quantity
             ) -> Tuple[np.ndarray, float, bool, bool, dict]:
@@ -149,6 +184,8 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
             info["demand"] = self.demand.copy()
             info["action"] = action.copy()
             info["cost_per_SKU"] = total_cost_step.copy()
+            info["underage_quantity"] = underage_quantity.copy()
+            info["inventory"] = self.inventory.copy() # inventory after demand, used for the holding cost
         if self.step_info_verbosity > 0:
             info["variable_ordering_cost"] = variable_ordering_cost.copy()
             info["fixed_ordering_cost"] = fixed_ordering_cost.copy()
@@ -165,7 +202,10 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
             #     observation[key] = np.zeros_like(value)
             # demand = np.zeros_like(self.action_space.sample())
 
-            observation, self.demand = self.get_observation()
+            if self.mode == "test" or self.mode == "val":
+                observation, self.demand = None, None
+            else:
+                observation, self.demand = self.get_observation()
 
             return observation, reward, terminated, truncated, info
         
@@ -195,7 +235,7 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
         observation = {
             "features": X_item,
             "order_pipeline": self.order_pipeline.get_pipeline(),
-            "inventory:": self.inventory,
+            "inventory": self.inventory,
         }
 
         return observation, Y_item
@@ -248,8 +288,8 @@ class MultiPeriodEnv(BaseInventoryEnv, ABC):
         else:
             raise ValueError("Shape for features must be a tuple or None")
 
-        len_pipeline, num_products = self.order_pipeline.shape
-        order_pipeline_shape = self.order_pipeline.shape
+        len_pipeline, num_products = self.order_pipeline.shape[-2:] # vectorized environments have an additional batch dimension
+        order_pipeline_shape = self.order_pipeline.shape[-2:]
         
         # add dim with lengh of order pipeline and copy values in that dimension
 
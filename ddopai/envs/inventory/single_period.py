@@ -1,16 +1,16 @@
 """Static inventory environment where a decision only affects the next period (Newsvendor problem)"""
 
-# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/21_envs_inventory/20_single_period_envs.ipynb.
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb.
 
 # %% auto 0
 __all__ = ['NewsvendorEnv', 'NewsvendorEnvVariableSL']
 
-# %% ../../../nbs/21_envs_inventory/20_single_period_envs.ipynb 3
+# %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 3
 from abc import ABC, abstractmethod
-from typing import Union, Tuple, Literal
+from typing import Union, Tuple, Literal, Callable
 
-from ...utils import Parameter, MDPInfo
-from ...dataloaders.base import BaseDataLoader
+from ...utils import Parameter, MDPInfo, BlockSampler, get_rng_state, set_rng_state
+from ...dataloaders.base import BaseDataLoader, find_invalid_values, format_invalid_values
 from ...loss_functions import pinball_loss, quantile_loss
 from .base import BaseInventoryEnv
 
@@ -18,16 +18,22 @@ import gymnasium as gym
 
 import numpy as np
 import time
+import logging
 
-# %% ../../../nbs/21_envs_inventory/20_single_period_envs.ipynb 4
+# %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 4
 class NewsvendorEnv(BaseInventoryEnv, ABC):
     
     """
     Class implementing the Newsvendor problem, working for the single- and multi-item case. If underage_cost and overage_cost
     are scalars and there are multiple SKUs, then the same cost is used for all SKUs. If underage_cost and overage_cost are arrays,
     then they must have the same length as the number of SKUs. Num_SKUs can be set as parameter or inferred from the DataLoader.
+    With use_mask, only the SKUs that are available according to the mask of the dataloader are scored (see get_active_SKUs),
+    such that the work per step scales with the number of available SKUs. Actions can then be given for all SKUs or for the
+    available SKUs only.
     """
 
+    supports_episode_batching = True # actions do not affect future observations, val and test episodes can be scored at once
+
     def __init__(self,
         underage_cost: Union[np.ndarray, Parameter, int, float] = 1, # underage cost per unit
         overage_cost: Union[np.ndarray, Parameter, int, float] = 1, # overage cost per unit
@@ -39,10 +45,15 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
         horizon_train: int | str = "use_all_data", # if "use_all_data" then horizon is inferred from the DataLoader
         postprocessors: list[object] | None = None,  # default is empty list
         mode: str = "train", # Initial mode (train, val, test) of the environment
-        return_truncation: str = True # whether to return a truncated condition in step function
+        return_truncation: str = True, # whether to return a truncated condition in step function
+        use_mask: bool = False, # only score the SKUs that are available according to the mask of the dataloader
+        seed: int | np.random.SeedSequence | None = None # seed for the random numbers of the environment, global numpy random state if None
     ) -> None:
 
+        self.set_seed(seed)
+
         self.print=False
+        self.use_mask = use_mask
 
         num_SKUs = dataloader.num_units if num_SKUs is None else num_SKUs
 
@@ -85,16 +96,10 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
         if action.ndim == 2 and action.shape[0] == 1:
             action = np.squeeze(action, axis=0)  # Remove the first dimension
 
-        cost_per_SKU = self.determine_cost(action)
+        cost_per_SKU, info = self.score_period(action, self.get_active_SKUs())
         reward = -np.sum(cost_per_SKU) # negative because we want to minimize the cost
 
         terminated = False # in this problem there is no termination condition
-        
-        info = dict(
-            demand=self.demand.copy(),
-            action=action.copy(),
-            cost_per_SKU=cost_per_SKU.copy()
-        )
 
         # Set index will set the index and return True if the index is out of bounds
         truncated = self.set_index()
@@ -123,12 +128,150 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
 
             return observation, reward, terminated, truncated, info
 
-    def determine_cost(self, action: np.ndarray) -> np.ndarray:
+    def get_episode(self) -> Tuple[list, np.ndarray]:
+
+        """
+        Return the observations and demands of all remaining periods of the current episode with one batched
+        dataloader call. Only available in val and test mode, where the episode does not depend on the actions.
+        """
+
+        if self.mode == "train":
+            raise ValueError("get_episode is only available in val and test mode.")
+
+        indices = np.arange(self.index, self.max_index_episode)
+        X_batch, Y_batch = self.dataloader.get_batch(indices)
+
+        observations = [None] * len(indices) if X_batch is None else list(X_batch)
+
+        return observations, Y_batch
+
+    def score_episode(self,
+            actions: list[np.ndarray], # actions of all periods returned by get_episode (after postprocessing)
+            demands: np.ndarray # demands returned by get_episode
+            ) -> Tuple[np.ndarray, list[dict]]:
+
+        """
+        Score the actions of all remaining periods of the current episode at once and move the environment to the end
+        of the episode. Returns the rewards and the info dicts of each period, identical to calling step_ repeatedly.
+        """
+
+        # same squeeze as in step_
+        actions = [np.squeeze(action, axis=0) if action.ndim == 2 and action.shape[0] == 1 else action for action in actions]
+        active_SKUs = [self.get_active_SKUs(index) for index in range(self.index, self.index + len(actions))]
+
+        if all(active is None for active in active_SKUs) and all(action.shape == demands.shape[1:] for action in actions):
+            actions_batch = np.stack(actions)
+            self.demand = demands
+            cost_per_SKU = self.determine_cost(actions_batch)
+            infos = [dict(demand=demand.copy(), action=action.copy(), cost_per_SKU=cost.copy()) for demand, action, cost in zip(demands, actions, cost_per_SKU)]
+        else: # masked SKUs and unusual action shapes that rely on broadcasting are scored period by period
+            cost_per_SKU, infos = [], []
+            for action, demand, active in zip(actions, demands, active_SKUs):
+                self.demand = demand
+                cost, info = self.score_period(action, active)
+                cost_per_SKU.append(cost)
+                infos.append(info)
+
+        rewards = np.array([-np.sum(cost) for cost in cost_per_SKU]) # negative because we want to minimize the cost
+
+        self.set_index(self.max_index_episode)
+        self.demand = None
+
+        return rewards, infos
+
+    def get_active_SKUs(self,
+            index: int | None = None, # index of the period, the current period if None
+            ) -> np.ndarray | None:
+
+        """
+        Return the indices of the SKUs that are available in the period according to the mask of the dataloader
+        (see BaseDataLoader.get_mask). None if all SKUs are scored, i.e., use_mask is False or the dataloader has no mask.
+        Agents can use it to only compute the order quantities of the available SKUs.
+        """
+
+        if not self.use_mask:
+            return None
+
+        mask = self.dataloader.get_mask(self.index if index is None else index)
+
+        return None if mask is None else np.flatnonzero(mask)
+
+    def expand_action(self,
+            action: np.ndarray, # order quantities of all SKUs or of the active SKUs only
+            index: int | None = None, # index of the period, the current period if None
+            ) -> np.ndarray:
+
+        """
+        Expand an action for the active SKUs only to all SKUs (zero for the inactive ones), such that postprocessors
+        with one parameter per SKU are applied to the right SKUs. The inactive SKUs are not scored.
+        """
+
+        if not self.use_mask:
+            return action
+
+        mask = self.dataloader.get_mask(self.index if index is None else index)
+
+        # the mask has one entry per SKU of the period (a single SKU per period when training on a meta-learning dataloader)
+        if mask is None or action.shape[-1] == len(mask) or action.shape[-1] != np.count_nonzero(mask):
+            return action
+
+        full_action = np.zeros(action.shape[:-1] + (len(mask),), dtype=action.dtype)
+        full_action[..., np.flatnonzero(mask)] = action
+
+        return full_action
+
+    def score_period(self,
+            action: np.ndarray, # order quantities of all SKUs or of the active SKUs only
+            active_SKUs: np.ndarray | None = None, # indices of the SKUs to score, all SKUs if None
+            ) -> Tuple[np.ndarray, dict]:
+
+        """
+        Return the cost per SKU and the info of the current period (demand stored under self.demand). With active_SKUs,
+        only the active SKUs are scored and the info contains their demand, action, cost and indices (active_SKUs).
+        """
+
+        demand = self.demand
+
+        if active_SKUs is not None:
+            if action.shape[-1] == demand.shape[-1]:
+                action = action[..., active_SKUs]
+            elif action.shape[-1] != len(active_SKUs):
+                raise ValueError(f"The action must contain all {demand.shape[-1]} SKUs or the {len(active_SKUs)} active SKUs.")
+            demand = demand[..., active_SKUs]
+
+        cost_per_SKU = self.determine_cost(action, active_SKUs)
+
+        info = dict(
+            demand=demand.copy(),
+            action=action.copy(),
+            cost_per_SKU=cost_per_SKU.copy()
+        )
+
+        if active_SKUs is not None:
+            info["active_SKUs"] = active_SKUs
+
+        return cost_per_SKU, info
+
+    @staticmethod
+    def select_SKUs(value: Parameter | np.ndarray, # parameter with one value per SKU
+                    active_SKUs: np.ndarray | None # indices of the SKUs to select, all SKUs if None
+                    ) -> Parameter | np.ndarray:
+        """ Select the values of the active SKUs """
+        if active_SKUs is None:
+            return value
+        value = value.get_value() if isinstance(value, Parameter) else value
+        return value[..., active_SKUs]
+
+    def determine_cost(self,
+            action: np.ndarray, # order quantities of the active SKUs
+            active_SKUs: np.ndarray | None = None, # indices of the active SKUs, all SKUs if None
+            ) -> np.ndarray:
         """
         Determine the cost per SKU given the action taken. The cost is the sum of underage and overage costs.
         """
         # Compute the cost per SKU
-        return pinball_loss(self.demand, action, self.underage_cost, self.overage_cost)
+        return pinball_loss(self.select_SKUs(self.demand, active_SKUs), action,
+                            self.select_SKUs(self.underage_cost, active_SKUs), self.select_SKUs(self.overage_cost, active_SKUs))
 
     def update_cu_co(self, cu=None, co=None):
         # Check if the underage_cost and overage_cost are already set
@@ -164,8 +307,11 @@ class NewsvendorEnv(BaseInventoryEnv, ABC):
             self.set_param("sl", sl, shape=(self.num_SKUs[0],))
 
 
-# %% ../../../nbs/21_envs_inventory/20_single_period_envs.ipynb 15
+# %% ../../../nbs/20_environments/21_envs_inventory/20_single_period_envs.ipynb 17
 class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
+
+    state_attributes = NewsvendorEnv.state_attributes + ["sl_period"]
+
     def __init__(self,
 
         # Additional parameters:
@@ -186,7 +332,9 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
         postprocessors: list[object] | None = None,  # default is empty list
         mode: str = "train", # Initial mode (train, val, test) of the environment
         return_truncation: str = True, # whether to return a truncated condition in step function
-        SKUs_in_batch_dimension: bool = True # whether SKUs in the observation space are in the batch dimension (used for meta-learning)
+        SKUs_in_batch_dimension: bool = True, # whether SKUs in the observation space are in the batch dimension (used for meta-learning)
+        use_mask: bool = False, # only score the SKUs that are available according to the mask of the dataloader
+        seed: int | np.random.SeedSequence | None = None # seed for the random numbers of the environment, global numpy random state if None
     
     ) -> None:
 
@@ -200,6 +348,8 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
         self.sl_distribution = sl_distribution
         self.check_sl_distribution
         self.SKUs_in_batch_dimension = SKUs_in_batch_dimension
+        self.debug = False # if True, every observation is checked for NaN and Inf values
+        self.sl_sampler = BlockSampler(self.draw_sl_block) # service levels are drawn for whole episodes at reset
 
         super().__init__(underage_cost=underage_cost,
                         overage_cost=overage_cost,
@@ -211,7 +361,9 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
                         horizon_train=horizon_train,
                         postprocessors=postprocessors,
                         mode=mode,
-                        return_truncation=return_truncation)
+                        return_truncation=return_truncation,
+                        use_mask=use_mask,
+                        seed=seed)
 
         if sl_test_val is not None:
             if self.underage_cost is None and self.overage_cost is None:
@@ -224,19 +376,88 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
             sl = self.underage_cost / (self.underage_cost + self.overage_cost)
             self.set_param("sl", sl, shape=(self.num_SKUs[0],), new=True)
 
-    def determine_cost(self, action: np.ndarray) -> np.ndarray:
+    def set_seed(self,
+                seed: int | np.random.SeedSequence | None = None, # seed of the environment, None to use the global numpy random state
+                ) -> None:
+
+        """ Seed the environment and spawn the random number generator for the service levels """
+
+        super().set_seed(seed)
+        self.sl_rng = self.spawn_rng()
+        if hasattr(self, "sl_sampler"):
+            self.sl_sampler.reset()
+
+    def get_state(self) -> dict:
+
+        """ Return a snapshot of the mutable state including the pre-drawn service levels, see BaseEnvironment.get_state """
+
+        state = super().get_state()
+        state["sl_sampler"] = self.sl_sampler.get_state()
+        state["sl_rng"] = get_rng_state(self.sl_rng)
+
+        return state
+
+    def set_state(self,
+                state: dict, # snapshot returned by get_state
+                restore_rng: bool = True # restore the random number generators, set to False to let branches draw different random numbers
+                ) -> None:
+
+        """ Restore a snapshot returned by get_state """
+
+        super().set_state(state, restore_rng)
+        if restore_rng:
+            self.sl_sampler.set_state(state["sl_sampler"])
+            set_rng_state(self.sl_rng, state["sl_rng"])
+
+    def reset(self,
+        start_index: int | str = None, # index to start from
+        state: np.ndarray = None # initial state
+        ) -> Tuple[np.ndarray, bool]:
+
+        """ Reset the environment, the service levels of the new episode are pre-drawn at once """
+
+        self.reset_sl_sampler()
+
+        return super().reset(start_index, state)
+
+    def reset_sl_sampler(self):
+
+        """ Discard the remaining service levels, the next block covers the whole episode if it fits into one block """
+
+        horizon = self.mdp_info.horizon
+        if isinstance(horizon, (int, np.integer)):
+            self.sl_sampler.reset(min(horizon + 1, self.sl_sampler.block_size)) # one observation at reset and one per step
+        else:
+            self.sl_sampler.reset()
+
+    def draw_sl_block(self,
+        num_periods: int # number of periods to draw service levels for
+        ) -> np.ndarray:
+
+        """ Draw the service levels of all SKUs for several periods at once, the first dimension are the periods """
+
+        sl = self.draw_parameter(self.sl_distribution, self.sl_bound_low, self.sl_bound_high, samples = num_periods*self.num_SKUs[0], rng=self.sl_rng)
+
+        return sl.reshape(num_periods, self.num_SKUs[0])
+
+    def determine_cost(self,
+            action: np.ndarray, # order quantities of the active SKUs
+            active_SKUs: np.ndarray | None = None, # indices of the active SKUs, all SKUs if None
+            ) -> np.ndarray:
         """
         Determine the cost per SKU given the action taken. The cost is the sum of underage and overage costs.
         """
 
+        demand = self.select_SKUs(self.demand, active_SKUs)
+
         # Compute the cost per SKU
         if self.mode == "train": # during training only the service level is relevant
-            return quantile_loss(self.demand, action, self.sl_period)
+            return quantile_loss(demand, action, self.select_SKUs(self.sl_period, active_SKUs))
         else:
             if self.evaluation_metric == "pinball_loss":
-                return pinball_loss(self.demand, action, self.underage_cost, self.overage_cost)
+                return pinball_loss(demand, action, self.select_SKUs(self.underage_cost, active_SKUs), self.select_SKUs(self.overage_cost, active_SKUs))
             elif self.evaluation_metric == "quantile_loss":
-                return quantile_loss(self.demand, action, self.sl)
+                return quantile_loss(demand, action, self.select_SKUs(self.sl, active_SKUs))
 
     def set_observation_space(self,
                             shape: tuple, # shape of the dataloader features
@@ -281,12 +502,14 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
         self.observation_space = gym.spaces.Dict(spaces)
 
     @staticmethod # staticmethod such that the dataloader can also use the funciton
-    def draw_parameter(distribution, sl_bound_low, sl_bound_high, samples):
+    def draw_parameter(distribution, sl_bound_low, sl_bound_high, samples, rng=None):
+
+        rng = np.random if rng is None else rng
         
         if distribution == "fixed":
-            sl = np.random.uniform(sl_bound_low, sl_bound_high, size=(samples,))
+            sl = rng.uniform(sl_bound_low, sl_bound_high, size=(samples,))
         elif distribution == "uniform":
-            sl = np.random.uniform(sl_bound_low, sl_bound_high, size=(samples,))
+            sl = rng.uniform(sl_bound_low, sl_bound_high, size=(samples,))
         else:
             raise ValueError("sl_distribution not recognized.")
         
@@ -304,32 +527,12 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
 
         X_item, Y_item = self.dataloader[self.index]
 
-        # check if any value in X_item is nan.
-
-        if np.isnan(X_item).any():
-            print("X_item is nan")
-            # print index
-            print("total index:", self.index)
-            print("first nan encountered:", np.argwhere(np.isnan(X_item))[0])
-        
-        if np.isnan(Y_item).any():
-            print("Y_item is nan")
-            # print index
-            print("total index:", self.index)
-            print("first nan encountered:", np.argwhere(np.isnan(Y_item))[0])
-
-        # check if any value in X_item is inf.
-
-        if np.isinf(X_item).any():
-            print("X_item is inf")
-            # print index
-            print("total index:", self.index)
-            print("first inf encountered:", np.argwhere(np.isinf(X_item))[0])
-            
-            assert False
+        # data of validated dataloaders is scanned once at construction, per-step checks only in debug mode
+        if self.debug or not self.dataloader.validated:
+            self.check_observation(X_item, Y_item)
 
         if self.mode == "train":
-            sl = self.draw_parameter(self.sl_distribution, self.sl_bound_low, self.sl_bound_high, samples = self.num_SKUs[0])
+            sl = self.sl_sampler()
         else:
             sl = self.sl.copy() # evaluate on fixed sls
 
@@ -345,6 +548,123 @@ class NewsvendorEnvVariableSL(NewsvendorEnv, ABC):
 
         return {"features": X_item, "service_level": sl}, Y_item
 
+    def check_observation(self,
+            X_item: np.ndarray | None, # features of the current period
+            Y_item: np.ndarray, # demand of the current period
+            ) -> None:
+
+        """
+        Check the features and demand of the current period for NaN and Inf values. Only used if the dataloader
+        could not validate its data up front or if the environment is in debug mode (self.debug = True).
+        Raises a ValueError for Inf values in the features.
+        """
+
+        for name, item in [("X_item", X_item), ("Y_item", Y_item)]:
+            if item is None:
+                continue
+            for entry in find_invalid_values(item, name, max_coordinates=1):
+                logging.warning("Index %s: %s", self.index, format_invalid_values(entry))
+                if name == "X_item" and entry["kind"] == "inf":
+                    raise ValueError(f"X_item contains Inf values at index {self.index}.")
+
+    def get_episode(self) -> Tuple[list, np.ndarray]:
+
+        """
+        Return the observations (with the fixed val/test service levels) and demands of all remaining periods
+        of the current episode with one batched dataloader call.
+        """
+
+        observations, demands = super().get_episode()
+
+        move_SKU_axis = hasattr(self.dataloader, "meta_learn_units") and self.dataloader.meta_learn_units
+        observations = [{"features": np.moveaxis(X_item, -1, 0) if move_SKU_axis else X_item, "service_level": self.sl.copy()} for X_item in observations]
+
+        return observations, demands
+
+    def reset_SKU_chunks(self,
+        start_index: int | str = None, # index to start from
+        ) -> None:
+
+        """ Reset the environment for the evaluation in SKU chunks (see step_SKU_chunks) without fetching the full first observation """
+
+        self.check_SKU_chunks()
+        self.reset_sl_sampler()
+        self.reset_index(start_index)
+        self.demand = None
+
+    def step_SKU_chunks(self,
+            policy: Callable, # function returning the order quantities for an observation, e.g., agent.draw_action
+            SKU_chunk_size: int, # number of SKUs per chunk, bounds the size of the observations passed to the policy
+            ) -> Tuple[None, float, bool, bool, dict]:
+
+        """
+        Evaluate the current val or test period in chunks of SKUs: the dataloader returns the features of one chunk at a time
+        (see BaseDataLoader.set_SKU_chunk), the policy computes the order quantities of the chunk and the costs are accumulated.
+        The reward is the same as the one of step with the observation of all SKUs, but the peak memory is bounded by the chunk
+        size instead of the number of SKUs. Postprocessors are applied once to the actions of all SKUs, such that postprocessors
+        with one parameter per SKU work as in step. Returns the tuple of step_ without the next observation.
+        """
+
+        self.check_SKU_chunks()
+
+        if not isinstance(SKU_chunk_size, (int, np.integer)) or SKU_chunk_size < 1:
+            raise ValueError("SKU_chunk_size must be a positive integer.")
+
+        num_SKUs = self.num_SKUs[0]
+        self.demand = np.empty(num_SKUs) # filled chunk by chunk
+        actions = []
+
+        for start in range(0, num_SKUs, SKU_chunk_size):
+            SKU_chunk = slice(start, min(start + SKU_chunk_size, num_SKUs))
+
+            self.dataloader.set_SKU_chunk(SKU_chunk)
+            try:
+                X_item, Y_item = self.dataloader[self.index]
+            finally:
+                self.dataloader.set_SKU_chunk(None)
+
+            if self.debug or not self.dataloader.validated:
+                self.check_observation(X_item, Y_item)
+
+            observation = {"features": np.moveaxis(X_item, -1, 0), "service_level": self.select_SKUs(self.sl, SKU_chunk).copy()}
+
+            action = policy(observation)
+            if action.ndim == 2 and action.shape[0] == 1:
+                action = np.squeeze(action, axis=0)
+
+            self.demand[SKU_chunk] = Y_item
+            actions.append(action)
+
+        action = np.concatenate(actions)
+        for postprocessor in self.postprocessors:
+            action = postprocessor(action)
+        action = action.copy() # postprocessors may reuse their output buffer
+
+        cost_per_SKU = self.determine_cost(action)
+        reward = -np.sum(cost_per_SKU) # negative because we want to minimize the cost
+
+        info = dict(
+            demand=self.demand,
+            action=action,
+            cost_per_SKU=cost_per_SKU
+        )
+
+        self.demand = None
+        truncated = self.set_index()
+
+        return None, reward, False, truncated, info
+
+    def check_SKU_chunks(self):
+
+        """ Check that the environment can be evaluated in SKU chunks """
+
+        if self.mode == "train":
+            raise ValueError("The evaluation in SKU chunks is only available in val and test mode.")
+        if not (self.SKUs_in_batch_dimension and getattr(self.dataloader, "meta_learn_units", False)):
+            raise ValueError("The evaluation in SKU chunks requires SKUs_in_batch_dimension and a dataloader with meta_learn_units.")
+        if self.use_mask:
+            raise ValueError("The evaluation in SKU chunks does not support use_mask.")
+
     def check_evaluation_metric(self):
         if self.evaluation_metric not in ["pinball_loss", "quantile_loss"]:
             raise ValueError("evaluation_metric must be either 'pinball_loss' or 'quantile_loss'.")
@@ -0,0 +1,562 @@
+"""Inventory environments that step many independent episodes at once with array operations"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb.
+
+# %% auto 0
+__all__ = ['VecEnvMixin', 'VecNewsvendorEnv', 'VecNewsvendorEnvVariableSL', 'VecMultiPeriodEnv']
+
+# %% ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb 3
+from typing import Union, Tuple, Literal
+
+from ...utils import Parameter, MDPInfo
+from ...dataloaders.base import BaseDataLoader
+from .single_period import NewsvendorEnv, NewsvendorEnvVariableSL
+from .multi_period import MultiPeriodEnv
+from ...torch_utils.loss_functions import pinball_loss as torch_pinball_loss, quantile_loss as torch_quantile_loss
+from ...torch_utils.relaxations import straight_through_max, straight_through_min, straight_through_heaviside
+
+import numpy as np
+import torch
+
+# %% ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb 4
+class VecEnvMixin():
+
+    """
+    Mixin with the index handling shared by the vectorized environments. Each of the n_envs episodes
+    has its own index, start index and episode end, such that episodes can be reset independently.
+
+    With the torch backend, observations, demand, rewards and the state are tensors and actions may be
+    tensors that require gradients. Costs are then differentiable w.r.t. the actions, such that policies can
+    be trained by backpropagating through simulated episodes. The dataloader and the index handling stay in numpy.
+    """
+
+    supports_episode_batching = False # episodes are already stepped in parallel
+
+    def set_n_envs(self, n_envs: int):
+
+        """ Set the number of parallel episodes and (re-)initialize the per-episode indices. """
+
+        if not isinstance(n_envs, (int, np.integer)) or n_envs < 1:
+            raise ValueError("n_envs must be a positive integer.")
+
+        self.n_envs = int(n_envs)
+        self.index = np.zeros(self.n_envs, dtype=int)
+        self.start_index = np.zeros(self.n_envs, dtype=int)
+        self.max_index_episode = np.zeros(self.n_envs)
+
+    def set_backend(self,
+        backend: Literal["numpy", "torch"], # array library of observations, actions, rewards and state
+        device: str | torch.device = "cpu", # device of the tensors in the torch backend
+        temperature: float = 1.0, # temperature of the straight-through relaxations in the torch backend, 0 for exact subgradients
+        ) -> None:
+
+        """ Set the array library of the environment """
+
+        if backend not in ["numpy", "torch"]:
+            raise ValueError("backend must be 'numpy' or 'torch'")
+
+        self.backend = backend
+        self.device = torch.device(device)
+        self.temperature = temperature
+
+    def to_backend(self,
+        value: np.ndarray | Parameter | dict | None, # array, parameter or observation dict
+        ) -> np.ndarray | torch.Tensor | dict | None:
+
+        """ Convert arrays and parameters (also inside observation dicts) to tensors in the torch backend """
+
+        if self.backend == "numpy" or value is None:
+            return value
+        if isinstance(value, dict):
+            return {key: self.to_backend(item) for key, item in value.items()}
+        if isinstance(value, Parameter):
+            value = value.get_value()
+
+        return torch.as_tensor(value, dtype=torch.get_default_dtype(), device=self.device)
+
+    def copy(self, value: np.ndarray | torch.Tensor) -> np.ndarray | torch.Tensor:
+        """ Copy an array or tensor """
+        return value.clone() if isinstance(value, torch.Tensor) else value.copy()
+
+    def maximum(self, input, other):
+        """ Elementwise maximum, a straight-through relaxation in the torch backend """
+        if self.backend == "torch":
+            return straight_through_max(input, other, self.temperature)
+        return np.maximum(input, other)
+
+    def minimum(self, input, other):
+        """ Elementwise minimum, a straight-through relaxation in the torch backend """
+        if self.backend == "torch":
+            return straight_through_min(input, other, self.temperature)
+        return np.minimum(input, other)
+
+    def is_positive(self, input):
+        """ Indicator whether the input is positive, a straight-through relaxation in the torch backend """
+        if self.backend == "torch":
+            return straight_through_heaviside(input, self.temperature)
+        return input > 0
+
+    def reset_index(self,
+        start_index: int | str | np.ndarray, # index to start from, either the same for all episodes or one per episode
+        env_ids: np.ndarray = None # episodes to reset, all if None
+        ) -> None:
+
+        """
+        Reset the indices of the selected episodes. If start_index is "random", the start indices are drawn
+        independently for each episode from the training data.
+        """
+
+        env_ids = np.arange(self.n_envs) if env_ids is None else np.asarray(env_ids)
+
+        start_index = self.get_start_index(start_index)
+
+        if isinstance(start_index, str):
+            if start_index != "random":
+                raise ValueError("start_index must be an integer, an array of integers or 'random'")
+            if self.mode != "train":
+                raise ValueError("start_index cannot be 'random' in val or test mode")
+            if self.dataloader.len_train is not None and self.dataloader.len_train > self.mdp_info.horizon:
+                start_index = self.rng.choice(self.dataloader.len_train-self.mdp_info.horizon, size=len(env_ids))
+            else:
+                start_index = np.zeros(len(env_ids), dtype=int)
+        elif isinstance(start_index, (int, np.integer, np.ndarray, list)):
+            start_index = np.broadcast_to(np.asarray(start_index, dtype=int), (len(env_ids),))
+        else:
+            raise ValueError("start_index must be an integer, an array of integers or 'random'")
+
+        self.max_index = self.dataloader.len_train if self.mode == "train" else self.dataloader.len_val if self.mode == "val" else self.dataloader.len_test
+        self.max_index -= 1
+        max_index_episode = np.minimum(self.max_index, start_index+self.mdp_info.horizon)
+        if self.mode == "test" or self.mode == "val":
+            max_index_episode = max_index_episode + 1
+
+        self.start_index[env_ids] = start_index
+        self.index[env_ids] = start_index
+        self.max_index_episode[env_ids] = max_index_episode
+
+    def check_action(self,
+            action: np.ndarray # order quantities of shape (n_envs, num_SKUs)
+            ) -> np.ndarray:
+
+        """ Check the shape of a batched action, a single action is accepted if n_envs is 1. """
+
+        action = self.to_backend(action) if self.backend == "torch" else np.asarray(action)
+        if action.ndim == 1 and self.n_envs == 1:
+            action = action[None]
+        if tuple(action.shape) != (self.n_envs, self.num_SKUs[0]):
+            raise ValueError(f"action must have shape {(self.n_envs, self.num_SKUs[0])}, but got {action.shape}")
+
+        return action
+
+
+# %% ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb 7
+class VecNewsvendorEnv(VecEnvMixin, NewsvendorEnv):
+
+    """
+    Vectorized version of the NewsvendorEnv that steps n_envs independent episodes at once. Each episode has its
+    own index and start point, observations of all episodes are fetched with one batched dataloader call and
+    episodes that are truncated are reset automatically (the returned observation is then the first observation
+    of the new episode). Actions have shape (n_envs, num_SKUs), rewards and truncation flags have shape (n_envs,).
+    Observation and action spaces as well as the MDPInfo describe a single episode. With backend="torch", the
+    costs are computed with the torch loss functions and are differentiable w.r.t. the actions.
+    """
+
+    def __init__(self,
+        underage_cost: Union[np.ndarray, Parameter, int, float] = 1, # underage cost per unit
+        overage_cost: Union[np.ndarray, Parameter, int, float] = 1, # overage cost per unit
+        q_bound_low: Union[np.ndarray, Parameter, int, float] = 0, # lower bound of the order quantity
+        q_bound_high: Union[np.ndarray, Parameter, int, float] = np.inf, # upper bound of the order quantity
+        dataloader: BaseDataLoader = None, # dataloader
+        num_SKUs: Union[int] = None, # if None it will be inferred from the DataLoader
+        gamma: float = 1, # discount factor
+        horizon_train: int | str = "use_all_data", # if "use_all_data" then horizon is inferred from the DataLoader
+        postprocessors: list[object] | None = None,  # default is empty list
+        mode: str = "train", # Initial mode (train, val, test) of the environment
+        return_truncation: str = True, # whether to return a truncated condition in step function
+        n_envs: int = 8, # number of episodes that are stepped in parallel
+        backend: Literal["numpy", "torch"] = "numpy", # array library of observations, actions, rewards and costs
+        device: str = "cpu", # device of the tensors in the torch backend
+        seed: int | np.random.SeedSequence | None = None # seed for the random numbers of the environment, global numpy random state if None
+    ) -> None:
+
+        self.set_n_envs(n_envs)
+        self.set_backend(backend, device)
+
+        NewsvendorEnv.__init__(self,
+                        underage_cost=underage_cost,
+                        overage_cost=overage_cost,
+                        q_bound_low=q_bound_low,
+                        q_bound_high=q_bound_high,
+                        dataloader=dataloader,
+                        num_SKUs=num_SKUs,
+                        gamma=gamma,
+                        horizon_train=horizon_train,
+                        postprocessors=postprocessors,
+                        mode=mode,
+                        return_truncation=return_truncation,
+                        seed=seed)
+
+        self.mdp_info.backend = self.backend
+
+    def reset(self,
+        start_index: int | str | np.ndarray = None, # index to start from, either the same for all episodes or one per episode
+        state: np.ndarray = None # initial state
+        ) -> dict | np.ndarray:
+
+        """
+        Reset all episodes and return the first observations. Start indices follow the same rules as in the
+        NewsvendorEnv, "random" start indices are drawn independently for each episode.
+        """
+
+        self.reset_index(start_index)
+
+        observation, self.demand = self.get_observation()
+
+        return observation
+
+    def get_observation(self):
+
+        """
+        Return the observations and demands of all episodes from one batched dataloader call.
+        """
+
+        X_batch, Y_batch = self.dataloader.get_batch(self.index)
+
+        return self.to_backend(X_batch), self.to_backend(Y_batch)
+
+    def determine_cost(self,
+            action: np.ndarray | torch.Tensor, # order quantities of shape (n_envs, num_SKUs)
+            ) -> np.ndarray | torch.Tensor:
+
+        """ Determine the cost per SKU, with the torch loss functions in the torch backend """
+
+        if self.backend == "numpy":
+            return super().determine_cost(action)
+
+        return torch_pinball_loss(action, self.demand, self.to_backend(self.underage_cost), self.to_backend(self.overage_cost), reduction="none")
+
+    def step_(self,
+            action: np.ndarray # order quantities of shape (n_envs, num_SKUs)
+            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+
+        """
+        Step all episodes at once. The costs of all episodes are computed in one operation and the info dict
+        holds arrays of shape (n_envs, num_SKUs). Truncated episodes are reset automatically.
+        """
+
+        action = self.check_action(action)
+
+        cost_per_SKU = self.determine_cost(action)
+        reward = -cost_per_SKU.sum(axis=1) # negative because we want to minimize the cost
+
+        terminated = np.zeros(self.n_envs, dtype=bool) # in this problem there is no termination condition
+
+        info = dict(
+            demand=self.copy(self.demand),
+            action=self.copy(action),
+            cost_per_SKU=cost_per_SKU
+        )
+
+        self.index += 1
+        truncated = self.index >= self.max_index_episode
+
+        if truncated.any():
+            self.reset_index(None, env_ids=np.flatnonzero(truncated))
+
+        observation, self.demand = self.get_observation()
+
+        return observation, reward, terminated, truncated, info
+
+
+# %% ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb 18
+class VecNewsvendorEnvVariableSL(VecNewsvendorEnv, NewsvendorEnvVariableSL):
+
+    """
+    Vectorized version of the NewsvendorEnvVariableSL. During training, a service level is drawn for each
+    episode and SKU in every period, the observation contains features of shape (n_envs, ...) and service
+    levels of shape (n_envs, num_SKUs).
+    """
+
+    def __init__(self,
+        sl_bound_low: Union[np.ndarray, Parameter, int, float] = 0.1, # lower bound of the service level during training
+        sl_bound_high: Union[np.ndarray, Parameter, int, float] = 0.9, # upper bound of the service level during training
+        sl_distribution: Literal["fixed", "uniform"] = "fixed", # distribution of the random service level during training, if fixed then the service level is fixed to sl_test_val
+        evaluation_metric: Literal["pinball_loss", "quantile_loss"] = "quantile_loss", # quantile loss is the generic quantile loss (independent of cost levels) while pinball loss uses the specific under- and overage costs
+        sl_test_val: Union[np.ndarray, Parameter, int, float] = None, # service level during test and validation, alternatively use cu and co
+        underage_cost: Union[np.ndarray, Parameter, int, float] = 1, # underage cost per unit
+        overage_cost: Union[np.ndarray, Parameter, int, float] = 1, # overage cost per unit
+        q_bound_low: Union[np.ndarray, Parameter, int, float] = 0, # lower bound of the order quantity
+        q_bound_high: Union[np.ndarray, Parameter, int, float] = np.inf, # upper bound of the order quantity
+        dataloader: BaseDataLoader = None, # dataloader
+        num_SKUs: Union[int] = None, # if None it will be inferred from the DataLoader
+        gamma: float = 1, # discount factor
+        horizon_train: int | str = "use_all_data", # if "use_all_data" then horizon is inferred from the DataLoader
+        postprocessors: list[object] | None = None,  # default is empty list
+        mode: str = "train", # Initial mode (train, val, test) of the environment
+        return_truncation: str = True, # whether to return a truncated condition in step function
+        SKUs_in_batch_dimension: bool = False, # whether SKUs in the observation space are in the batch dimension (not supported for vectorized environments)
+        n_envs: int = 8, # number of episodes that are stepped in parallel
+        backend: Literal["numpy", "torch"] = "numpy", # array library of observations, actions, rewards and costs
+        device: str = "cpu", # device of the tensors in the torch backend
+        seed: int | np.random.SeedSequence | None = None # seed for the random numbers of the environment, global numpy random state if None
+    ) -> None:
+
+        if SKUs_in_batch_dimension or getattr(dataloader, "meta_learn_units", False):
+            raise NotImplementedError("Vectorized environments do not support SKUs in the batch dimension.")
+
+        self.set_n_envs(n_envs)
+        self.set_backend(backend, device)
+
+        NewsvendorEnvVariableSL.__init__(self,
+                        sl_bound_low=sl_bound_low,
+                        sl_bound_high=sl_bound_high,
+                        sl_distribution=sl_distribution,
+                        evaluation_metric=evaluation_metric,
+                        sl_test_val=sl_test_val,
+                        underage_cost=underage_cost,
+                        overage_cost=overage_cost,
+                        q_bound_low=q_bound_low,
+                        q_bound_high=q_bound_high,
+                        dataloader=dataloader,
+                        num_SKUs=num_SKUs,
+                        gamma=gamma,
+                        horizon_train=horizon_train,
+                        postprocessors=postprocessors,
+                        mode=mode,
+                        return_truncation=return_truncation,
+                        SKUs_in_batch_dimension=SKUs_in_batch_dimension,
+                        seed=seed)
+
+        self.mdp_info.backend = self.backend
+
+    def reset(self,
+        start_index: int | str | np.ndarray = None, # index to start from, either the same for all episodes or one per episode
+        state: np.ndarray = None # initial state
+        ) -> dict:
+
+        """ Reset all episodes, the service levels of the new episodes are pre-drawn at once """
+
+        self.reset_sl_sampler()
+
+        return VecNewsvendorEnv.reset(self, start_index, state)
+
+    def draw_sl_block(self,
+        num_periods: int # number of periods to draw service levels for
+        ) -> np.ndarray:
+
+        """ Draw the service levels of all episodes and SKUs for several periods at once """
+
+        sl = self.draw_parameter(self.sl_distribution, self.sl_bound_low, self.sl_bound_high, samples = num_periods*self.n_envs*self.num_SKUs[0], rng=self.sl_rng)
+
+        return sl.reshape(num_periods, self.n_envs, self.num_SKUs[0])
+
+    def get_observation(self):
+
+        """
+        Return the observations of all episodes from one batched dataloader call together with
+        the service levels of shape (n_envs, num_SKUs).
+        """
+
+        X_batch, Y_batch = self.dataloader.get_batch(self.index)
+
+        if self.mode == "train":
+            sl = self.sl_sampler()
+        else:
+            sl = np.tile(self.sl, (self.n_envs, 1)) # evaluate on fixed sls
+
+        self.sl_period = sl # store the service level to assess the action
+
+        return self.to_backend({"features": X_batch, "service_level": sl}), self.to_backend(Y_batch)
+
+    def determine_cost(self,
+            action: np.ndarray | torch.Tensor, # order quantities of shape (n_envs, num_SKUs)
+            ) -> np.ndarray | torch.Tensor:
+
+        """ Determine the cost per SKU, with the torch loss functions in the torch backend """
+
+        if self.backend == "numpy":
+            return NewsvendorEnvVariableSL.determine_cost(self, action)
+
+        if self.mode == "train": # during training only the service level is relevant
+            return torch_quantile_loss(action, self.demand, self.to_backend(self.sl_period), reduction="none")
+        elif self.evaluation_metric == "pinball_loss":
+            return VecNewsvendorEnv.determine_cost(self, action)
+        else:
+            return torch_quantile_loss(action, self.demand, self.to_backend(self.sl), reduction="none")
+
+
+# %% ../../../nbs/20_environments/21_envs_inventory/40_vector_envs.ipynb 22
+class VecMultiPeriodEnv(VecEnvMixin, MultiPeriodEnv):
+
+    """
+    Vectorized version of the MultiPeriodEnv that steps n_envs independent episodes at once. Inventory has
+    shape (n_envs, num_SKUs) and the order pipelines have shape (n_envs, max_lead_time, num_SKUs). Stochastic
+    lead times are drawn independently for each episode. Episodes that are truncated are reset automatically
+    (inventory and pipeline are set back to their start values). Observation and action spaces as well as the
+    MDPInfo describe a single episode.
+
+    With backend="torch", the inventory recursion uses straight-through relaxations of max, min and the ordering
+    indicator: costs are exact, but gradients w.r.t. the orders also flow through lost sales, capped inventory and
+    fixed ordering costs. Rewards of a simulated episode can then be backpropagated to the parameters of a policy.
+    """
+
+    def __init__(self,
+        underage_cost: np.ndarray | Parameter | int | float = 1,  # underage cost per unit
+        overage_cost: np.ndarray | Parameter | int | float = 0,  # overage cost per unit (zero in most cases)
+        fixed_ordering_cost: np.ndarray | Parameter | int | float = 0,  # fixed ordering cost (applies per SKU, not jointly)
+        variable_ordering_cost: np.ndarray | Parameter | int | float = 0,  # variable ordering cost per unit
+        holding_cost: np.ndarray | Parameter | int | float = 1,  # holding cost per unit
+        start_inventory: np.ndarray | Parameter | int | float = 0,  # initial inventory
+        max_inventory: np.ndarray | Parameter | int | float = np.inf,  # maximum inventory
+        inventory_pipeline_params: dict | None = None,  # parameters for the inventory pipeline, only lead_time_mean must be given.
+        q_bound_low: np.ndarray | Parameter | int | float = 0,  # lower bound of the order quantity
+        q_bound_high: np.ndarray | Parameter | int | float = np.inf,  # upper bound of the order quantity
+        dataloader: BaseDataLoader = None,  # dataloader
+        num_SKUs: int | None = None,  # if None, it will be inferred from the DataLoader
+        gamma: float = 1,  # discount factor
+        horizon_train: int | str = 100,  # if "use_all_data", then horizon is inferred from the DataLoader
+        postprocessors: list[object] | None = None,  # default is an empty list
+        mode: str = "train",  # Initial mode (train, val, test) of the environment
+        return_truncation: bool = True,  # whether to return a truncated condition in step function
+        step_info_verbosity = 0,  # 0: no info, 1: some info, 2: all info
+        n_envs: int = 8, # number of episodes that are stepped in parallel
+        backend: Literal["numpy", "torch"] = "numpy", # array library of observations, actions, rewards and state
+        device: str = "cpu", # device of the tensors in the torch backend
+        temperature: float = 1.0, # temperature of the straight-through relaxations in the torch backend (in units of demand), 0 for exact subgradients
+        seed: int | np.random.SeedSequence | None = None # seed for the random numbers of the environment, global numpy random state if None
+    ) -> None:
+
+        self.set_n_envs(n_envs)
+        self.set_backend(backend, device, temperature)
+
+        inventory_pipeline_params = dict(inventory_pipeline_params or {})
+        inventory_pipeline_params["n_envs"] = self.n_envs
+        inventory_pipeline_params["backend"] = self.backend
+
+        MultiPeriodEnv.__init__(self,
+                        underage_cost=underage_cost,
+                        overage_cost=overage_cost,
+                        fixed_ordering_cost=fixed_ordering_cost,
+                        variable_ordering_cost=variable_ordering_cost,
+                        holding_cost=holding_cost,
+                        start_inventory=start_inventory,
+                        max_inventory=max_inventory,
+                        inventory_pipeline_params=inventory_pipeline_params,
+                        q_bound_low=q_bound_low,
+                        q_bound_high=q_bound_high,
+                        dataloader=dataloader,
+                        num_SKUs=num_SKUs,
+                        gamma=gamma,
+                        horizon_train=horizon_train,
+                        postprocessors=postprocessors,
+                        mode=mode,
+                        return_truncation=return_truncation,
+                        step_info_verbosity=step_info_verbosity,
+                        seed=seed)
+
+        self.mdp_info.backend = self.backend
+
+    def step_(self,
+            action: np.ndarray # order quantities of shape (n_envs, num_SKUs)
+            ) -> Tuple[dict, np.ndarray, np.ndarray, np.ndarray, dict]:
+
+        """
+        Step all episodes at once. The cost components in the info dict have shape (n_envs, num_SKUs).
+        Truncated episodes are reset automatically.
+        """
+
+        action = self.check_action(action)
+
+        variable_ordering_cost = action * self.to_backend(self.variable_ordering_cost)
+        fixed_ordering_cost = self.is_positive(action) * self.to_backend(self.fixed_ordering_cost)
+
+        orders_arriving = self.order_pipeline.step(action) # add orders to pipeline and get arriving orders
+
+        inventory = self.minimum(self.inventory + orders_arriving - self.demand, self.to_backend(self.max_inventory))
+
+        underage_quantity = self.maximum(-inventory, 0)
+        underage_cost = underage_quantity * self.to_backend(self.underage_cost)
+        self.inventory = self.maximum(inventory, 0)
+
+        holding_cost = self.inventory * self.to_backend(self.holding_cost)
+
+        total_cost_step = variable_ordering_cost + fixed_ordering_cost + underage_cost + holding_cost
+        reward = -total_cost_step.sum(axis=1) # negative because we want to minimize the cost
+
+        terminated = np.zeros(self.n_envs, dtype=bool) # in this problem there is no termination condition
+
+        info = {}
+        if self.step_info_verbosity > 1:
+            info["demand"] = self.copy(self.demand)
+            info["action"] = self.copy(action)
+            info["cost_per_SKU"] = total_cost_step
+            info["underage_quantity"] = underage_quantity
+            info["inventory"] = self.copy(self.inventory) # inventory after demand, used for the holding cost
+        if self.step_info_verbosity > 0:
+            info["variable_ordering_cost"] = variable_ordering_cost
+            info["fixed_ordering_cost"] = fixed_ordering_cost
+            info["underage_cost"] = underage_cost
+            info["holding_cost"] = holding_cost
+
+        self.index += 1
+        truncated = self.index >= self.max_index_episode
+
+        if truncated.any():
+            env_ids = np.flatnonzero(truncated)
+            self.order_pipeline.reset(env_ids)
+            if self.backend == "torch":
+                self.inventory = torch.where(torch.as_tensor(truncated, device=self.device)[:, None], self.to_backend(self.start_inventory), self.inventory)
+            else:
+                self.inventory[env_ids] = self.start_inventory
+            self.reset_index(None, env_ids=env_ids)
+
+        observation, self.demand = self.get_observation()
+
+        return observation, reward, terminated, truncated, info
+
+    def get_observation(self):
+
+        """
+        Return the observations of all episodes from one batched dataloader call together with
+        the order pipelines and inventory levels.
+        """
+
+        X_batch, Y_batch = self.dataloader.get_batch(self.index)
+
+        observation = {
+            "features": X_batch,
+            "order_pipeline": self.copy(self.order_pipeline.get_pipeline()),
+            "inventory": self.copy(self.inventory),
+        }
+
+        return self.to_backend(observation), self.to_backend(Y_batch)
+
+    def reset(self,
+        start_index: int | str | np.ndarray = None, # index to start from, either the same for all episodes or one per episode
+        state: np.ndarray = None # initial state
+        ) -> dict:
+
+        """
+        Reset all episodes, including inventory and order pipelines, and return the first observations.
+        """
+
+        self.order_pipeline.reset()
+        self.inventory = self.to_backend(np.tile(self.start_inventory, (self.n_envs, 1)))
+
+        self.reset_index(start_index)
+
+        observation, self.demand = self.get_observation()
+
+        return observation
+
+    def detach_state(self) -> None:
+
+        """
+        Detach inventory and order pipelines from the computational graph in the torch backend, e.g., to
+        truncate backpropagation in long episodes. Resetting the environment starts a new graph as well.
+        """
+
+        if self.backend == "torch":
+            self.inventory = self.inventory.detach()
+            self.order_pipeline.buffer = self.order_pipeline.buffer.detach()
+
@@ -0,0 +1,183 @@
+"""Wrapper that fetches the data of the next period on a background thread while the agent computes its action"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/20_environments/20_base_env/30_prefetch_env.ipynb.
+
+# %% auto 0
+__all__ = ['PrefetchDataLoader', 'PrefetchEnv']
+
+# %% ../../nbs/20_environments/20_base_env/30_prefetch_env.ipynb 3
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+
+import gymnasium as gym
+import numpy as np
+
+from .base import BaseEnvironment
+from ..dataloaders.base import BaseDataLoader
+
+# %% ../../nbs/20_environments/20_base_env/30_prefetch_env.ipynb 6
+class PrefetchDataLoader():
+
+    """
+    Proxy of a dataloader that fetches the item of the next index on a background thread each time an item is
+    requested. If the requested index is not the prefetched one (e.g., after a reset to a random start index),
+    the item is fetched synchronously. All other attributes and methods are forwarded to the dataloader. Methods that
+    change the items of the dataloader discard the pending prefetch first, and nothing is prefetched while a chunk of
+    SKUs is set (see BaseDataLoader.set_SKU_chunk).
+    """
+
+    state_changing_methods = ["set_return_sku", "set_train_subset", "test_out_of_sample_SKUs", "update_lag_features"]
+
+    def __init__(self,
+            dataloader: BaseDataLoader, # dataloader whose __getitem__ does not draw random numbers
+            ) -> None:
+
+        self.dataloader = dataloader
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ddopai_prefetch")
+
+        self.prefetched_index = None
+        self.future = None
+        self.SKU_chunk = None
+
+        self.hits = 0 # number of items taken from the prefetch
+        self.misses = 0 # number of items fetched synchronously
+
+    def __getitem__(self, idx):
+
+        """ Return the item at idx, from the prefetch if available, and start fetching the item at idx+1 """
+
+        future = self.take_prefetch(idx)
+
+        if future is not None and future.exception() is None:
+            item = future.result()
+            self.hits += 1
+        else:
+            # errors of the prefetch (e.g., index out of range) are raised by the synchronous fetch
+            item = self.dataloader[idx]
+            self.misses += 1
+
+        if self.SKU_chunk is None: # the chunk usually changes before the next item is requested
+            self.prefetch(idx + 1)
+
+        return item
+
+    def __len__(self):
+        return len(self.dataloader)
+
+    def __getattr__(self, name):
+        # only called for attributes not found on the proxy
+        if name == "dataloader":
+            raise AttributeError(name)
+
+        attribute = getattr(self.dataloader, name)
+
+        if name in self.state_changing_methods:
+            def call_without_prefetch(*args, **kwargs):
+                self.discard_prefetch() # the pending item may be fetched with the old state
+                return attribute(*args, **kwargs)
+            return call_without_prefetch
+
+        return attribute
+
+    def prefetch(self, idx):
+
+        """ Start fetching the item at idx on the background thread """
+
+        self.discard_prefetch()
+        self.prefetched_index = idx
+        self.future = self.executor.submit(self.dataloader.__getitem__, idx)
+
+    def take_prefetch(self, idx) -> Future | None:
+
+        """ Return the pending prefetch if it is for idx, otherwise discard it """
+
+        if self.future is not None and self.prefetched_index == idx:
+            future = self.future
+            self.future = None
+            self.prefetched_index = None
+            return future
+
+        self.discard_prefetch()
+        return None
+
+    def discard_prefetch(self):
+
+        """ Wait for the pending prefetch to finish and drop it """
+
+        if self.future is not None:
+            self.future.exception() # waits without raising
+            self.future = None
+            self.prefetched_index = None
+
+    def train(self):
+        """ Set the dataloader to train mode, the pending prefetch is discarded """
+        self.discard_prefetch()
+        self.dataloader.train()
+
+    def val(self):
+        """ Set the dataloader to validation mode, the pending prefetch is discarded """
+        self.discard_prefetch()
+        self.dataloader.val()
+
+    def test(self):
+        """ Set the dataloader to test mode, the pending prefetch is discarded """
+        self.discard_prefetch()
+        self.dataloader.test()
+
+    def set_SKU_chunk(self, SKU_chunk: slice | None):
+        """ Restrict the items to a chunk of SKUs, a change discards the pending prefetch and no item is prefetched while a chunk is set """
+        if SKU_chunk != self.SKU_chunk:
+            self.discard_prefetch()
+        self.dataloader.set_SKU_chunk(SKU_chunk)
+        self.SKU_chunk = SKU_chunk
+
+    def close(self):
+        """ Discard the pending prefetch and stop the background thread """
+        self.discard_prefetch()
+        self.executor.shutdown(wait=True)
+
+# %% ../../nbs/20_environments/20_base_env/30_prefetch_env.ipynb 9
+class PrefetchEnv(gym.Wrapper):
+
+    """
+    Wrapper that replaces the dataloader of an environment by a PrefetchDataLoader, such that the data of the
+    next period is fetched while the agent computes its action. Rewards and observations are the same as those of
+    the unwrapped environment. Dataloaders that draw random numbers when an item is requested (distribution
+    dataloaders and the MultiShapeLoader with permutate_inputs) are used synchronously to keep the random stream
+    of the environment reproducible.
+    """
+
+    def __init__(self,
+            env: BaseEnvironment, # environment that reads its data with dataloader[index], e.g., any BaseInventoryEnv
+            ) -> None:
+
+        super().__init__(env)
+
+        self.original_dataloader = env.dataloader
+
+        if self.fetches_randomly(env.dataloader):
+            logging.info("Dataloader draws random numbers per item, the data is fetched synchronously.")
+            self.prefetch_dataloader = None
+        else:
+            self.prefetch_dataloader = PrefetchDataLoader(env.dataloader)
+            self.env.dataloader = self.prefetch_dataloader
+
+    @staticmethod
+    def fetches_randomly(dataloader: BaseDataLoader) -> bool:
+        """ Whether the dataloader draws random numbers in __getitem__ """
+        return getattr(dataloader, "is_distribution", False) or getattr(dataloader, "permutate_inputs", False)
+
+    def reset(self, **kwargs):
+        """ Reset the environment, see the reset function of the environment """
+        return self.env.reset(**kwargs)
+
+    def close(self):
+
+        """ Stop the background thread and restore the dataloader of the environment """
+
+        if self.prefetch_dataloader is not None:
+            self.prefetch_dataloader.close()
+            self.env.dataloader = self.original_dataloader
+            self.prefetch_dataloader = None
+
+        super().close()
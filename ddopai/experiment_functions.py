@@ -4,7 +4,8 @@
 
 # %% auto 0
 __all__ = ['EarlyStoppingHandler', 'calculate_score', 'log_info', 'update_best', 'save_agent', 'test_agent', 'run_test_episode',
-           'run_experiment']
+           'run_test_episode_SKU_chunks', 'can_batch_episode', 'run_test_episode_batched', 'run_experiment',
+           'make_cost_grid', 'rescore_episode']
 
 # %% ../nbs/30_experiment_functions/10_experiment_functions.ipynb 3
 from abc import ABC, abstractmethod
@@ -12,11 +13,16 @@ from typing import Union, List, Tuple, Dict, Literal
 import logging
 from datetime import datetime  
 import numpy as np
+import pandas as pd
+import itertools
 import sys
 import wandb
 
 from .envs.base import BaseEnvironment
 from .agents.base import BaseAgent
+from .loss_functions import pinball_loss, quantile_loss
+from .profiling import PROFILER
+from .tracking import track_profile
 
 import importlib
 
@@ -115,8 +121,9 @@ def log_info(R: float,
     '''
 
     if tracking == "wandb":
-        for epoch in range(n_epochs):
-            wandb.log({f"{mode}/R": R, f"{mode}/J": J})
+        with PROFILER.timer("experiment/logging"):
+            for epoch in range(n_epochs):
+                wandb.log({f"{mode}/R": R, f"{mode}/J": J})
     else:
         pass
 
@@ -152,21 +159,22 @@ def save_agent(agent: BaseAgent, # Any agent inheriting from BaseAgent
 
     """
 
-    if save_best:
-        if criteria == "R":
-            if R == best_R:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-            elif force_save:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-        elif criteria == "J":
-            if J == best_J:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
-            elif force_save:
-                save_dir = f"{experiment_dir}/saved_models/best"
-                agent.save(save_dir)
+    with PROFILER.timer("experiment/save_agent"):
+        if save_best:
+            if criteria == "R":
+                if R == best_R:
+                    save_dir = f"{experiment_dir}/saved_models/best"
+                    agent.save(save_dir)
+                elif force_save:
+                    save_dir = f"{experiment_dir}/saved_models/best"
+                    agent.save(save_dir)
+            elif criteria == "J":
+                if J == best_J:
+                    save_dir = f"{experiment_dir}/saved_models/best"
+                    agent.save(save_dir)
+                elif force_save:
+                    save_dir = f"{experiment_dir}/saved_models/best"
+                    agent.save(save_dir)
 
 # %% ../nbs/30_experiment_functions/10_experiment_functions.ipynb 10
 def test_agent(agent: BaseAgent,
@@ -175,6 +183,8 @@ def test_agent(agent: BaseAgent,
             save_features = False,
             tracking = None, # other: "wandb",
             eval_step_info = False,
+            batch_episode = True, # evaluate the whole episode at once if the environment supports it (see run_test_episode)
+            SKU_chunk_size: int | None = None, # evaluate the SKUs in chunks of this size to bound the memory (see run_test_episode_SKU_chunks)
 ):
 
     """
@@ -183,15 +193,18 @@ def test_agent(agent: BaseAgent,
     
     # TODO make it possible to save dataset via tracking tool
 
-    # Run the test episode
-    dataset = run_test_episode(env, agent, eval_step_info, save_features = save_features)
+    with PROFILER.timer("experiment/test_agent"):
+
+        # Run the test episode
+        dataset = run_test_episode(env, agent, eval_step_info, save_features = save_features, batch_episode = batch_episode, SKU_chunk_size = SKU_chunk_size)
 
-    # Calculate the score
-    R, J = calculate_score(dataset, env)
+        # Calculate the score
+        R, J = calculate_score(dataset, env)
 
     if tracking == "wandb":
-        mode = env.mode
-        wandb.log({f"{mode}/R": R, f"{mode}/J": J})
+        with PROFILER.timer("experiment/logging"):
+            mode = env.mode
+            wandb.log({f"{mode}/R": R, f"{mode}/J": J})
 
     if return_dataset:
         return R, J, dataset
@@ -202,18 +215,28 @@ def run_test_episode(   env: BaseEnvironment, # Any environment inheriting from
                         agent: BaseAgent, # Any agent inheriting from BaseAgent
                         eval_step_info: bool = False, # Print step info during evaluation
                         save_features: bool = False, # Save features (observation) of the dataset. Can be turned off since they sometimes become very large with many lag information
+                        batch_episode: bool = True, # Evaluate the whole episode at once if the environment supports it
+                        SKU_chunk_size: int | None = None, # Evaluate the SKUs of each period in chunks of this size, see run_test_episode_SKU_chunks
 
                 ):
 
     """
     Runs an episode to test the agent's performance.
     It assumes, that agent and environment are initialized, in test/val mode
-    and have done reset.
+    and have done reset. Environments whose actions do not affect future observations
+    (e.g., the NewsvendorEnv) are evaluated for the whole episode at once, see
+    run_test_episode_batched. Other environments are stepped period by period.
     """
 
+    if SKU_chunk_size is not None:
+        return run_test_episode_SKU_chunks(env, agent, SKU_chunk_size, eval_step_info)
+
     # Get initial observation
     obs = env.reset()
 
+    if batch_episode and can_batch_episode(env):
+        return run_test_episode_batched(env, agent, eval_step_info, save_features = save_features)
+
     dataset = []
     
     finished = False
@@ -257,6 +280,106 @@ def run_test_episode(   env: BaseEnvironment, # Any environment inheriting from
 
     return dataset
 
+def run_test_episode_SKU_chunks(env: BaseEnvironment, # Environment that supports the evaluation in SKU chunks, e.g., NewsvendorEnvVariableSL with a meta_learn_units dataloader
+                        agent: BaseAgent, # Any agent inheriting from BaseAgent
+                        SKU_chunk_size: int, # number of SKUs passed to the agent at once
+                        eval_step_info: bool = False, # Print step info during evaluation
+                        ) -> List:
+
+    """
+    Runs a test episode in which the SKUs of each period are passed through the dataloader, the agent and the loss chunk
+    by chunk (see NewsvendorEnvVariableSL.step_SKU_chunks). Rewards and hence R and J are the same as for run_test_episode,
+    but the peak memory is bounded by the chunk size. Features are not saved.
+    """
+
+    if not hasattr(env, "step_SKU_chunks"):
+        raise ValueError(f"{type(env).__name__} does not support the evaluation in SKU chunks.")
+
+    env.reset_SKU_chunks()
+
+    dataset = []
+    finished = False
+    step = 0
+
+    while not finished:
+
+        _, reward, terminated, truncated, info = env.step_SKU_chunks(agent.draw_action, SKU_chunk_size)
+
+        dataset.append(((None, info["action"], reward, None, terminated, truncated), info))
+
+        finished = terminated or truncated
+
+        if eval_step_info:
+            step += 1
+            sys.stdout.write(f"\rStep {step}")
+            sys.stdout.flush()
+
+    if eval_step_info:
+        print()
+
+    return dataset
+
+def can_batch_episode(env: BaseEnvironment # Any environment inheriting from BaseEnvironment
+                    ) -> bool:
+
+    """
+    Check if the current episode of the environment can be evaluated at once. This requires an environment
+    whose actions do not affect future observations and a fixed val or test episode.
+    """
+
+    return getattr(env, "supports_episode_batching", False) \
+        and env.mode in ["val", "test"] \
+        and not getattr(env.dataloader, "is_distribution", False)
+
+def run_test_episode_batched(env: BaseEnvironment, # Environment that supports episode batching (see can_batch_episode)
+                        agent: BaseAgent, # Any agent inheriting from BaseAgent
+                        eval_step_info: bool = False, # Print the number of steps after evaluation
+                        save_features: bool = False, # Save features (observation) of the dataset
+                        ):
+
+    """
+    Evaluate the remaining episode at once: the environment returns all observations and demands, the agent
+    predicts all actions in one batched call and the environment scores all actions with one vectorized loss
+    call. The returned dataset is the same as the one of the stepwise evaluation in run_test_episode.
+    """
+
+    observations, demands = env.get_episode()
+
+    if any(observation is None for observation in observations):
+        actions = [agent.draw_action(observation) for observation in observations]
+    else:
+        actions = agent.draw_actions(agent.stack_observations(observations))
+        if not agent.receive_batch_dim:
+            actions = [action[np.newaxis] for action in actions] # same batch dimension as draw_action
+
+    env_actions = []
+    for step, action in enumerate(actions):
+        action = env.expand_action(action, env.index + step)
+        for postprocessor in env.postprocessors: # same as in env.step
+            action = postprocessor(action)
+        env_actions.append(action.copy()) # postprocessors may reuse their output buffer
+
+    rewards, infos = env.score_episode(env_actions, demands)
+
+    dataset = []
+    n_steps = len(actions)
+    for step in range(n_steps):
+
+        truncated = step == n_steps - 1
+
+        if save_features:
+            next_obs = None if truncated else observations[step+1]
+            sample = (observations[step], actions[step], rewards[step], next_obs, False, truncated)
+        else:
+            sample = (None, actions[step], rewards[step], None, False, truncated)
+
+        dataset.append((sample, infos[step]))
+
+    if eval_step_info:
+        print(f"Step {n_steps}")
+
+    return dataset
+
 def run_experiment( agent: BaseAgent,
                     env: BaseEnvironment,
 
@@ -318,7 +441,8 @@ def run_experiment( agent: BaseAgent,
     if agent.train_mode == "direct_fit":
         
         logging.info("Starting training with direct fit")
-        agent.fit(X=env.dataloader.get_all_X("train"), Y=env.dataloader.get_all_Y("train"))
+        with PROFILER.timer("experiment/fit"):
+            agent.fit(X=env.dataloader.get_all_X("train"), Y=env.dataloader.get_all_Y("train"))
         logging.info("Finished training with direct fit")
 
         env.val()
@@ -346,7 +470,8 @@ def run_experiment( agent: BaseAgent,
         logging.info("Starting training with epochs fit")
         for epoch in trange(n_epochs):
             
-            agent.fit_epoch() # Access to dataloader provided to the agent at initialization
+            with PROFILER.timer("experiment/fit"):
+                agent.fit_epoch() # Access to dataloader provided to the agent at initialization
 
             env.val()
             agent.eval()
@@ -404,13 +529,15 @@ def run_experiment( agent: BaseAgent,
 
         if warmup_training:
             env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
-            core.learn(n_steps=warmup_training_steps, n_steps_per_fit=warmup_training_steps, quiet=True)
+            with PROFILER.timer("experiment/fit"):
+                core.learn(n_steps=warmup_training_steps, n_steps_per_fit=warmup_training_steps, quiet=True)
         
         for epoch in trange(n_epochs):
 
             env.set_return_truncation(False) # For mushroom Core to work, the step function should not return the truncation flag
             agent.train()
-            core.learn(n_steps=n_steps, n_steps_per_fit=n_steps_per_fit, quiet=True)
+            with PROFILER.timer("experiment/fit"):
+                core.learn(n_steps=n_steps, n_steps_per_fit=n_steps_per_fit, quiet=True)
             env.set_return_truncation(True) # Set back to standard gynmasium behavior
 
             env.val()
@@ -444,7 +571,112 @@ def run_experiment( agent: BaseAgent,
     else:
         raise ValueError("Unknown train mode")
 
+    if tracking is not None and PROFILER.enabled:
+        track_profile(PROFILER, tracking_tool=tracking)
+
     if return_score:
         return R_list, J_list
 
     logging.info(f"Evaluation after training: R={R}, J={J}")
+
+# %% ../nbs/30_experiment_functions/10_experiment_functions.ipynb 26
+def make_cost_grid(**values # values per cost parameter, e.g., underage_cost=[1, 2, 3], overage_cost=[1, 2]. Values can be scalars or per-SKU arrays
+                ) -> Dict[str, np.ndarray]:
+
+    """
+    Build a grid of cost parameters with all combinations of the given values.
+    Each parameter in the returned grid has one entry per setting.
+    """
+
+    names = list(values.keys())
+    settings = list(itertools.product(*[list(values[name]) for name in names]))
+
+    return {name: np.array([setting[i] for setting in settings], dtype=float) for i, name in enumerate(names)}
+
+def rescore_episode(
+                    dataset: List, # dataset of a recorded episode, see run_test_episode. The MultiPeriodEnv must be run with step_info_verbosity=2
+                    env: BaseEnvironment, # environment the episode was recorded with, provides gamma and the parameters that are not part of the grid
+                    cost_grid: Dict[str, np.ndarray], # one entry per setting for each parameter, see make_cost_grid
+                    ) -> pd.DataFrame: # one row per setting with the parameters, R and J (and the total of each cost component for the MultiPeriodEnv)
+
+    """
+    Re-score a recorded episode for a whole grid of cost parameters or service levels. Since actions and demand
+    are known, the costs of all settings, periods and SKUs are computed in one broadcasted computation instead of
+    re-running the episode for every setting. For the NewsvendorEnv the grid can contain underage_cost and overage_cost
+    (pinball loss) or service_level (quantile loss). For the MultiPeriodEnv the grid can contain underage_cost,
+    holding_cost, fixed_ordering_cost and variable_ordering_cost.
+    """
+
+    multi_period = hasattr(env, "holding_cost")
+    valid_parameters = ["underage_cost", "holding_cost", "fixed_ordering_cost", "variable_ordering_cost"] if multi_period \
+        else ["underage_cost", "overage_cost", "service_level"]
+
+    for name in cost_grid:
+        if name not in valid_parameters:
+            raise ValueError(f"Cost parameter {name} not supported for {type(env).__name__}, choose from {valid_parameters}.")
+    if "service_level" in cost_grid and ("underage_cost" in cost_grid or "overage_cost" in cost_grid):
+        raise ValueError("The grid can either contain service_level or underage_cost and overage_cost, not both.")
+
+    if len(cost_grid) == 0:
+        raise ValueError("The grid must contain at least one cost parameter.")
+
+    grid = {name: np.asarray(values, dtype=float) for name, values in cost_grid.items()}
+    n_settings = {len(values) for values in grid.values()}
+    if len(n_settings) != 1:
+        raise ValueError("All parameters of the grid must have the same number of settings.")
+    n_settings = n_settings.pop()
+
+    required_info = ["action", "demand", "underage_quantity", "inventory"] if multi_period else ["action", "demand"]
+    infos = [info for _, info in dataset]
+    if len(infos) == 0 or any(key not in infos[0] for key in required_info):
+        raise ValueError(f"The info of each period must contain {required_info}.")
+
+    if "active_SKUs" in infos[0]: # environments with use_mask only record the available SKUs, the others have no cost
+        dense_infos = []
+        for info in infos:
+            dense_info = {}
+            for key in required_info:
+                dense_info[key] = np.zeros(env.num_SKUs[0])
+                dense_info[key][info["active_SKUs"]] = info[key]
+            dense_infos.append(dense_info)
+        infos = dense_infos
+
+    episode = {key: np.stack([np.asarray(info[key], dtype=float) for info in infos]) for key in required_info} # shape (periods, ...)
+    ndim = episode["action"].ndim
+
+    def get_parameter(name, env_name=None):
+        # reshape to (settings, 1 (periods), ..., SKUs) to broadcast against the episode
+        if name in grid:
+            value = grid[name]
+        else:
+            value = getattr(env, env_name or name)
+            value = value.get_value() if hasattr(value, "get_value") else np.asarray(value, dtype=float)
+            value = value[None]
+        return value.reshape(value.shape[:1] + (1,) * (ndim - value.ndim + 1) + value.shape[1:])
+
+    components = {}
+    if multi_period:
+        actions = episode["action"]
+        components["variable_ordering_cost"] = actions * get_parameter("variable_ordering_cost")
+        components["fixed_ordering_cost"] = np.where(actions > 0, get_parameter("fixed_ordering_cost"), 0)
+        components["underage_cost"] = episode["underage_quantity"] * get_parameter("underage_cost")
+        components["holding_cost"] = episode["inventory"] * get_parameter("holding_cost")
+        cost = sum(np.broadcast_to(component, (n_settings,) + actions.shape) for component in components.values())
+    else:
+        demands, actions = episode["demand"], episode["action"]
+        if "service_level" in grid or ("underage_cost" not in grid and "overage_cost" not in grid and getattr(env, "evaluation_metric", None) == "quantile_loss"):
+            cost = quantile_loss(demands, actions, get_parameter("service_level", "sl"))
+        else:
+            cost = pinball_loss(demands, actions, get_parameter("underage_cost"), get_parameter("overage_cost"))
+        cost = np.broadcast_to(cost, (n_settings,) + actions.shape)
+
+    rewards = -cost.reshape(n_settings, len(infos), -1).sum(axis=2) # negative because we want to minimize the cost
+    discount = env.mdp_info.gamma ** np.arange(len(infos)) # same as calculate_score
+
+    table = pd.DataFrame({name: list(values) if values.ndim > 1 else values for name, values in grid.items()})
+    table["R"] = rewards.sum(axis=1)
+    table["J"] = rewards @ discount
+    for name, component in components.items():
+        table[f"total_{name}"] = np.broadcast_to(component, cost.shape).reshape(n_settings, -1).sum(axis=1)
+
+    return table
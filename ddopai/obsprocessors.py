@@ -3,7 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/11_obsprocessors.ipynb.
 
 # %% auto 0
-__all__ = ['BaseProcessor', 'FlattenTimeDimNumpy', 'ConvertDictSpace', 'AddParamsToFeaturesLEGACY', 'AddParamsToFeatures']
+__all__ = ['BaseProcessor', 'FlattenTimeDimNumpy', 'ConvertDictSpace', 'AddParamsToFeaturesLEGACY', 'AddParamsToFeatures',
+           'DictLayoutProcessor']
 
 # %% ../nbs/00_utils/11_obsprocessors.ipynb 3
 from typing import Union, Optional, List, Tuple, Dict
@@ -387,3 +388,102 @@ class AddParamsToFeatures(BaseProcessor):
 
         return features
             
+
+# %% ../nbs/00_utils/11_obsprocessors.ipynb 12
+class DictLayoutProcessor(BaseProcessor):
+
+    """
+    Converts dict observations into one array with a layout that is compiled once from the observation space of
+    the environment: each key gets a fixed slice of the feature dimension, the features first. Without
+    keep_time_dim, all keys are flattened. With keep_time_dim, keys with the time dimension of the features are
+    written per time step and all other keys are flattened and repeated over time (as in AddParamsToFeatures).
+    Each call writes the keys directly into a preallocated output array, which is reused by the next call with
+    the same batch size. Inputs with an additional leading batch dimension are detected from the shape of the
+    features, e.g., for vectorized environments or environments with SKUs in the batch dimension.
+    """
+
+    supports_batching = True # processes dicts of stacked observations at once (see BaseAgent.draw_actions)
+
+    def __init__(self,
+        environment: object, # The environment object, needed for the observation space
+        keep_time_dim: Optional[bool] = False, # If the time dimension of the features should be kept
+        keys: Optional[List[str]] = None, # order of the keys in the output, features first and then the other keys of the observation space if None
+        ):
+
+        self.keep_time_dim = keep_time_dim
+
+        space = environment.observation_space
+        if keys is None:
+            keys = (["features"] if "features" in space.spaces else []) + [key for key in space.spaces if key != "features"]
+
+        self.sample_shapes = {key: tuple(space[key].shape) for key in keys}
+        if "features" in self.sample_shapes and getattr(environment, "SKUs_in_batch_dimension", False):
+            self.sample_shapes["features"] = self.sample_shapes["features"][1:] # the SKU dimension is the batch dimension
+
+        self.compile()
+
+    def compile(self) -> None:
+
+        """ Determine the slice of each key, how it is broadcast over time and the output shape of a single observation """
+
+        time_steps = None
+        if self.keep_time_dim:
+            if len(self.sample_shapes.get("features", ())) != 2:
+                raise ValueError("keep_time_dim requires features with shape (time_steps, features).")
+            time_steps = self.sample_shapes["features"][0]
+
+        self.layout = [] # key, slice of the feature dimension and shape of the value per time step
+        offset = 0
+        for key, shape in self.sample_shapes.items():
+            per_time_step = time_steps is not None and len(shape) == 2 and shape[0] == time_steps
+            width = shape[1] if per_time_step else int(np.prod(shape))
+            self.layout.append((key, slice(offset, offset + width), per_time_step))
+            offset += width
+
+        self.sample_output_shape = (offset,) if time_steps is None else (time_steps, offset)
+        self.reference_key = self.layout[0][0]
+        self.outputs = {} # output array and copy targets per batch size (None for unbatched observations)
+
+    def allocate(self,
+        batch_size: int | None, # batch size, None for unbatched observations
+        ) -> tuple:
+
+        """
+        Allocate the output array for a batch size together with, for each key, the view of the output the key is
+        written to and the shape the value is reshaped to, such that a call only copies the values.
+        """
+
+        batch_shape = () if batch_size is None else (batch_size,)
+        output = np.empty(batch_shape + self.sample_output_shape)
+
+        targets = []
+        for key, columns, per_time_step in self.layout:
+            target = output[..., columns]
+            width = columns.stop - columns.start
+            if per_time_step or not self.keep_time_dim:
+                value_shape = target.shape
+            else:
+                value_shape = batch_shape + (1, width) if batch_size is not None else (width,) # repeated over time by broadcasting
+            targets.append((key, target, value_shape))
+
+        self.outputs[batch_size] = output, targets
+
+        return output, targets
+
+    def __call__(self,
+                input: Dict, # Observation as dict of with numpy arrays
+                ) -> np.ndarray:
+
+        """
+        Write the observation into the output array and return it.
+        """
+
+        reference = input[self.reference_key]
+        batch_size = reference.shape[0] if reference.ndim > len(self.sample_shapes[self.reference_key]) else None
+
+        output, targets = self.outputs.get(batch_size) or self.allocate(batch_size)
+
+        for key, target, value_shape in targets:
+            np.copyto(target, np.reshape(input[key], value_shape))
+
+        return output
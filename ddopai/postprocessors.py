@@ -3,12 +3,13 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/10_postprocessors.ipynb.
 
 # %% auto 0
-__all__ = ['ClipAction', 'RoundAction', 'MoveBatchToProductDim']
+__all__ = ['ClipAction', 'RoundAction', 'MoveBatchToProductDim', 'PostprocessorPipeline']
 
 # %% ../nbs/00_utils/10_postprocessors.ipynb 3
 from typing import Union, Optional
 
 import numpy as np
+from gymnasium.spaces import Box
 from .utils import Parameter, check_parameter_types
 
 import torch
@@ -136,3 +137,155 @@ class MoveBatchToProductDim():
                 raise ValueError("Removing action dim only works for arrays with one action per unit)")
 
         return output
+
+# %% ../nbs/00_utils/10_postprocessors.ipynb 17
+class PostprocessorPipeline():
+    """
+    Fused chain of ClipAction, RoundAction and MoveBatchToProductDim postprocessors. Shapes and bounds are
+    validated once per input shape (and against the action space, if given) when the chain is set up. Afterwards,
+    the axis moves are applied as views and clipping and rounding are computed in place in a reusable output
+    buffer, such that a call does not allocate new arrays. The returned array is overwritten by the next call
+    with the same input shape, copy it to keep it. With n_envs, actions have an additional leading dimension
+    of environments that share the same bounds and unit sizes.
+    """
+
+    def __init__(self,
+                postprocessors: list[object], # ClipAction, RoundAction and MoveBatchToProductDim postprocessors in the order they are applied
+                action_space: Box | None = None, # action space of a single environment, the chain is set up for it right away
+                n_envs: int | None = None, # number of environments of batched actions with shape (n_envs, ...), None for single actions
+                ):
+
+        for postprocessor in postprocessors:
+            if not isinstance(postprocessor, (ClipAction, RoundAction, MoveBatchToProductDim)):
+                raise TypeError(f"Only ClipAction, RoundAction and MoveBatchToProductDim can be fused, got {type(postprocessor).__name__}")
+
+        self.postprocessors = list(postprocessors)
+        self.n_envs = n_envs
+        self.n_batch_dims = 0 if n_envs is None else 1
+        self.output_shape = None
+        self.plans = {} # setup per input shape
+
+        if action_space is not None:
+            self.output_shape = tuple(action_space.shape)
+            batch_shape = () if n_envs is None else (n_envs,)
+            self.setup(batch_shape + self.get_input_shape(self.output_shape))
+
+    def get_input_shape(self,
+                output_shape: tuple, # shape of the action passed to the environment, without the environment dimension
+                ) -> tuple:
+
+        """ Shape of the input that the chain turns into an action of output_shape """
+
+        shape = tuple(output_shape)
+        for postprocessor in reversed(self.postprocessors):
+            if isinstance(postprocessor, MoveBatchToProductDim):
+                if postprocessor.remove_action_per_unit_dim:
+                    shape = (1,) + shape
+                shape = shape[-1:] + shape[:-1]
+
+        return shape
+
+    def setup(self,
+                input_shape: tuple, # shape of the input including the environment dimension in batched mode
+                ) -> dict:
+
+        """
+        Validate the chain for inputs of input_shape and allocate the output buffer. The parameters of clipping
+        and rounding are moved to the layout of the output, such that all elementwise operations can be applied
+        after the input has been copied into the output buffer.
+        """
+
+        input_shape = tuple(input_shape)
+        batch_shape, shape = input_shape[:self.n_batch_dims], input_shape[self.n_batch_dims:]
+
+        operations = [] # elementwise operations with their parameters in the layout of the current shape
+        moves = [] # whether each axis move also removes the action dimension, in the order of the chain
+
+        for postprocessor in self.postprocessors:
+
+            if isinstance(postprocessor, MoveBatchToProductDim):
+                remove = postprocessor.remove_action_per_unit_dim
+                if len(shape) < 2:
+                    raise ValueError("Input array must have at least 2 dimensions")
+                shape = shape[1:] + shape[:1]
+                if remove:
+                    if len(shape) > 2:
+                        raise ValueError("Removing action dim only works for arrays of shape (num_units, num_actions_per_unit)")
+                    if shape[0] != 1:
+                        raise ValueError("Removing action dim only works for arrays with one action per unit)")
+                    shape = shape[1:]
+                operations = [(name, tuple(self.move_parameter(value, remove) for value in values)) for name, values in operations]
+                moves.append(remove)
+
+            elif isinstance(postprocessor, ClipAction):
+                lower = self.check_parameter(postprocessor.lower, shape, "Lower bound")
+                upper = self.check_parameter(postprocessor.upper, shape, "Upper bound")
+                operations.append(("clip", (lower, upper)))
+
+            else:
+                operations.append(("round", (self.check_parameter(postprocessor.unit_size, shape, "Unit size"),)))
+
+        if self.output_shape is not None and shape != self.output_shape:
+            raise ValueError(f"The postprocessors turn inputs of shape {input_shape} into actions of shape {shape}, but the action space has shape {self.output_shape}")
+
+        # view of the output buffer in the layout of the input, such that the axis moves cost nothing at call time
+        output = np.empty(batch_shape + shape)
+        target = output
+        for remove in reversed(moves):
+            if remove:
+                target = np.expand_dims(target, self.n_batch_dims)
+            target = np.moveaxis(target, -1, self.n_batch_dims)
+
+        plan = dict(operations=operations, output=output, target=target)
+        self.plans[input_shape] = plan
+
+        return plan
+
+    @staticmethod
+    def check_parameter(value: np.ndarray | None, shape: tuple, name: str) -> np.ndarray | None:
+        """ Check that a bound or unit size is a single element or matches the shape of the input at its position in the chain """
+        if value is None:
+            return None
+        value = np.asarray(value, dtype=float)
+        if value.size == 1:
+            return value.reshape(())
+        if value.shape != shape:
+            raise ValueError(f"{name} array must match the input shape or be a single element")
+        return value
+
+    @staticmethod
+    def move_parameter(value: np.ndarray | None, remove: bool) -> np.ndarray | None:
+        """ Apply an axis move of MoveBatchToProductDim to a parameter """
+        if value is None or value.ndim == 0:
+            return value
+        value = np.moveaxis(value, 0, -1)
+        return np.squeeze(value, axis=0) if remove else value
+
+    def __call__(self, input: np.ndarray) -> np.ndarray:
+
+        """
+        Apply the chain to the input and return the reusable output buffer.
+        """
+
+        input = np.asarray(input)
+        plan = self.plans.get(input.shape)
+        if plan is None:
+            plan = self.setup(input.shape)
+
+        output = plan["output"]
+        np.copyto(plan["target"], input)
+
+        for name, values in plan["operations"]:
+            if name == "clip":
+                lower, upper = values
+                if lower is not None:
+                    np.maximum(output, lower, out=output)
+                if upper is not None:
+                    np.minimum(output, upper, out=output)
+            else:
+                unit_size, = values
+                np.divide(output, unit_size, out=output)
+                np.round(output, out=output)
+                np.multiply(output, unit_size, out=output)
+
+        return output
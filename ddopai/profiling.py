@@ -0,0 +1,178 @@
+"""Timers to find the slow phases of the interaction loops between environments, agents and dataloaders"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/31_profiling.ipynb.
+
+# %% auto 0
+__all__ = ['PROFILER', 'PhaseTimer', 'TimerRegistry', 'profiling']
+
+# %% ../nbs/00_utils/31_profiling.ipynb 3
+import os
+import json
+import time
+import logging
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict
+
+import pandas as pd
+
+# %% ../nbs/00_utils/31_profiling.ipynb 4
+class PhaseTimer():
+
+    """ Context manager that adds the time spent in the with-block to one phase of a TimerRegistry """
+
+    __slots__ = ("registry", "phase", "start")
+
+    def __init__(self,
+        registry: object, # TimerRegistry the time is recorded in
+        phase: str, # name of the phase, e.g., "env/step_"
+        ):
+
+        self.registry = registry
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+
+        duration = time.perf_counter() - self.start
+
+        registry = self.registry
+        registry.total_time[self.phase] += duration
+        registry.n_calls[self.phase] += 1
+        if registry.trace:
+            registry.events.append((self.phase, self.start, duration))
+
+        return False
+
+class TimerRegistry():
+
+    """
+    Registry that records the cumulative time and the number of calls per phase of the interaction loops, e.g.,
+    the obsprocessors, draw_action_, the postprocessors and step_. The registry is disabled by default, the timers
+    are then one shared no-op context manager. The time of nested phases is included in the enclosing phase.
+    """
+
+    def __init__(self):
+
+        self.enabled = False
+        self.trace = False
+        self.no_timer = nullcontext()
+        self.reset()
+
+    def enable(self,
+        trace: bool = False, # also keep every single call for the Chrome trace (see to_chrome_trace)
+        ) -> None:
+
+        """ Start recording """
+
+        self.enabled = True
+        self.trace = trace
+
+    def disable(self) -> None:
+
+        """ Stop recording, the recorded times are kept """
+
+        self.enabled = False
+        self.trace = False
+
+    def reset(self) -> None:
+
+        """ Remove all recorded times """
+
+        self.total_time = defaultdict(float)
+        self.n_calls = defaultdict(int)
+        self.events = []
+        self.start_time = time.perf_counter()
+
+    def timer(self,
+        phase: str, # name of the phase, the part before the first "/" is used as category
+        ) -> PhaseTimer | nullcontext:
+
+        """ Context manager that records the time of the with-block under the phase if the registry is enabled """
+
+        if not self.enabled:
+            return self.no_timer
+
+        return PhaseTimer(self, phase)
+
+    def summary(self) -> pd.DataFrame:
+
+        """
+        Table with the number of calls, the total and mean time per call of each phase and the share of the
+        total time since the last reset, sorted by the total time.
+        """
+
+        elapsed = time.perf_counter() - self.start_time
+        phases = sorted(self.total_time, key=self.total_time.get, reverse=True)
+
+        return pd.DataFrame({
+            "calls": [self.n_calls[phase] for phase in phases],
+            "total [s]": [self.total_time[phase] for phase in phases],
+            "mean [us]": [self.total_time[phase] / self.n_calls[phase] * 1e6 for phase in phases],
+            "share [%]": [self.total_time[phase] / elapsed * 100 for phase in phases],
+            }, index=pd.Index(phases, name="phase"))
+
+    def to_chrome_trace(self,
+        path: str | None = None, # file the trace is written to, can be opened with chrome://tracing or https://ui.perfetto.dev
+        ) -> Dict:
+
+        """ Convert the recorded calls into the Chrome trace event format and optionally write it to a JSON file """
+
+        if not self.events:
+            logging.warning("No calls recorded for the trace, enable the registry with trace=True")
+
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [{
+                "name": phase,
+                "cat": phase.split("/")[0],
+                "ph": "X", # complete event with start and duration
+                "ts": (start - self.start_time) * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": 0,
+            } for phase, start, duration in self.events],
+            "displayTimeUnit": "ms",
+        }
+
+        if path is not None:
+            with open(path, "w") as file:
+                json.dump(trace, file)
+
+        return trace
+
+    def aggregates(self,
+        prefix: str = "profiling", # prefix of the keys
+        ) -> Dict[str, float]:
+
+        """ Total time and number of calls per phase as flat dict, e.g., to log them with a tracking tool """
+
+        aggregates = {}
+        for phase in self.total_time:
+            aggregates[f"{prefix}/{phase}/total_time"] = self.total_time[phase]
+            aggregates[f"{prefix}/{phase}/n_calls"] = self.n_calls[phase]
+
+        return aggregates
+
+PROFILER = TimerRegistry() # registry used by the environments, agents, dataset wrappers and run_experiment
+
+# %% ../nbs/00_utils/31_profiling.ipynb 11
+@contextmanager
+def profiling(
+    trace: bool = False, # also keep every single call for the Chrome trace
+    reset: bool = True, # remove the times recorded before
+    ):
+
+    """ Enable the PROFILER within the with-block and disable it afterwards """
+
+    if reset:
+        PROFILER.reset()
+    PROFILER.enable(trace=trace)
+
+    try:
+        yield PROFILER
+    finally:
+        PROFILER.disable()
@@ -47,11 +47,11 @@ def quantile_loss(
         return loss.mean()
     elif reduction == 'sum':
         return loss.sum()
+    elif reduction == 'none':
+        return loss
     else:
         raise ValueError(f"reduction={reduction} is not valid")
 
-    return loss
-
 # %% ../../nbs/00_utils/20_torch_loss_functions.ipynb 5
 class TorchQuantileLoss(_Loss):
 
@@ -135,11 +135,11 @@ def pinball_loss(
         return loss.mean()
     elif reduction == 'sum':
         return loss.sum()
+    elif reduction == 'none':
+        return loss
     else:
         raise ValueError(f"reduction={reduction} is not valid")
 
-    return loss
-
 # %% ../../nbs/00_utils/20_torch_loss_functions.ipynb 11
 class TorchPinballLoss(_Loss):
 
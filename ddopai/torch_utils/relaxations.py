@@ -0,0 +1,56 @@
+"""Straight-through relaxations of non-differentiable operations for simulations in PyTorch"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/00_utils/21_torch_relaxations.ipynb.
+
+# %% auto 0
+__all__ = ['straight_through_max', 'straight_through_min', 'straight_through_heaviside']
+
+# %% ../../nbs/00_utils/21_torch_relaxations.ipynb 3
+import torch
+
+# %% ../../nbs/00_utils/21_torch_relaxations.ipynb 5
+def straight_through_max(
+    input: torch.Tensor,
+    other: torch.Tensor | float,
+    temperature: float = 1.0, # temperature of the smooth maximum temperature * logsumexp(x / temperature) used for the gradient
+) -> torch.Tensor:
+
+    """ Elementwise maximum with the gradient of the smooth maximum """
+
+    other = torch.as_tensor(other, dtype=input.dtype, device=input.device)
+    maximum = torch.maximum(input, other)
+
+    if temperature == 0:
+        return maximum
+
+    smooth = temperature * torch.logaddexp(input / temperature, other / temperature)
+
+    return smooth + (maximum - smooth).detach()
+
+# %% ../../nbs/00_utils/21_torch_relaxations.ipynb 6
+def straight_through_min(
+    input: torch.Tensor,
+    other: torch.Tensor | float,
+    temperature: float = 1.0, # temperature of the smooth minimum used for the gradient
+) -> torch.Tensor:
+
+    """ Elementwise minimum with the gradient of the smooth minimum """
+
+    return -straight_through_max(-input, -torch.as_tensor(other, dtype=input.dtype, device=input.device), temperature)
+
+# %% ../../nbs/00_utils/21_torch_relaxations.ipynb 7
+def straight_through_heaviside(
+    input: torch.Tensor,
+    temperature: float = 1.0, # temperature of the sigmoid sigmoid(x / temperature) used for the gradient
+) -> torch.Tensor:
+
+    """ Indicator whether the input is positive with the gradient of a sigmoid, e.g., for fixed ordering costs """
+
+    indicator = (input > 0).to(input.dtype)
+
+    if temperature == 0:
+        return indicator
+
+    smooth = torch.sigmoid(input / temperature)
+
+    return smooth + (indicator - smooth).detach()
@@ -3,7 +3,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_utils/30_tracking.ipynb.
 
 # %% auto 0
-__all__ = ['get_git_hash', 'get_library_version']
+__all__ = ['get_git_hash', 'get_library_version', 'track_profile']
 
 # %% ../nbs/00_utils/30_tracking.ipynb 3
 from typing import Union, List, Tuple, Literal
@@ -53,3 +53,16 @@ def get_library_version(
             raise ValueError(f"Tracking tool {tracking_tool} is not supported")
 
     return version
+
+# %% ../nbs/00_utils/30_tracking.ipynb 8
+def track_profile(
+    registry: object, # TimerRegistry with the recorded times, e.g., ddopai.profiling.PROFILER
+    tracking_tool: Literal['wandb'] = 'wandb' # Currently only wandb is supported
+    ) -> None:
+
+    """ Track the total time and the number of calls per phase of a TimerRegistry """
+
+    if tracking_tool == 'wandb':
+        wandb.log(registry.aggregates())
+    else:
+        raise ValueError(f"Tracking tool {tracking_tool} is not supported")
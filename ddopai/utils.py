@@ -4,13 +4,15 @@
 
 # %% auto 0
 __all__ = ['check_parameter_types', 'Parameter', 'MDPInfo', 'DatasetWrapper', 'DatasetWrapperMeta', 'merge_dictionaries',
-           'set_param']
+           'set_param', 'BlockSampler', 'get_rng_state', 'set_rng_state']
 
 # %% ../nbs/00_utils/00_utils.ipynb 3
 from torch.utils.data import Dataset
 from typing import Union, List, Tuple, Literal
+from types import ModuleType
 from gymnasium.spaces import Space
 from .dataloaders.base import BaseDataLoader
+from .profiling import PROFILER
 
 import logging
 
@@ -132,7 +134,7 @@ class MDPInfo():
                 gamma: float,
                 horizon: int,
                 dt: float = 1e-1,
-                backend: Literal['numpy'] = 'numpy'  # Currently only numpy is supported
+                backend: Literal['numpy', 'torch'] = 'numpy'  # array library of observations, actions and rewards
             ) -> None: 
 
         self.observation_space = observation_space
@@ -183,14 +185,16 @@ class DatasetWrapper(Dataset):
 
         # create tuple of items
 
-        output = self.dataloader[idx]
+        with PROFILER.timer("dataset/dataloader"):
+            output = self.dataloader[idx]
 
         X = output[0]
 
         X = np.expand_dims(X, axis=0) # single datapoints are always returned without batch dimension, need to add for obsprocessors
 
-        for obsprocessor in self.obsprocessors:
-            X = obsprocessor(X)
+        with PROFILER.timer("dataset/obsprocessors"):
+            for obsprocessor in self.obsprocessors:
+                X = obsprocessor(X)
         
         X = np.squeeze(X, axis=0) # remove batch dimension
 
@@ -259,7 +263,8 @@ class DatasetWrapperMeta(DatasetWrapper):
 
         """
 
-        features, demand = self.dataloader[idx] 
+        with PROFILER.timer("dataset/dataloader"):
+            features, demand = self.dataloader[idx] 
 
         features = np.expand_dims(features, axis=0) # add batch dimension as meta environments also return a batch dimension (needed for obsprocessor)
 
@@ -271,10 +276,11 @@ class DatasetWrapperMeta(DatasetWrapper):
         obs = params.copy()
         obs["features"] = features
 
-        for obsprocessor in self.obsprocessors:
-            obs = obsprocessor(obs)
+        with PROFILER.timer("dataset/obsprocessors"):
+            for obsprocessor in self.obsprocessors:
+                obs = obsprocessor(obs)
 
-        obs = np.squeeze(obs, axis=0) # remove batch dimension after observation has been processed as the pytorch dataloader adds the batch dimension
+        obs = np.squeeze(obs, axis=0).copy() # remove batch dimension after observation has been processed as the pytorch dataloader adds the batch dimension (copy as obsprocessors may reuse their output array)
 
         return obs, demand, params
 
@@ -343,3 +349,86 @@ def set_param(obj,
             raise AttributeError(f"Parameter {name} does not exist")
         else:
             setattr(obj, name, param)
+
+# %% ../nbs/00_utils/00_utils.ipynb 31
+class BlockSampler():
+    """
+    Draw random samples for many periods at once and return them one period at a time, such that the
+    random number generator is called once per block instead of once per step. The draw function is called
+    with the number of periods and must return an array with the periods in the first dimension. On reset,
+    remaining samples are discarded and the size of the next block can be set (e.g., to the episode length).
+    """
+
+    def __init__(self,
+            draw_function: callable, # function that takes the number of periods and returns the samples
+            block_size: int = 256, # default number of periods drawn at once
+            ):
+
+        if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+
+        self.draw_function = draw_function
+        self.block_size = int(block_size)
+
+        self.reset()
+
+    def reset(self,
+            block_size: int | None = None, # number of periods of the next block, default block size if None
+            ) -> None:
+        """ Discard the remaining samples of the current block """
+
+        self.block = None
+        self.position = 0
+        self.next_block_size = self.block_size if block_size is None else max(int(block_size), 1)
+
+    def __call__(self) -> np.ndarray:
+        """ Return the samples of the next period, drawing a new block if the current one is used up """
+
+        if self.block is None or self.position >= len(self.block):
+            self.block = self.draw_function(self.next_block_size)
+            self.position = 0
+            self.next_block_size = self.block_size
+
+        sample = self.block[self.position]
+        self.position += 1
+
+        return sample
+
+    def get_state(self) -> dict:
+        """ Return the current block and position, blocks are never modified in place and not copied """
+
+        return {"block": self.block, "position": self.position, "next_block_size": self.next_block_size}
+
+    def set_state(self,
+            state: dict, # state returned by get_state
+            ) -> None:
+        """ Restore the block and position returned by get_state """
+
+        self.block = state["block"]
+        self.position = state["position"]
+        self.next_block_size = state["next_block_size"]
+
+# %% ../nbs/00_utils/00_utils.ipynb 34
+def get_rng_state(rng: np.random.Generator | ModuleType # random number generator or the global numpy random state (np.random)
+                ) -> dict | None:
+
+    """
+    Return the state of a random number generator, see set_rng_state. The global numpy random state is shared
+    with all other code and is not captured (None).
+    """
+
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.state
+
+    return None
+
+def set_rng_state(rng: np.random.Generator | ModuleType, # random number generator or the global numpy random state (np.random)
+                state: dict | None # state returned by get_rng_state
+                ) -> None:
+
+    """ Restore the state of a random number generator such that it produces the same numbers again """
+
+    if state is None or not isinstance(rng, np.random.Generator):
+        raise ValueError("Only the state of a np.random.Generator can be restored, the global numpy random state is not captured.")
+
+    rng.bit_generator.state = state